@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/dacestub_silu.dir/tools/dacestub.cpp.o"
+  "CMakeFiles/dacestub_silu.dir/tools/dacestub.cpp.o.d"
+  "libdacestub_silu.pdb"
+  "libdacestub_silu.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/dacestub_silu.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
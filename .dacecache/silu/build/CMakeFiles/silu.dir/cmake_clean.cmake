@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/silu.dir/root/package/.dacecache/silu/src/cpu/silu.cpp.o"
+  "CMakeFiles/silu.dir/root/package/.dacecache/silu/src/cpu/silu.cpp.o.d"
+  "libsilu.pdb"
+  "libsilu.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/silu.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1 @@
+#define __HASH_silu "5c978d7565a020b50323fa64707f03fced1d1c1300f56994d85e4fb25a691f05"
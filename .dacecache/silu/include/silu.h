@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * siluHandle_t;
+extern "C" siluHandle_t __dace_init_silu();
+extern "C" void __dace_exit_silu(siluHandle_t handle);
+extern "C" void __program_silu(siluHandle_t handle, float * __restrict__ __return, float * __restrict__ x);
@@ -0,0 +1,19 @@
+#include <cstdlib>
+#include "../include/silu.h"
+
+int main(int argc, char **argv) {
+    siluHandle_t handle;
+    float * __restrict__ __return = (float*) calloc(9, sizeof(float));
+    float * __restrict__ x = (float*) calloc(9, sizeof(float));
+
+
+    handle = __dace_init_silu();
+    __program_silu(handle, __return, x);
+    __dace_exit_silu(handle);
+
+    free(__return);
+    free(x);
+
+
+    return 0;
+}
@@ -0,0 +1,59 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct silu_t {
+
+};
+
+void __program_silu_internal(silu_t *__state, float * __restrict__ __return, float * __restrict__ x)
+{
+
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < 3; __i0 += 1) {
+                for (auto __i1 = 0; __i1 < 3; __i1 += 1) {
+                    {
+                        float __inp = x[((3 * __i0) + __i1)];
+                        float __out;
+
+                        ///////////////////
+                        // Tasklet code (_elementwise__fused__Mult_)
+                        __out = (__inp * (float(1) / (float(1) + exp((- __inp)))));
+                        ///////////////////
+
+                        __return[((3 * __i0) + __i1)] = __out;
+                    }
+                }
+            }
+        }
+
+    }
+}
+
+DACE_EXPORTED void __program_silu(silu_t *__state, float * __restrict__ __return, float * __restrict__ x)
+{
+    __program_silu_internal(__state, __return, x);
+}
+
+DACE_EXPORTED silu_t *__dace_init_silu()
+{
+    int __result = 0;
+    silu_t *__state = new silu_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED void __dace_exit_silu(silu_t *__state)
+{
+    delete __state;
+}
+
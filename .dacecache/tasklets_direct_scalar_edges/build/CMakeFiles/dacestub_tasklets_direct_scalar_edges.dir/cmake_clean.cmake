@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/dacestub_tasklets_direct_scalar_edges.dir/tools/dacestub.cpp.o"
+  "CMakeFiles/dacestub_tasklets_direct_scalar_edges.dir/tools/dacestub.cpp.o.d"
+  "libdacestub_tasklets_direct_scalar_edges.pdb"
+  "libdacestub_tasklets_direct_scalar_edges.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/dacestub_tasklets_direct_scalar_edges.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
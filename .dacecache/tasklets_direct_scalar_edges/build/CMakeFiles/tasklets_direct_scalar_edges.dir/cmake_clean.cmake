@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/tasklets_direct_scalar_edges.dir/root/package/.dacecache/tasklets_direct_scalar_edges/src/cpu/tasklets_direct_scalar_edges.cpp.o"
+  "CMakeFiles/tasklets_direct_scalar_edges.dir/root/package/.dacecache/tasklets_direct_scalar_edges/src/cpu/tasklets_direct_scalar_edges.cpp.o.d"
+  "libtasklets_direct_scalar_edges.pdb"
+  "libtasklets_direct_scalar_edges.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/tasklets_direct_scalar_edges.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1 @@
+cmake  "/root/py38/lib/python3.8/site-packages/dace/codegen" -DDACE_SRC_DIR="/root/package/.dacecache/tasklets_direct_scalar_edges/src" -DDACE_FILES="cpu/tasklets_direct_scalar_edges.cpp" -DDACE_PROGRAM_NAME=tasklets_direct_scalar_edges -DDACE_ENV_CMAKE_FILES="" -DDACE_ENV_COMPILE_FLAGS="" -DDACE_ENV_INCLUDES="" -DDACE_ENV_LIBRARIES="" -DDACE_ENV_MINIMUM_VERSION=0 -DDACE_ENV_PACKAGES="" -DDACE_ENV_VAR_KEYS="" -DDACE_ENV_VAR_VALUES="" -DCMAKE_CXX_FLAGS="-std=c++14 -fPIC -Wall -Wextra -O3 -march=native -ffast-math -Wno-unused-parameter -Wno-unused-label" -DDACE_LIBS="" -DCMAKE_SHARED_LINKER_FLAGS="-Wl,--disable-new-dtags"
\ No newline at end of file
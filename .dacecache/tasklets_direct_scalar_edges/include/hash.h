@@ -0,0 +1 @@
+#define __HASH_tasklets_direct_scalar_edges "9c184a1953ffa2d09ed1df7728e942594c114a30fbcf79fe9b0cbfe7126d79d1"
@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * tasklets_direct_scalar_edgesHandle_t;
+extern "C" tasklets_direct_scalar_edgesHandle_t __dace_init_tasklets_direct_scalar_edges();
+extern "C" void __dace_exit_tasklets_direct_scalar_edges(tasklets_direct_scalar_edgesHandle_t handle);
+extern "C" void __program_tasklets_direct_scalar_edges(tasklets_direct_scalar_edgesHandle_t handle, float * __restrict__ A, float * __restrict__ C, float * __restrict__ gradient_A, float * __restrict__ gradient_C);
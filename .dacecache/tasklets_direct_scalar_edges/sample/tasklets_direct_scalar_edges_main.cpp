@@ -0,0 +1,23 @@
+#include <cstdlib>
+#include "../include/tasklets_direct_scalar_edges.h"
+
+int main(int argc, char **argv) {
+    tasklets_direct_scalar_edgesHandle_t handle;
+    float * __restrict__ A = (float*) calloc(1, sizeof(float));
+    float * __restrict__ C = (float*) calloc(1, sizeof(float));
+    float * __restrict__ gradient_A = (float*) calloc(1, sizeof(float));
+    float * __restrict__ gradient_C = (float*) calloc(1, sizeof(float));
+
+
+    handle = __dace_init_tasklets_direct_scalar_edges();
+    __program_tasklets_direct_scalar_edges(handle, A, C, gradient_A, gradient_C);
+    __dace_exit_tasklets_direct_scalar_edges(handle);
+
+    free(A);
+    free(C);
+    free(gradient_A);
+    free(gradient_C);
+
+
+    return 0;
+}
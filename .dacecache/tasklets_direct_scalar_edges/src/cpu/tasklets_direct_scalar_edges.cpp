@@ -0,0 +1,154 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct tasklets_direct_scalar_edges_t {
+
+};
+
+void __program_tasklets_direct_scalar_edges_internal(tasklets_direct_scalar_edges_t *__state, float * __restrict__ A, float * __restrict__ C, float * __restrict__ gradient_A, float * __restrict__ gradient_C)
+{
+
+    {
+
+        float tmp_a;
+        {
+            float inp = A[0];
+            float out;
+
+            ///////////////////
+            // Tasklet code (task1)
+            out = sqrt(inp);
+            ///////////////////
+
+            tmp_a = out;
+        }
+        float tmp_b;
+        {
+            const float inp = tmp_a;
+            float out;
+
+            ///////////////////
+            // Tasklet code (task2)
+            out = log((inp + 1));
+            ///////////////////
+
+            tmp_b = out;
+        }
+        {
+            const float inp = tmp_b;
+            float out;
+
+            ///////////////////
+            // Tasklet code (task3)
+            out = sin(inp);
+            ///////////////////
+
+            C[0] = out;
+        }
+
+    }
+    {
+
+        float tmp_a_0;
+        {
+            float inp = A[0];
+            float out;
+
+            ///////////////////
+            // Tasklet code (task1)
+            out = sqrt(inp);
+            ///////////////////
+
+            tmp_a_0 = out;
+        }
+        float tmp_b_0;
+        {
+            const float inp = tmp_a_0;
+            float out;
+
+            ///////////////////
+            // Tasklet code (task2)
+            out = log((inp + 1));
+            ///////////////////
+
+            tmp_b_0 = out;
+        }
+        float gradient_tmp_b;
+        {
+            float out_gradient = gradient_C[0];
+            const float inp = tmp_b_0;
+            float inp_gradient;
+
+            ///////////////////
+            // Tasklet code (_task3_reverse_)
+            inp_gradient = (out_gradient * cos(inp));
+            ///////////////////
+
+            gradient_tmp_b = inp_gradient;
+        }
+        float tmp_a_1;
+        {
+            float inp = A[0];
+            float out;
+
+            ///////////////////
+            // Tasklet code (task1)
+            out = sqrt(inp);
+            ///////////////////
+
+            tmp_a_1 = out;
+        }
+        float gradient_tmp_a;
+        {
+            const float out_gradient = gradient_tmp_b;
+            const float inp = tmp_a_1;
+            float inp_gradient;
+
+            ///////////////////
+            // Tasklet code (_task2_reverse_)
+            inp_gradient = (out_gradient * (dace::float32(1) / (inp + dace::float32(1))));
+            ///////////////////
+
+            gradient_tmp_a = inp_gradient;
+        }
+        {
+            const float out_gradient = gradient_tmp_a;
+            float inp = A[0];
+            float inp_gradient;
+
+            ///////////////////
+            // Tasklet code (_task1_reverse_)
+            inp_gradient = (out_gradient * (dace::float32(1) / (dace::float32(2) * sqrt(inp))));
+            ///////////////////
+
+            gradient_A[0] = inp_gradient;
+        }
+
+    }
+}
+
+DACE_EXPORTED void __program_tasklets_direct_scalar_edges(tasklets_direct_scalar_edges_t *__state, float * __restrict__ A, float * __restrict__ C, float * __restrict__ gradient_A, float * __restrict__ gradient_C)
+{
+    __program_tasklets_direct_scalar_edges_internal(__state, A, C, gradient_A, gradient_C);
+}
+
+DACE_EXPORTED tasklets_direct_scalar_edges_t *__dace_init_tasklets_direct_scalar_edges()
+{
+    int __result = 0;
+    tasklets_direct_scalar_edges_t *__state = new tasklets_direct_scalar_edges_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED void __dace_exit_tasklets_direct_scalar_edges(tasklets_direct_scalar_edges_t *__state)
+{
+    delete __state;
+}
+
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/dacestub_test_bert_encoder_use_cpu_pure.dir/tools/dacestub.cpp.o"
+  "CMakeFiles/dacestub_test_bert_encoder_use_cpu_pure.dir/tools/dacestub.cpp.o.d"
+  "libdacestub_test_bert_encoder_use_cpu_pure.pdb"
+  "libdacestub_test_bert_encoder_use_cpu_pure.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/dacestub_test_bert_encoder_use_cpu_pure.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/test_bert_encoder_use_cpu_pure.dir/root/package/.dacecache/test_bert_encoder_use_cpu_pure/src/cpu/test_bert_encoder_use_cpu_pure.cpp.o"
+  "CMakeFiles/test_bert_encoder_use_cpu_pure.dir/root/package/.dacecache/test_bert_encoder_use_cpu_pure/src/cpu/test_bert_encoder_use_cpu_pure.cpp.o.d"
+  "libtest_bert_encoder_use_cpu_pure.pdb"
+  "libtest_bert_encoder_use_cpu_pure.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/test_bert_encoder_use_cpu_pure.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1 @@
+#define __HASH_test_bert_encoder_use_cpu_pure "a73dc8fc1414d62e5a615840165cd5a59d6fa2a1b427e65ba76ad12623a6a9ac"
@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * test_bert_encoder_use_cpu_pureHandle_t;
+extern "C" test_bert_encoder_use_cpu_pureHandle_t __dace_init_test_bert_encoder_use_cpu_pure();
+extern "C" void __dace_exit_test_bert_encoder_use_cpu_pure(test_bert_encoder_use_cpu_pureHandle_t handle);
+extern "C" void __program_test_bert_encoder_use_cpu_pure(test_bert_encoder_use_cpu_pureHandle_t handle, long long * __restrict__ ONNX_35, long long * __restrict__ ONNX_87, float * __restrict__ __return, float * __restrict__ attentionDOToutputDOTLayerNormDOTbias, float * __restrict__ attentionDOToutputDOTLayerNormDOTweight, float * __restrict__ attentionDOToutputDOTdenseDOTbias, float * __restrict__ attentionDOToutputDOTdenseDOTweight, float * __restrict__ attentionDOTselfDOTkeyDOTbias, float * __restrict__ attentionDOTselfDOTkeyDOTweight, float * __restrict__ attentionDOTselfDOTqueryDOTbias, float * __restrict__ attentionDOTselfDOTqueryDOTweight, float * __restrict__ attentionDOTselfDOTvalueDOTbias, float * __restrict__ attentionDOTselfDOTvalueDOTweight, float * __restrict__ inputDOT1, float * __restrict__ intermediateDOTdenseDOTbias, float * __restrict__ intermediateDOTdenseDOTweight, float * __restrict__ outputDOTLayerNormDOTbias, float * __restrict__ outputDOTLayerNormDOTweight, float * __restrict__ outputDOTdenseDOTbias, float * __restrict__ outputDOTdenseDOTweight, float ONNX_107, float ONNX_110, float ONNX_113, float ONNX_72, float ONNX_95, float ONNX_98);
@@ -0,0 +1,61 @@
+#include <cstdlib>
+#include "../include/test_bert_encoder_use_cpu_pure.h"
+
+int main(int argc, char **argv) {
+    test_bert_encoder_use_cpu_pureHandle_t handle;
+    float ONNX_107 = 42;
+    float ONNX_110 = 42;
+    float ONNX_113 = 42;
+    float ONNX_72 = 42;
+    float ONNX_95 = 42;
+    float ONNX_98 = 42;
+    long long * __restrict__ ONNX_35 = (long long*) calloc(4, sizeof(long long));
+    long long * __restrict__ ONNX_87 = (long long*) calloc(3, sizeof(long long));
+    float * __restrict__ __return = (float*) calloc(3145728, sizeof(float));
+    float * __restrict__ attentionDOToutputDOTLayerNormDOTbias = (float*) calloc(768, sizeof(float));
+    float * __restrict__ attentionDOToutputDOTLayerNormDOTweight = (float*) calloc(768, sizeof(float));
+    float * __restrict__ attentionDOToutputDOTdenseDOTbias = (float*) calloc(768, sizeof(float));
+    float * __restrict__ attentionDOToutputDOTdenseDOTweight = (float*) calloc(589824, sizeof(float));
+    float * __restrict__ attentionDOTselfDOTkeyDOTbias = (float*) calloc(768, sizeof(float));
+    float * __restrict__ attentionDOTselfDOTkeyDOTweight = (float*) calloc(589824, sizeof(float));
+    float * __restrict__ attentionDOTselfDOTqueryDOTbias = (float*) calloc(768, sizeof(float));
+    float * __restrict__ attentionDOTselfDOTqueryDOTweight = (float*) calloc(589824, sizeof(float));
+    float * __restrict__ attentionDOTselfDOTvalueDOTbias = (float*) calloc(768, sizeof(float));
+    float * __restrict__ attentionDOTselfDOTvalueDOTweight = (float*) calloc(589824, sizeof(float));
+    float * __restrict__ inputDOT1 = (float*) calloc(3145728, sizeof(float));
+    float * __restrict__ intermediateDOTdenseDOTbias = (float*) calloc(3072, sizeof(float));
+    float * __restrict__ intermediateDOTdenseDOTweight = (float*) calloc(2359296, sizeof(float));
+    float * __restrict__ outputDOTLayerNormDOTbias = (float*) calloc(768, sizeof(float));
+    float * __restrict__ outputDOTLayerNormDOTweight = (float*) calloc(768, sizeof(float));
+    float * __restrict__ outputDOTdenseDOTbias = (float*) calloc(768, sizeof(float));
+    float * __restrict__ outputDOTdenseDOTweight = (float*) calloc(2359296, sizeof(float));
+
+
+    handle = __dace_init_test_bert_encoder_use_cpu_pure();
+    __program_test_bert_encoder_use_cpu_pure(handle, ONNX_35, ONNX_87, __return, attentionDOToutputDOTLayerNormDOTbias, attentionDOToutputDOTLayerNormDOTweight, attentionDOToutputDOTdenseDOTbias, attentionDOToutputDOTdenseDOTweight, attentionDOTselfDOTkeyDOTbias, attentionDOTselfDOTkeyDOTweight, attentionDOTselfDOTqueryDOTbias, attentionDOTselfDOTqueryDOTweight, attentionDOTselfDOTvalueDOTbias, attentionDOTselfDOTvalueDOTweight, inputDOT1, intermediateDOTdenseDOTbias, intermediateDOTdenseDOTweight, outputDOTLayerNormDOTbias, outputDOTLayerNormDOTweight, outputDOTdenseDOTbias, outputDOTdenseDOTweight, ONNX_107, ONNX_110, ONNX_113, ONNX_72, ONNX_95, ONNX_98);
+    __dace_exit_test_bert_encoder_use_cpu_pure(handle);
+
+    free(ONNX_35);
+    free(ONNX_87);
+    free(__return);
+    free(attentionDOToutputDOTLayerNormDOTbias);
+    free(attentionDOToutputDOTLayerNormDOTweight);
+    free(attentionDOToutputDOTdenseDOTbias);
+    free(attentionDOToutputDOTdenseDOTweight);
+    free(attentionDOTselfDOTkeyDOTbias);
+    free(attentionDOTselfDOTkeyDOTweight);
+    free(attentionDOTselfDOTqueryDOTbias);
+    free(attentionDOTselfDOTqueryDOTweight);
+    free(attentionDOTselfDOTvalueDOTbias);
+    free(attentionDOTselfDOTvalueDOTweight);
+    free(inputDOT1);
+    free(intermediateDOTdenseDOTbias);
+    free(intermediateDOTdenseDOTweight);
+    free(outputDOTLayerNormDOTbias);
+    free(outputDOTLayerNormDOTweight);
+    free(outputDOTdenseDOTbias);
+    free(outputDOTdenseDOTweight);
+
+
+    return 0;
+}
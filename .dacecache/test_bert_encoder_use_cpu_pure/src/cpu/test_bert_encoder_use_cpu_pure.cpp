@@ -0,0 +1,1567 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct test_bert_encoder_use_cpu_pure_t {
+
+};
+
+inline void einsum_gemmgemm_sdfg_1_0_0_246(test_bert_encoder_use_cpu_pure_t *__state, float* _a, float* _b, float* _c) {
+
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto _o0 = 0; _o0 < 4096; _o0 += 1) {
+                for (auto _o1 = 0; _o1 < 768; _o1 += 1) {
+                    {
+                        float out;
+
+                        ///////////////////
+                        // Tasklet code (gemm_init)
+                        out = 0;
+                        ///////////////////
+
+                        _c[((768 * _o0) + _o1)] = out;
+                    }
+                }
+            }
+        }
+
+    }
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < 4096; __i0 += 1) {
+                for (auto __i1 = 0; __i1 < 768; __i1 += 1) {
+                    for (auto __i2 = 0; __i2 < 768; __i2 += 1) {
+                        {
+                            float __a = _a[((768 * __i0) + __i2)];
+                            float __b = _b[(__i1 + (768 * __i2))];
+                            float __out;
+
+                            ///////////////////
+                            // Tasklet code (gemm)
+                            __out = (__a * __b);
+                            ///////////////////
+
+                            dace::wcr_fixed<dace::ReductionType::Sum, float>::reduce_atomic(_c + ((768 * __i0) + __i1), __out);
+                        }
+                    }
+                }
+            }
+        }
+
+    }
+    
+}
+
+inline void einsum_gemmbmm_sdfg_1_0_0_249(test_bert_encoder_use_cpu_pure_t *__state, float* _a, float* _b, float* _c) {
+
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto _o0 = 0; _o0 < 96; _o0 += 1) {
+                for (auto _o1 = 0; _o1 < 512; _o1 += 1) {
+                    for (auto _o2 = 0; _o2 < 512; _o2 += 1) {
+                        {
+                            float out;
+
+                            ///////////////////
+                            // Tasklet code (batched_matmul_init)
+                            out = 0;
+                            ///////////////////
+
+                            _c[(((262144 * _o0) + (512 * _o1)) + _o2)] = out;
+                        }
+                    }
+                }
+            }
+        }
+
+    }
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < 96; __i0 += 1) {
+                for (auto __i1 = 0; __i1 < 512; __i1 += 1) {
+                    for (auto __i2 = 0; __i2 < 512; __i2 += 1) {
+                        for (auto __i3 = 0; __i3 < 64; __i3 += 1) {
+                            {
+                                float __a = _a[(((32768 * __i0) + (64 * __i1)) + __i3)];
+                                float __b = _b[(((32768 * __i0) + __i2) + (512 * __i3))];
+                                float __c;
+
+                                ///////////////////
+                                // Tasklet code (_BatchedBatchedMatMult_)
+                                __c = (__a * __b);
+                                ///////////////////
+
+                                dace::wcr_fixed<dace::ReductionType::Sum, float>::reduce_atomic(_c + (((262144 * __i0) + (512 * __i1)) + __i2), __c);
+                            }
+                        }
+                    }
+                }
+            }
+        }
+
+    }
+    
+}
+
+inline void einsum_gemmbmm_sdfg_0_0_250(test_bert_encoder_use_cpu_pure_t *__state, float* _a, float* _b, float* _c) {
+
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto _o0 = 0; _o0 < 96; _o0 += 1) {
+                for (auto _o1 = 0; _o1 < 512; _o1 += 1) {
+                    for (auto _o2 = 0; _o2 < 64; _o2 += 1) {
+                        {
+                            float out;
+
+                            ///////////////////
+                            // Tasklet code (batched_matmul_init)
+                            out = 0;
+                            ///////////////////
+
+                            _c[(((32768 * _o0) + (64 * _o1)) + _o2)] = out;
+                        }
+                    }
+                }
+            }
+        }
+
+    }
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < 96; __i0 += 1) {
+                for (auto __i1 = 0; __i1 < 512; __i1 += 1) {
+                    for (auto __i2 = 0; __i2 < 64; __i2 += 1) {
+                        for (auto __i3 = 0; __i3 < 512; __i3 += 1) {
+                            {
+                                float __a = _a[(((262144 * __i0) + (512 * __i1)) + __i3)];
+                                float __b = _b[(((32768 * __i0) + __i2) + (64 * __i3))];
+                                float __c;
+
+                                ///////////////////
+                                // Tasklet code (_BatchedBatchedMatMult_)
+                                __c = (__a * __b);
+                                ///////////////////
+
+                                dace::wcr_fixed<dace::ReductionType::Sum, float>::reduce_atomic(_c + (((32768 * __i0) + (64 * __i1)) + __i2), __c);
+                            }
+                        }
+                    }
+                }
+            }
+        }
+
+    }
+    
+}
+
+inline void einsum_gemmgemm_sdfg_5_0_0_252(test_bert_encoder_use_cpu_pure_t *__state, float* _a, float* _b, float* _c) {
+
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto _o0 = 0; _o0 < 4096; _o0 += 1) {
+                for (auto _o1 = 0; _o1 < 3072; _o1 += 1) {
+                    {
+                        float out;
+
+                        ///////////////////
+                        // Tasklet code (gemm_init)
+                        out = 0;
+                        ///////////////////
+
+                        _c[((3072 * _o0) + _o1)] = out;
+                    }
+                }
+            }
+        }
+
+    }
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < 4096; __i0 += 1) {
+                for (auto __i1 = 0; __i1 < 3072; __i1 += 1) {
+                    for (auto __i2 = 0; __i2 < 768; __i2 += 1) {
+                        {
+                            float __a = _a[((768 * __i0) + __i2)];
+                            float __b = _b[(__i1 + (3072 * __i2))];
+                            float __out;
+
+                            ///////////////////
+                            // Tasklet code (gemm)
+                            __out = (__a * __b);
+                            ///////////////////
+
+                            dace::wcr_fixed<dace::ReductionType::Sum, float>::reduce_atomic(_c + ((3072 * __i0) + __i1), __out);
+                        }
+                    }
+                }
+            }
+        }
+
+    }
+    
+}
+
+inline void einsum_gemmgemm_sdfg_0_0_253(test_bert_encoder_use_cpu_pure_t *__state, float* _a, float* _b, float* _c) {
+
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto _o0 = 0; _o0 < 4096; _o0 += 1) {
+                for (auto _o1 = 0; _o1 < 768; _o1 += 1) {
+                    {
+                        float out;
+
+                        ///////////////////
+                        // Tasklet code (gemm_init)
+                        out = 0;
+                        ///////////////////
+
+                        _c[((768 * _o0) + _o1)] = out;
+                    }
+                }
+            }
+        }
+
+    }
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < 4096; __i0 += 1) {
+                for (auto __i1 = 0; __i1 < 768; __i1 += 1) {
+                    for (auto __i2 = 0; __i2 < 3072; __i2 += 1) {
+                        {
+                            float __a = _a[((3072 * __i0) + __i2)];
+                            float __b = _b[(__i1 + (768 * __i2))];
+                            float __out;
+
+                            ///////////////////
+                            // Tasklet code (gemm)
+                            __out = (__a * __b);
+                            ///////////////////
+
+                            dace::wcr_fixed<dace::ReductionType::Sum, float>::reduce_atomic(_c + ((768 * __i0) + __i1), __out);
+                        }
+                    }
+                }
+            }
+        }
+
+    }
+    
+}
+
+void __program_test_bert_encoder_use_cpu_pure_internal(test_bert_encoder_use_cpu_pure_t *__state, long long * __restrict__ ONNX_35, long long * __restrict__ ONNX_87, float * __restrict__ __return, float * __restrict__ attentionDOToutputDOTLayerNormDOTbias, float * __restrict__ attentionDOToutputDOTLayerNormDOTweight, float * __restrict__ attentionDOToutputDOTdenseDOTbias, float * __restrict__ attentionDOToutputDOTdenseDOTweight, float * __restrict__ attentionDOTselfDOTkeyDOTbias, float * __restrict__ attentionDOTselfDOTkeyDOTweight, float * __restrict__ attentionDOTselfDOTqueryDOTbias, float * __restrict__ attentionDOTselfDOTqueryDOTweight, float * __restrict__ attentionDOTselfDOTvalueDOTbias, float * __restrict__ attentionDOTselfDOTvalueDOTweight, float * __restrict__ inputDOT1, float * __restrict__ intermediateDOTdenseDOTbias, float * __restrict__ intermediateDOTdenseDOTweight, float * __restrict__ outputDOTLayerNormDOTbias, float * __restrict__ outputDOTLayerNormDOTweight, float * __restrict__ outputDOTdenseDOTbias, float * __restrict__ outputDOTdenseDOTweight, float ONNX_107, float ONNX_110, float ONNX_113, float ONNX_72, float ONNX_95, float ONNX_98)
+{
+
+    {
+        float *ONNX_17;
+        ONNX_17 = new float DACE_ALIGN(64)[589824];
+        float *ONNX_18;
+        ONNX_18 = new float DACE_ALIGN(64)[3145728];
+        float *ONNX_19;
+        ONNX_19 = new float DACE_ALIGN(64)[3145728];
+        float *ONNX_20;
+        ONNX_20 = new float DACE_ALIGN(64)[589824];
+        float *ONNX_21;
+        ONNX_21 = new float DACE_ALIGN(64)[3145728];
+        float *ONNX_22;
+        ONNX_22 = new float DACE_ALIGN(64)[3145728];
+        float *ONNX_37;
+        ONNX_37 = new float DACE_ALIGN(64)[589824];
+        float *ONNX_38;
+        ONNX_38 = new float DACE_ALIGN(64)[3145728];
+        float *ONNX_39;
+        ONNX_39 = new float DACE_ALIGN(64)[3145728];
+        float *ONNX_54;
+        ONNX_54 = new float DACE_ALIGN(64)[3145728];
+        float *ONNX_69;
+        ONNX_69 = new float DACE_ALIGN(64)[3145728];
+        float *ONNX_70;
+        ONNX_70 = new float DACE_ALIGN(64)[3145728];
+        float *ONNX_71;
+        ONNX_71 = new float DACE_ALIGN(64)[25165824];
+        float *ONNX_73;
+        ONNX_73 = new float DACE_ALIGN(64)[25165824];
+        float *ONNX_74;
+        ONNX_74 = new float DACE_ALIGN(64)[25165824];
+        float *ONNX_75;
+        ONNX_75 = new float DACE_ALIGN(64)[3145728];
+        float *ONNX_76;
+        ONNX_76 = new float DACE_ALIGN(64)[3145728];
+        float *ONNX_89;
+        ONNX_89 = new float DACE_ALIGN(64)[589824];
+        float *ONNX_90;
+        ONNX_90 = new float DACE_ALIGN(64)[3145728];
+        float *ONNX_91;
+        ONNX_91 = new float DACE_ALIGN(64)[3145728];
+        float *ONNX_92;
+        ONNX_92 = new float DACE_ALIGN(64)[3145728];
+        float *ONNX_93;
+        ONNX_93 = new float DACE_ALIGN(64)[4096];
+        float *ONNX_94;
+        ONNX_94 = new float DACE_ALIGN(64)[3145728];
+        float *ONNX_96;
+        ONNX_96 = new float DACE_ALIGN(64)[3145728];
+        float *ONNX_97;
+        ONNX_97 = new float DACE_ALIGN(64)[4096];
+        float *ONNX_99;
+        ONNX_99 = new float DACE_ALIGN(64)[4096];
+        float *ONNX_100;
+        ONNX_100 = new float DACE_ALIGN(64)[4096];
+        float *ONNX_101;
+        ONNX_101 = new float DACE_ALIGN(64)[3145728];
+        float *ONNX_102;
+        ONNX_102 = new float DACE_ALIGN(64)[3145728];
+        float *ONNX_103;
+        ONNX_103 = new float DACE_ALIGN(64)[3145728];
+        float *ONNX_104;
+        ONNX_104 = new float DACE_ALIGN(64)[2359296];
+        float *ONNX_105;
+        ONNX_105 = new float DACE_ALIGN(64)[12582912];
+        float *ONNX_106;
+        ONNX_106 = new float DACE_ALIGN(64)[12582912];
+        float *ONNX_108;
+        ONNX_108 = new float DACE_ALIGN(64)[12582912];
+        float *ONNX_109;
+        ONNX_109 = new float DACE_ALIGN(64)[12582912];
+        float *ONNX_111;
+        ONNX_111 = new float DACE_ALIGN(64)[12582912];
+        float *ONNX_112;
+        ONNX_112 = new float DACE_ALIGN(64)[12582912];
+        float *ONNX_114;
+        ONNX_114 = new float DACE_ALIGN(64)[12582912];
+        float *ONNX_115;
+        ONNX_115 = new float DACE_ALIGN(64)[2359296];
+        float *ONNX_116;
+        ONNX_116 = new float DACE_ALIGN(64)[3145728];
+        float *ONNX_117;
+        ONNX_117 = new float DACE_ALIGN(64)[3145728];
+        float *ONNX_118;
+        ONNX_118 = new float DACE_ALIGN(64)[3145728];
+        float *ONNX_119;
+        ONNX_119 = new float DACE_ALIGN(64)[4096];
+        float *ONNX_120;
+        ONNX_120 = new float DACE_ALIGN(64)[3145728];
+        float *ONNX_122;
+        ONNX_122 = new float DACE_ALIGN(64)[3145728];
+        float *ONNX_123;
+        ONNX_123 = new float DACE_ALIGN(64)[4096];
+        float *ONNX_125;
+        ONNX_125 = new float DACE_ALIGN(64)[4096];
+        float *ONNX_126;
+        ONNX_126 = new float DACE_ALIGN(64)[4096];
+        float *ONNX_127;
+        ONNX_127 = new float DACE_ALIGN(64)[3145728];
+        float *ONNX_128;
+        ONNX_128 = new float DACE_ALIGN(64)[3145728];
+        float* data_0;
+        data_0 = &ONNX_22[0];
+        float* daceml_onnx_op_implementations_pure_implementations_Reshape_36_expansion_data_0;
+        daceml_onnx_op_implementations_pure_implementations_Reshape_36_expansion_data_0 = &ONNX_39[0];
+        float* daceml_onnx_op_implementations_pure_implementations_Reshape_51_expansion_data_0;
+        daceml_onnx_op_implementations_pure_implementations_Reshape_51_expansion_data_0 = &ONNX_19[0];
+        float *maximum;
+        maximum = new float DACE_ALIGN(64)[49152];
+        float* __tmp1;
+        __tmp1 = &maximum[0];
+        float *__tmp2;
+        __tmp2 = new float DACE_ALIGN(64)[25165824];
+        float *exponent;
+        exponent = new float DACE_ALIGN(64)[25165824];
+        float *sum;
+        sum = new float DACE_ALIGN(64)[49152];
+        float* __tmp5;
+        __tmp5 = &sum[0];
+        float *__tmp0;
+        __tmp0 = new float DACE_ALIGN(64)[4096];
+        float *daceml_onnx_op_implementations_pure_implementations_ReduceMean_80_expansion___tmp0;
+        daceml_onnx_op_implementations_pure_implementations_ReduceMean_80_expansion___tmp0 = new float DACE_ALIGN(64)[4096];
+        float *daceml_onnx_op_implementations_pure_implementations_ReduceMean_102_expansion___tmp0;
+        daceml_onnx_op_implementations_pure_implementations_ReduceMean_102_expansion___tmp0 = new float DACE_ALIGN(64)[4096];
+        float *daceml_onnx_op_implementations_pure_implementations_ReduceMean_106_expansion___tmp0;
+        daceml_onnx_op_implementations_pure_implementations_ReduceMean_106_expansion___tmp0 = new float DACE_ALIGN(64)[4096];
+        float* Z;
+        Z = &ONNX_18[0];
+        float* X;
+        X = &inputDOT1[0];
+        float* Z_0;
+        Z_0 = &ONNX_21[0];
+        float* X_0;
+        X_0 = &inputDOT1[0];
+        float* Z_1;
+        Z_1 = &ONNX_38[0];
+        float* X_1;
+        X_1 = &inputDOT1[0];
+        float* Z_2;
+        Z_2 = &ONNX_71[0];
+        float* Y;
+        Y = &ONNX_70[0];
+        float* X_2;
+        X_2 = &ONNX_69[0];
+        float* Z_3;
+        Z_3 = &ONNX_75[0];
+        float* Y_0;
+        Y_0 = &ONNX_54[0];
+        float* X_3;
+        X_3 = &ONNX_74[0];
+        float* Z_4;
+        Z_4 = &ONNX_90[0];
+        float* X_4;
+        X_4 = &ONNX_76[0];
+        float* Z_5;
+        Z_5 = &ONNX_105[0];
+        float* X_5;
+        X_5 = &ONNX_103[0];
+        float* Z_6;
+        Z_6 = &ONNX_116[0];
+        float* X_6;
+        X_6 = &ONNX_114[0];
+
+        {
+            #pragma omp parallel for
+            for (auto _i0 = 0; _i0 < 768; _i0 += 1) {
+                for (auto _i1 = 0; _i1 < 768; _i1 += 1) {
+                    {
+                        float _in = attentionDOTselfDOTqueryDOTweight[((768 * _i0) + _i1)];
+                        float _out;
+
+                        ///////////////////
+                        // Tasklet code (_transpose_)
+                        _out = _in;
+                        ///////////////////
+
+                        ONNX_17[(_i0 + (768 * _i1))] = _out;
+                    }
+                }
+            }
+        }
+        einsum_gemmgemm_sdfg_1_0_0_246(__state, &X[0], &ONNX_17[0], &Z[0]);
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < 8; __i0 += 1) {
+                for (auto __i1 = 0; __i1 < 512; __i1 += 1) {
+                    for (auto __i2 = 0; __i2 < 768; __i2 += 1) {
+                        {
+                            float __in1 = ONNX_18[(((393216 * __i0) + (768 * __i1)) + __i2)];
+                            float __in2 = attentionDOTselfDOTqueryDOTbias[__i2];
+                            float __out;
+
+                            ///////////////////
+                            // Tasklet code (_Add_)
+                            __out = (__in1 + __in2);
+                            ///////////////////
+
+                            ONNX_19[(((393216 * __i0) + (768 * __i1)) + __i2)] = __out;
+                        }
+                    }
+                }
+            }
+        }
+        {
+            #pragma omp parallel for
+            for (auto _i0 = 0; _i0 < 8; _i0 += 1) {
+                for (auto _i1 = 0; _i1 < 512; _i1 += 1) {
+                    for (auto _i2 = 0; _i2 < 12; _i2 += 1) {
+                        for (auto _i3 = 0; _i3 < 64; _i3 += 1) {
+                            {
+                                float _in = daceml_onnx_op_implementations_pure_implementations_Reshape_51_expansion_data_0[((((393216 * _i0) + (768 * _i1)) + (64 * _i2)) + _i3)];
+                                float _out;
+
+                                ///////////////////
+                                // Tasklet code (_transpose_)
+                                _out = _in;
+                                ///////////////////
+
+                                ONNX_69[((((393216 * _i0) + (64 * _i1)) + (32768 * _i2)) + _i3)] = _out;
+                            }
+                        }
+                    }
+                }
+            }
+        }
+        {
+            #pragma omp parallel for
+            for (auto _i0 = 0; _i0 < 768; _i0 += 1) {
+                for (auto _i1 = 0; _i1 < 768; _i1 += 1) {
+                    {
+                        float _in = attentionDOTselfDOTkeyDOTweight[((768 * _i0) + _i1)];
+                        float _out;
+
+                        ///////////////////
+                        // Tasklet code (_transpose_)
+                        _out = _in;
+                        ///////////////////
+
+                        ONNX_20[(_i0 + (768 * _i1))] = _out;
+                    }
+                }
+            }
+        }
+        einsum_gemmgemm_sdfg_1_0_0_246(__state, &X_0[0], &ONNX_20[0], &Z_0[0]);
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < 8; __i0 += 1) {
+                for (auto __i1 = 0; __i1 < 512; __i1 += 1) {
+                    for (auto __i2 = 0; __i2 < 768; __i2 += 1) {
+                        {
+                            float __in1 = ONNX_21[(((393216 * __i0) + (768 * __i1)) + __i2)];
+                            float __in2 = attentionDOTselfDOTkeyDOTbias[__i2];
+                            float __out;
+
+                            ///////////////////
+                            // Tasklet code (_Add_)
+                            __out = (__in1 + __in2);
+                            ///////////////////
+
+                            ONNX_22[(((393216 * __i0) + (768 * __i1)) + __i2)] = __out;
+                        }
+                    }
+                }
+            }
+        }
+        {
+            #pragma omp parallel for
+            for (auto _i0 = 0; _i0 < 8; _i0 += 1) {
+                for (auto _i1 = 0; _i1 < 512; _i1 += 1) {
+                    for (auto _i2 = 0; _i2 < 12; _i2 += 1) {
+                        for (auto _i3 = 0; _i3 < 64; _i3 += 1) {
+                            {
+                                float _in = data_0[((((393216 * _i0) + (768 * _i1)) + (64 * _i2)) + _i3)];
+                                float _out;
+
+                                ///////////////////
+                                // Tasklet code (_transpose_)
+                                _out = _in;
+                                ///////////////////
+
+                                ONNX_70[((((393216 * _i0) + _i1) + (32768 * _i2)) + (512 * _i3))] = _out;
+                            }
+                        }
+                    }
+                }
+            }
+        }
+        einsum_gemmbmm_sdfg_1_0_0_249(__state, &X_2[0], &Y[0], &Z_2[0]);
+        {
+            #pragma omp parallel for
+            for (auto _i0 = 0; _i0 < 768; _i0 += 1) {
+                for (auto _i1 = 0; _i1 < 768; _i1 += 1) {
+                    {
+                        float _in = attentionDOTselfDOTvalueDOTweight[((768 * _i0) + _i1)];
+                        float _out;
+
+                        ///////////////////
+                        // Tasklet code (_transpose_)
+                        _out = _in;
+                        ///////////////////
+
+                        ONNX_37[(_i0 + (768 * _i1))] = _out;
+                    }
+                }
+            }
+        }
+        einsum_gemmgemm_sdfg_1_0_0_246(__state, &X_1[0], &ONNX_37[0], &Z_1[0]);
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < 8; __i0 += 1) {
+                for (auto __i1 = 0; __i1 < 512; __i1 += 1) {
+                    for (auto __i2 = 0; __i2 < 768; __i2 += 1) {
+                        {
+                            float __in1 = ONNX_38[(((393216 * __i0) + (768 * __i1)) + __i2)];
+                            float __in2 = attentionDOTselfDOTvalueDOTbias[__i2];
+                            float __out;
+
+                            ///////////////////
+                            // Tasklet code (_Add_)
+                            __out = (__in1 + __in2);
+                            ///////////////////
+
+                            ONNX_39[(((393216 * __i0) + (768 * __i1)) + __i2)] = __out;
+                        }
+                    }
+                }
+            }
+        }
+        {
+            #pragma omp parallel for
+            for (auto _i0 = 0; _i0 < 8; _i0 += 1) {
+                for (auto _i1 = 0; _i1 < 512; _i1 += 1) {
+                    for (auto _i2 = 0; _i2 < 12; _i2 += 1) {
+                        for (auto _i3 = 0; _i3 < 64; _i3 += 1) {
+                            {
+                                float _in = daceml_onnx_op_implementations_pure_implementations_Reshape_36_expansion_data_0[((((393216 * _i0) + (768 * _i1)) + (64 * _i2)) + _i3)];
+                                float _out;
+
+                                ///////////////////
+                                // Tasklet code (_transpose_)
+                                _out = _in;
+                                ///////////////////
+
+                                ONNX_54[((((393216 * _i0) + (64 * _i1)) + (32768 * _i2)) + _i3)] = _out;
+                            }
+                        }
+                    }
+                }
+            }
+        }
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < 8; __i0 += 1) {
+                for (auto __i1 = 0; __i1 < 12; __i1 += 1) {
+                    for (auto __i2 = 0; __i2 < 512; __i2 += 1) {
+                        for (auto __i3 = 0; __i3 < 512; __i3 += 1) {
+                            {
+                                float __in1 = ONNX_71[((((3145728 * __i0) + (262144 * __i1)) + (512 * __i2)) + __i3)];
+                                float __in2 = ONNX_72;
+                                float __out;
+
+                                ///////////////////
+                                // Tasklet code (_Div_)
+                                __out = (__in1 / __in2);
+                                ///////////////////
+
+                                ONNX_73[((((3145728 * __i0) + (262144 * __i1)) + (512 * __i2)) + __i3)] = __out;
+                            }
+                        }
+                    }
+                }
+            }
+        }
+        {
+            float* _in = &ONNX_73[0];
+            float* _out = __tmp1;
+
+            ///////////////////
+            #pragma omp parallel for collapse(3)
+            for (int _o0 = 0; _o0 < 8; ++_o0) {
+                for (int _o1 = 0; _o1 < 12; ++_o1) {
+                    for (int _o2 = 0; _o2 < 512; ++_o2) {
+                        _out[_o0 * 6144 + _o1 * 512 + _o2 * 1] = (- 3.4028234663852886e+38);
+                        #pragma omp parallel for collapse(1) reduction(max: _out[_o0 * 6144 + _o1 * 512 + _o2 * 1])
+                        for (int _i0 = 0; _i0 < 512; ++_i0) {
+                            _out[_o0 * 6144 + _o1 * 512 + _o2 * 1] = max(_out[_o0 * 6144 + _o1 * 512 + _o2 * 1], _in[_o0 * 3145728 + _o1 * 262144 + _o2 * 512 + _i0 * 1]);
+                        }
+                    }
+                }
+            }
+            ///////////////////
+
+        }
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < 8; __i0 += 1) {
+                for (auto __i1 = 0; __i1 < 12; __i1 += 1) {
+                    for (auto __i2 = 0; __i2 < 512; __i2 += 1) {
+                        for (auto __i3 = 0; __i3 < 512; __i3 += 1) {
+                            {
+                                float __in1 = ONNX_73[((((3145728 * __i0) + (262144 * __i1)) + (512 * __i2)) + __i3)];
+                                float __in2 = maximum[(((6144 * __i0) + (512 * __i1)) + __i2)];
+                                float __out;
+
+                                ///////////////////
+                                // Tasklet code (_Sub_)
+                                __out = (__in1 - __in2);
+                                ///////////////////
+
+                                __tmp2[((((3145728 * __i0) + (262144 * __i1)) + (512 * __i2)) + __i3)] = __out;
+                            }
+                        }
+                    }
+                }
+            }
+        }
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < 8; __i0 += 1) {
+                for (auto __i1 = 0; __i1 < 12; __i1 += 1) {
+                    for (auto __i2 = 0; __i2 < 512; __i2 += 1) {
+                        for (auto __i3 = 0; __i3 < 512; __i3 += 1) {
+                            {
+                                float __in1 = __tmp2[((((3145728 * __i0) + (262144 * __i1)) + (512 * __i2)) + __i3)];
+                                float __out;
+
+                                ///////////////////
+                                // Tasklet code (_numpy_exp_)
+                                __out = exp(__in1);
+                                ///////////////////
+
+                                exponent[((((3145728 * __i0) + (262144 * __i1)) + (512 * __i2)) + __i3)] = __out;
+                            }
+                        }
+                    }
+                }
+            }
+        }
+        {
+            float* _in = &exponent[0];
+            float* _out = __tmp5;
+
+            ///////////////////
+            #pragma omp parallel for collapse(3)
+            for (int _o0 = 0; _o0 < 8; ++_o0) {
+                for (int _o1 = 0; _o1 < 12; ++_o1) {
+                    for (int _o2 = 0; _o2 < 512; ++_o2) {
+                        _out[_o0 * 6144 + _o1 * 512 + _o2 * 1] = 0;
+                        #pragma omp parallel for collapse(1) reduction(+: _out[_o0 * 6144 + _o1 * 512 + _o2 * 1])
+                        for (int _i0 = 0; _i0 < 512; ++_i0) {
+                            _out[_o0 * 6144 + _o1 * 512 + _o2 * 1] += _in[_o0 * 3145728 + _o1 * 262144 + _o2 * 512 + _i0 * 1];
+                        }
+                    }
+                }
+            }
+            ///////////////////
+
+        }
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < 8; __i0 += 1) {
+                for (auto __i1 = 0; __i1 < 12; __i1 += 1) {
+                    for (auto __i2 = 0; __i2 < 512; __i2 += 1) {
+                        for (auto __i3 = 0; __i3 < 512; __i3 += 1) {
+                            {
+                                float __in1 = exponent[((((3145728 * __i0) + (262144 * __i1)) + (512 * __i2)) + __i3)];
+                                float __in2 = sum[(((6144 * __i0) + (512 * __i1)) + __i2)];
+                                float __out;
+
+                                ///////////////////
+                                // Tasklet code (_Div_)
+                                __out = (__in1 / __in2);
+                                ///////////////////
+
+                                ONNX_74[((((3145728 * __i0) + (262144 * __i1)) + (512 * __i2)) + __i3)] = __out;
+                            }
+                        }
+                    }
+                }
+            }
+        }
+        einsum_gemmbmm_sdfg_0_0_250(__state, &X_3[0], &Y_0[0], &Z_3[0]);
+        {
+            #pragma omp parallel for
+            for (auto _i0 = 0; _i0 < 8; _i0 += 1) {
+                for (auto _i1 = 0; _i1 < 12; _i1 += 1) {
+                    for (auto _i2 = 0; _i2 < 512; _i2 += 1) {
+                        for (auto _i3 = 0; _i3 < 64; _i3 += 1) {
+                            {
+                                float _in = ONNX_75[((((393216 * _i0) + (32768 * _i1)) + (64 * _i2)) + _i3)];
+                                float _out;
+
+                                ///////////////////
+                                // Tasklet code (_transpose_)
+                                _out = _in;
+                                ///////////////////
+
+                                ONNX_76[((((393216 * _i0) + (64 * _i1)) + (768 * _i2)) + _i3)] = _out;
+                            }
+                        }
+                    }
+                }
+            }
+        }
+        {
+            #pragma omp parallel for
+            for (auto _i0 = 0; _i0 < 768; _i0 += 1) {
+                for (auto _i1 = 0; _i1 < 768; _i1 += 1) {
+                    {
+                        float _in = attentionDOToutputDOTdenseDOTweight[((768 * _i0) + _i1)];
+                        float _out;
+
+                        ///////////////////
+                        // Tasklet code (_transpose_)
+                        _out = _in;
+                        ///////////////////
+
+                        ONNX_89[(_i0 + (768 * _i1))] = _out;
+                    }
+                }
+            }
+        }
+        einsum_gemmgemm_sdfg_1_0_0_246(__state, &X_4[0], &ONNX_89[0], &Z_4[0]);
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < 8; __i0 += 1) {
+                for (auto __i1 = 0; __i1 < 512; __i1 += 1) {
+                    for (auto __i2 = 0; __i2 < 768; __i2 += 1) {
+                        {
+                            float __in1 = ONNX_90[(((393216 * __i0) + (768 * __i1)) + __i2)];
+                            float __in2 = attentionDOToutputDOTdenseDOTbias[__i2];
+                            float __out;
+
+                            ///////////////////
+                            // Tasklet code (_Add_)
+                            __out = (__in1 + __in2);
+                            ///////////////////
+
+                            ONNX_91[(((393216 * __i0) + (768 * __i1)) + __i2)] = __out;
+                        }
+                    }
+                }
+            }
+        }
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < 8; __i0 += 1) {
+                for (auto __i1 = 0; __i1 < 512; __i1 += 1) {
+                    for (auto __i2 = 0; __i2 < 768; __i2 += 1) {
+                        {
+                            float __in1 = ONNX_91[(((393216 * __i0) + (768 * __i1)) + __i2)];
+                            float __in2 = inputDOT1[(((393216 * __i0) + (768 * __i1)) + __i2)];
+                            float __out;
+
+                            ///////////////////
+                            // Tasklet code (_Add_)
+                            __out = (__in1 + __in2);
+                            ///////////////////
+
+                            ONNX_92[(((393216 * __i0) + (768 * __i1)) + __i2)] = __out;
+                        }
+                    }
+                }
+            }
+        }
+        {
+            float* _in = &ONNX_92[0];
+            float* _out = __tmp0;
+
+            ///////////////////
+            #pragma omp parallel for collapse(2)
+            for (int _o0 = 0; _o0 < 8; ++_o0) {
+                for (int _o1 = 0; _o1 < 512; ++_o1) {
+                    _out[_o0 * 512 + _o1 * 1] = 0;
+                    #pragma omp parallel for collapse(1) reduction(+: _out[_o0 * 512 + _o1 * 1])
+                    for (int _i0 = 0; _i0 < 768; ++_i0) {
+                        _out[_o0 * 512 + _o1 * 1] += _in[_o0 * 393216 + _o1 * 768 + _i0 * 1];
+                    }
+                }
+            }
+            ///////////////////
+
+        }
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < 8; __i0 += 1) {
+                for (auto __i1 = 0; __i1 < 512; __i1 += 1) {
+                    {
+                        float __inp = __tmp0[((512 * __i0) + __i1)];
+                        float __out;
+
+                        ///////////////////
+                        // Tasklet code (_elementwise_)
+                        __out = (__inp / 768);
+                        ///////////////////
+
+                        ONNX_93[((512 * __i0) + __i1)] = __out;
+                    }
+                }
+            }
+        }
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < 8; __i0 += 1) {
+                for (auto __i1 = 0; __i1 < 512; __i1 += 1) {
+                    for (auto __i2 = 0; __i2 < 768; __i2 += 1) {
+                        {
+                            float __in1 = ONNX_92[(((393216 * __i0) + (768 * __i1)) + __i2)];
+                            float __in2 = ONNX_93[((512 * __i0) + __i1)];
+                            float __out;
+
+                            ///////////////////
+                            // Tasklet code (_Sub_)
+                            __out = (__in1 - __in2);
+                            ///////////////////
+
+                            ONNX_94[(((393216 * __i0) + (768 * __i1)) + __i2)] = __out;
+                        }
+                    }
+                }
+            }
+        }
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < 8; __i0 += 1) {
+                for (auto __i1 = 0; __i1 < 512; __i1 += 1) {
+                    for (auto __i2 = 0; __i2 < 768; __i2 += 1) {
+                        {
+                            float __in1 = ONNX_94[(((393216 * __i0) + (768 * __i1)) + __i2)];
+                            float __in2 = ONNX_95;
+                            float __out;
+
+                            ///////////////////
+                            // Tasklet code (_Pow_)
+                            __out = dace::math::pow(__in1, __in2);
+                            ///////////////////
+
+                            ONNX_96[(((393216 * __i0) + (768 * __i1)) + __i2)] = __out;
+                        }
+                    }
+                }
+            }
+        }
+        {
+            float* _in = &ONNX_96[0];
+            float* _out = daceml_onnx_op_implementations_pure_implementations_ReduceMean_80_expansion___tmp0;
+
+            ///////////////////
+            #pragma omp parallel for collapse(2)
+            for (int _o0 = 0; _o0 < 8; ++_o0) {
+                for (int _o1 = 0; _o1 < 512; ++_o1) {
+                    _out[_o0 * 512 + _o1 * 1] = 0;
+                    #pragma omp parallel for collapse(1) reduction(+: _out[_o0 * 512 + _o1 * 1])
+                    for (int _i0 = 0; _i0 < 768; ++_i0) {
+                        _out[_o0 * 512 + _o1 * 1] += _in[_o0 * 393216 + _o1 * 768 + _i0 * 1];
+                    }
+                }
+            }
+            ///////////////////
+
+        }
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < 8; __i0 += 1) {
+                for (auto __i1 = 0; __i1 < 512; __i1 += 1) {
+                    {
+                        float __inp = daceml_onnx_op_implementations_pure_implementations_ReduceMean_80_expansion___tmp0[((512 * __i0) + __i1)];
+                        float __out;
+
+                        ///////////////////
+                        // Tasklet code (_elementwise_)
+                        __out = (__inp / 768);
+                        ///////////////////
+
+                        ONNX_97[((512 * __i0) + __i1)] = __out;
+                    }
+                }
+            }
+        }
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < 8; __i0 += 1) {
+                for (auto __i1 = 0; __i1 < 512; __i1 += 1) {
+                    for (auto __i2 = 0; __i2 < 1; __i2 += 1) {
+                        {
+                            float __in1 = ONNX_97[(((512 * __i0) + __i1) + __i2)];
+                            float __in2 = ONNX_98;
+                            float __out;
+
+                            ///////////////////
+                            // Tasklet code (_Add_)
+                            __out = (__in1 + __in2);
+                            ///////////////////
+
+                            ONNX_99[((512 * __i0) + __i1)] = __out;
+                        }
+                    }
+                }
+            }
+        }
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < 8; __i0 += 1) {
+                for (auto __i1 = 0; __i1 < 512; __i1 += 1) {
+                    for (auto __i2 = 0; __i2 < 1; __i2 += 1) {
+                        {
+                            float __inp = ONNX_99[(((512 * __i0) + __i1) + __i2)];
+                            float __out;
+
+                            ///////////////////
+                            // Tasklet code (_elementwise_)
+                            __out = sqrt(__inp);
+                            ///////////////////
+
+                            ONNX_100[((512 * __i0) + __i1)] = __out;
+                        }
+                    }
+                }
+            }
+        }
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < 8; __i0 += 1) {
+                for (auto __i1 = 0; __i1 < 512; __i1 += 1) {
+                    for (auto __i2 = 0; __i2 < 768; __i2 += 1) {
+                        {
+                            float __in1 = ONNX_94[(((393216 * __i0) + (768 * __i1)) + __i2)];
+                            float __in2 = ONNX_100[((512 * __i0) + __i1)];
+                            float __out;
+
+                            ///////////////////
+                            // Tasklet code (_Div_)
+                            __out = (__in1 / __in2);
+                            ///////////////////
+
+                            ONNX_101[(((393216 * __i0) + (768 * __i1)) + __i2)] = __out;
+                        }
+                    }
+                }
+            }
+        }
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < 8; __i0 += 1) {
+                for (auto __i1 = 0; __i1 < 512; __i1 += 1) {
+                    for (auto __i2 = 0; __i2 < 768; __i2 += 1) {
+                        {
+                            float __in1 = ONNX_101[(((393216 * __i0) + (768 * __i1)) + __i2)];
+                            float __in2 = attentionDOToutputDOTLayerNormDOTweight[__i2];
+                            float __out;
+
+                            ///////////////////
+                            // Tasklet code (_Mult_)
+                            __out = (__in1 * __in2);
+                            ///////////////////
+
+                            ONNX_102[(((393216 * __i0) + (768 * __i1)) + __i2)] = __out;
+                        }
+                    }
+                }
+            }
+        }
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < 8; __i0 += 1) {
+                for (auto __i1 = 0; __i1 < 512; __i1 += 1) {
+                    for (auto __i2 = 0; __i2 < 768; __i2 += 1) {
+                        {
+                            float __in1 = ONNX_102[(((393216 * __i0) + (768 * __i1)) + __i2)];
+                            float __in2 = attentionDOToutputDOTLayerNormDOTbias[__i2];
+                            float __out;
+
+                            ///////////////////
+                            // Tasklet code (_Add_)
+                            __out = (__in1 + __in2);
+                            ///////////////////
+
+                            ONNX_103[(((393216 * __i0) + (768 * __i1)) + __i2)] = __out;
+                        }
+                    }
+                }
+            }
+        }
+        {
+            #pragma omp parallel for
+            for (auto _i0 = 0; _i0 < 3072; _i0 += 1) {
+                for (auto _i1 = 0; _i1 < 768; _i1 += 1) {
+                    {
+                        float _in = intermediateDOTdenseDOTweight[((768 * _i0) + _i1)];
+                        float _out;
+
+                        ///////////////////
+                        // Tasklet code (_transpose_)
+                        _out = _in;
+                        ///////////////////
+
+                        ONNX_104[(_i0 + (3072 * _i1))] = _out;
+                    }
+                }
+            }
+        }
+        einsum_gemmgemm_sdfg_5_0_0_252(__state, &X_5[0], &ONNX_104[0], &Z_5[0]);
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < 8; __i0 += 1) {
+                for (auto __i1 = 0; __i1 < 512; __i1 += 1) {
+                    for (auto __i2 = 0; __i2 < 3072; __i2 += 1) {
+                        {
+                            float __in1 = ONNX_105[(((1572864 * __i0) + (3072 * __i1)) + __i2)];
+                            float __in2 = intermediateDOTdenseDOTbias[__i2];
+                            float __out;
+
+                            ///////////////////
+                            // Tasklet code (_Add_)
+                            __out = (__in1 + __in2);
+                            ///////////////////
+
+                            ONNX_106[(((1572864 * __i0) + (3072 * __i1)) + __i2)] = __out;
+                        }
+                    }
+                }
+            }
+        }
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < 8; __i0 += 1) {
+                for (auto __i1 = 0; __i1 < 512; __i1 += 1) {
+                    for (auto __i2 = 0; __i2 < 3072; __i2 += 1) {
+                        {
+                            float __in1 = ONNX_106[(((1572864 * __i0) + (3072 * __i1)) + __i2)];
+                            float __in2 = ONNX_107;
+                            float __out;
+
+                            ///////////////////
+                            // Tasklet code (_Div_)
+                            __out = (__in1 / __in2);
+                            ///////////////////
+
+                            ONNX_108[(((1572864 * __i0) + (3072 * __i1)) + __i2)] = __out;
+                        }
+                    }
+                }
+            }
+        }
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < 8; __i0 += 1) {
+                for (auto __i1 = 0; __i1 < 512; __i1 += 1) {
+                    for (auto __i2 = 0; __i2 < 3072; __i2 += 1) {
+                        {
+                            float __inp = ONNX_108[(((1572864 * __i0) + (3072 * __i1)) + __i2)];
+                            float __out;
+
+                            ///////////////////
+                            // Tasklet code (_elementwise_)
+                            __out = erf(__inp);
+                            ///////////////////
+
+                            ONNX_109[(((1572864 * __i0) + (3072 * __i1)) + __i2)] = __out;
+                        }
+                    }
+                }
+            }
+        }
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < 8; __i0 += 1) {
+                for (auto __i1 = 0; __i1 < 512; __i1 += 1) {
+                    for (auto __i2 = 0; __i2 < 3072; __i2 += 1) {
+                        {
+                            float __in1 = ONNX_109[(((1572864 * __i0) + (3072 * __i1)) + __i2)];
+                            float __in2 = ONNX_110;
+                            float __out;
+
+                            ///////////////////
+                            // Tasklet code (_Add_)
+                            __out = (__in1 + __in2);
+                            ///////////////////
+
+                            ONNX_111[(((1572864 * __i0) + (3072 * __i1)) + __i2)] = __out;
+                        }
+                    }
+                }
+            }
+        }
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < 8; __i0 += 1) {
+                for (auto __i1 = 0; __i1 < 512; __i1 += 1) {
+                    for (auto __i2 = 0; __i2 < 3072; __i2 += 1) {
+                        {
+                            float __in1 = ONNX_106[(((1572864 * __i0) + (3072 * __i1)) + __i2)];
+                            float __in2 = ONNX_111[(((1572864 * __i0) + (3072 * __i1)) + __i2)];
+                            float __out;
+
+                            ///////////////////
+                            // Tasklet code (_Mult_)
+                            __out = (__in1 * __in2);
+                            ///////////////////
+
+                            ONNX_112[(((1572864 * __i0) + (3072 * __i1)) + __i2)] = __out;
+                        }
+                    }
+                }
+            }
+        }
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < 8; __i0 += 1) {
+                for (auto __i1 = 0; __i1 < 512; __i1 += 1) {
+                    for (auto __i2 = 0; __i2 < 3072; __i2 += 1) {
+                        {
+                            float __in1 = ONNX_112[(((1572864 * __i0) + (3072 * __i1)) + __i2)];
+                            float __in2 = ONNX_113;
+                            float __out;
+
+                            ///////////////////
+                            // Tasklet code (_Mult_)
+                            __out = (__in1 * __in2);
+                            ///////////////////
+
+                            ONNX_114[(((1572864 * __i0) + (3072 * __i1)) + __i2)] = __out;
+                        }
+                    }
+                }
+            }
+        }
+        {
+            #pragma omp parallel for
+            for (auto _i0 = 0; _i0 < 768; _i0 += 1) {
+                for (auto _i1 = 0; _i1 < 3072; _i1 += 1) {
+                    {
+                        float _in = outputDOTdenseDOTweight[((3072 * _i0) + _i1)];
+                        float _out;
+
+                        ///////////////////
+                        // Tasklet code (_transpose_)
+                        _out = _in;
+                        ///////////////////
+
+                        ONNX_115[(_i0 + (768 * _i1))] = _out;
+                    }
+                }
+            }
+        }
+        einsum_gemmgemm_sdfg_0_0_253(__state, &X_6[0], &ONNX_115[0], &Z_6[0]);
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < 8; __i0 += 1) {
+                for (auto __i1 = 0; __i1 < 512; __i1 += 1) {
+                    for (auto __i2 = 0; __i2 < 768; __i2 += 1) {
+                        {
+                            float __in1 = ONNX_116[(((393216 * __i0) + (768 * __i1)) + __i2)];
+                            float __in2 = outputDOTdenseDOTbias[__i2];
+                            float __out;
+
+                            ///////////////////
+                            // Tasklet code (_Add_)
+                            __out = (__in1 + __in2);
+                            ///////////////////
+
+                            ONNX_117[(((393216 * __i0) + (768 * __i1)) + __i2)] = __out;
+                        }
+                    }
+                }
+            }
+        }
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < 8; __i0 += 1) {
+                for (auto __i1 = 0; __i1 < 512; __i1 += 1) {
+                    for (auto __i2 = 0; __i2 < 768; __i2 += 1) {
+                        {
+                            float __in1 = ONNX_117[(((393216 * __i0) + (768 * __i1)) + __i2)];
+                            float __in2 = ONNX_103[(((393216 * __i0) + (768 * __i1)) + __i2)];
+                            float __out;
+
+                            ///////////////////
+                            // Tasklet code (_Add_)
+                            __out = (__in1 + __in2);
+                            ///////////////////
+
+                            ONNX_118[(((393216 * __i0) + (768 * __i1)) + __i2)] = __out;
+                        }
+                    }
+                }
+            }
+        }
+        {
+            float* _in = &ONNX_118[0];
+            float* _out = daceml_onnx_op_implementations_pure_implementations_ReduceMean_102_expansion___tmp0;
+
+            ///////////////////
+            #pragma omp parallel for collapse(2)
+            for (int _o0 = 0; _o0 < 8; ++_o0) {
+                for (int _o1 = 0; _o1 < 512; ++_o1) {
+                    _out[_o0 * 512 + _o1 * 1] = 0;
+                    #pragma omp parallel for collapse(1) reduction(+: _out[_o0 * 512 + _o1 * 1])
+                    for (int _i0 = 0; _i0 < 768; ++_i0) {
+                        _out[_o0 * 512 + _o1 * 1] += _in[_o0 * 393216 + _o1 * 768 + _i0 * 1];
+                    }
+                }
+            }
+            ///////////////////
+
+        }
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < 8; __i0 += 1) {
+                for (auto __i1 = 0; __i1 < 512; __i1 += 1) {
+                    {
+                        float __inp = daceml_onnx_op_implementations_pure_implementations_ReduceMean_102_expansion___tmp0[((512 * __i0) + __i1)];
+                        float __out;
+
+                        ///////////////////
+                        // Tasklet code (_elementwise_)
+                        __out = (__inp / 768);
+                        ///////////////////
+
+                        ONNX_119[((512 * __i0) + __i1)] = __out;
+                    }
+                }
+            }
+        }
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < 8; __i0 += 1) {
+                for (auto __i1 = 0; __i1 < 512; __i1 += 1) {
+                    for (auto __i2 = 0; __i2 < 768; __i2 += 1) {
+                        {
+                            float __in1 = ONNX_118[(((393216 * __i0) + (768 * __i1)) + __i2)];
+                            float __in2 = ONNX_119[((512 * __i0) + __i1)];
+                            float __out;
+
+                            ///////////////////
+                            // Tasklet code (_Sub_)
+                            __out = (__in1 - __in2);
+                            ///////////////////
+
+                            ONNX_120[(((393216 * __i0) + (768 * __i1)) + __i2)] = __out;
+                        }
+                    }
+                }
+            }
+        }
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < 8; __i0 += 1) {
+                for (auto __i1 = 0; __i1 < 512; __i1 += 1) {
+                    for (auto __i2 = 0; __i2 < 768; __i2 += 1) {
+                        {
+                            float __in1 = ONNX_120[(((393216 * __i0) + (768 * __i1)) + __i2)];
+                            float __in2 = ONNX_95;
+                            float __out;
+
+                            ///////////////////
+                            // Tasklet code (_Pow_)
+                            __out = dace::math::pow(__in1, __in2);
+                            ///////////////////
+
+                            ONNX_122[(((393216 * __i0) + (768 * __i1)) + __i2)] = __out;
+                        }
+                    }
+                }
+            }
+        }
+        {
+            float* _in = &ONNX_122[0];
+            float* _out = daceml_onnx_op_implementations_pure_implementations_ReduceMean_106_expansion___tmp0;
+
+            ///////////////////
+            #pragma omp parallel for collapse(2)
+            for (int _o0 = 0; _o0 < 8; ++_o0) {
+                for (int _o1 = 0; _o1 < 512; ++_o1) {
+                    _out[_o0 * 512 + _o1 * 1] = 0;
+                    #pragma omp parallel for collapse(1) reduction(+: _out[_o0 * 512 + _o1 * 1])
+                    for (int _i0 = 0; _i0 < 768; ++_i0) {
+                        _out[_o0 * 512 + _o1 * 1] += _in[_o0 * 393216 + _o1 * 768 + _i0 * 1];
+                    }
+                }
+            }
+            ///////////////////
+
+        }
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < 8; __i0 += 1) {
+                for (auto __i1 = 0; __i1 < 512; __i1 += 1) {
+                    {
+                        float __inp = daceml_onnx_op_implementations_pure_implementations_ReduceMean_106_expansion___tmp0[((512 * __i0) + __i1)];
+                        float __out;
+
+                        ///////////////////
+                        // Tasklet code (_elementwise_)
+                        __out = (__inp / 768);
+                        ///////////////////
+
+                        ONNX_123[((512 * __i0) + __i1)] = __out;
+                    }
+                }
+            }
+        }
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < 8; __i0 += 1) {
+                for (auto __i1 = 0; __i1 < 512; __i1 += 1) {
+                    for (auto __i2 = 0; __i2 < 1; __i2 += 1) {
+                        {
+                            float __in1 = ONNX_123[(((512 * __i0) + __i1) + __i2)];
+                            float __in2 = ONNX_98;
+                            float __out;
+
+                            ///////////////////
+                            // Tasklet code (_Add_)
+                            __out = (__in1 + __in2);
+                            ///////////////////
+
+                            ONNX_125[((512 * __i0) + __i1)] = __out;
+                        }
+                    }
+                }
+            }
+        }
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < 8; __i0 += 1) {
+                for (auto __i1 = 0; __i1 < 512; __i1 += 1) {
+                    for (auto __i2 = 0; __i2 < 1; __i2 += 1) {
+                        {
+                            float __inp = ONNX_125[(((512 * __i0) + __i1) + __i2)];
+                            float __out;
+
+                            ///////////////////
+                            // Tasklet code (_elementwise_)
+                            __out = sqrt(__inp);
+                            ///////////////////
+
+                            ONNX_126[((512 * __i0) + __i1)] = __out;
+                        }
+                    }
+                }
+            }
+        }
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < 8; __i0 += 1) {
+                for (auto __i1 = 0; __i1 < 512; __i1 += 1) {
+                    for (auto __i2 = 0; __i2 < 768; __i2 += 1) {
+                        {
+                            float __in1 = ONNX_120[(((393216 * __i0) + (768 * __i1)) + __i2)];
+                            float __in2 = ONNX_126[((512 * __i0) + __i1)];
+                            float __out;
+
+                            ///////////////////
+                            // Tasklet code (_Div_)
+                            __out = (__in1 / __in2);
+                            ///////////////////
+
+                            ONNX_127[(((393216 * __i0) + (768 * __i1)) + __i2)] = __out;
+                        }
+                    }
+                }
+            }
+        }
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < 8; __i0 += 1) {
+                for (auto __i1 = 0; __i1 < 512; __i1 += 1) {
+                    for (auto __i2 = 0; __i2 < 768; __i2 += 1) {
+                        {
+                            float __in1 = ONNX_127[(((393216 * __i0) + (768 * __i1)) + __i2)];
+                            float __in2 = outputDOTLayerNormDOTweight[__i2];
+                            float __out;
+
+                            ///////////////////
+                            // Tasklet code (_Mult_)
+                            __out = (__in1 * __in2);
+                            ///////////////////
+
+                            ONNX_128[(((393216 * __i0) + (768 * __i1)) + __i2)] = __out;
+                        }
+                    }
+                }
+            }
+        }
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < 8; __i0 += 1) {
+                for (auto __i1 = 0; __i1 < 512; __i1 += 1) {
+                    for (auto __i2 = 0; __i2 < 768; __i2 += 1) {
+                        {
+                            float __in1 = ONNX_128[(((393216 * __i0) + (768 * __i1)) + __i2)];
+                            float __in2 = outputDOTLayerNormDOTbias[__i2];
+                            float __out;
+
+                            ///////////////////
+                            // Tasklet code (_Add_)
+                            __out = (__in1 + __in2);
+                            ///////////////////
+
+                            __return[(((393216 * __i0) + (768 * __i1)) + __i2)] = __out;
+                        }
+                    }
+                }
+            }
+        }
+        delete[] ONNX_17;
+        delete[] ONNX_18;
+        delete[] ONNX_19;
+        delete[] ONNX_20;
+        delete[] ONNX_21;
+        delete[] ONNX_22;
+        delete[] ONNX_37;
+        delete[] ONNX_38;
+        delete[] ONNX_39;
+        delete[] ONNX_54;
+        delete[] ONNX_69;
+        delete[] ONNX_70;
+        delete[] ONNX_71;
+        delete[] ONNX_73;
+        delete[] ONNX_74;
+        delete[] ONNX_75;
+        delete[] ONNX_76;
+        delete[] ONNX_89;
+        delete[] ONNX_90;
+        delete[] ONNX_91;
+        delete[] ONNX_92;
+        delete[] ONNX_93;
+        delete[] ONNX_94;
+        delete[] ONNX_96;
+        delete[] ONNX_97;
+        delete[] ONNX_99;
+        delete[] ONNX_100;
+        delete[] ONNX_101;
+        delete[] ONNX_102;
+        delete[] ONNX_103;
+        delete[] ONNX_104;
+        delete[] ONNX_105;
+        delete[] ONNX_106;
+        delete[] ONNX_108;
+        delete[] ONNX_109;
+        delete[] ONNX_111;
+        delete[] ONNX_112;
+        delete[] ONNX_114;
+        delete[] ONNX_115;
+        delete[] ONNX_116;
+        delete[] ONNX_117;
+        delete[] ONNX_118;
+        delete[] ONNX_119;
+        delete[] ONNX_120;
+        delete[] ONNX_122;
+        delete[] ONNX_123;
+        delete[] ONNX_125;
+        delete[] ONNX_126;
+        delete[] ONNX_127;
+        delete[] ONNX_128;
+        delete[] maximum;
+        delete[] __tmp2;
+        delete[] exponent;
+        delete[] sum;
+        delete[] __tmp0;
+        delete[] daceml_onnx_op_implementations_pure_implementations_ReduceMean_80_expansion___tmp0;
+        delete[] daceml_onnx_op_implementations_pure_implementations_ReduceMean_102_expansion___tmp0;
+        delete[] daceml_onnx_op_implementations_pure_implementations_ReduceMean_106_expansion___tmp0;
+
+    }
+}
+
+DACE_EXPORTED void __program_test_bert_encoder_use_cpu_pure(test_bert_encoder_use_cpu_pure_t *__state, long long * __restrict__ ONNX_35, long long * __restrict__ ONNX_87, float * __restrict__ __return, float * __restrict__ attentionDOToutputDOTLayerNormDOTbias, float * __restrict__ attentionDOToutputDOTLayerNormDOTweight, float * __restrict__ attentionDOToutputDOTdenseDOTbias, float * __restrict__ attentionDOToutputDOTdenseDOTweight, float * __restrict__ attentionDOTselfDOTkeyDOTbias, float * __restrict__ attentionDOTselfDOTkeyDOTweight, float * __restrict__ attentionDOTselfDOTqueryDOTbias, float * __restrict__ attentionDOTselfDOTqueryDOTweight, float * __restrict__ attentionDOTselfDOTvalueDOTbias, float * __restrict__ attentionDOTselfDOTvalueDOTweight, float * __restrict__ inputDOT1, float * __restrict__ intermediateDOTdenseDOTbias, float * __restrict__ intermediateDOTdenseDOTweight, float * __restrict__ outputDOTLayerNormDOTbias, float * __restrict__ outputDOTLayerNormDOTweight, float * __restrict__ outputDOTdenseDOTbias, float * __restrict__ outputDOTdenseDOTweight, float ONNX_107, float ONNX_110, float ONNX_113, float ONNX_72, float ONNX_95, float ONNX_98)
+{
+    __program_test_bert_encoder_use_cpu_pure_internal(__state, ONNX_35, ONNX_87, __return, attentionDOToutputDOTLayerNormDOTbias, attentionDOToutputDOTLayerNormDOTweight, attentionDOToutputDOTdenseDOTbias, attentionDOToutputDOTdenseDOTweight, attentionDOTselfDOTkeyDOTbias, attentionDOTselfDOTkeyDOTweight, attentionDOTselfDOTqueryDOTbias, attentionDOTselfDOTqueryDOTweight, attentionDOTselfDOTvalueDOTbias, attentionDOTselfDOTvalueDOTweight, inputDOT1, intermediateDOTdenseDOTbias, intermediateDOTdenseDOTweight, outputDOTLayerNormDOTbias, outputDOTLayerNormDOTweight, outputDOTdenseDOTbias, outputDOTdenseDOTweight, ONNX_107, ONNX_110, ONNX_113, ONNX_72, ONNX_95, ONNX_98);
+}
+
+DACE_EXPORTED test_bert_encoder_use_cpu_pure_t *__dace_init_test_bert_encoder_use_cpu_pure()
+{
+    int __result = 0;
+    test_bert_encoder_use_cpu_pure_t *__state = new test_bert_encoder_use_cpu_pure_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED void __dace_exit_test_bert_encoder_use_cpu_pure(test_bert_encoder_use_cpu_pure_t *__state)
+{
+    delete __state;
+}
+
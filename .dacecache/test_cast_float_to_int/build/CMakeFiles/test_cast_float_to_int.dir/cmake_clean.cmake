@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/test_cast_float_to_int.dir/root/package/.dacecache/test_cast_float_to_int/src/cpu/test_cast_float_to_int.cpp.o"
+  "CMakeFiles/test_cast_float_to_int.dir/root/package/.dacecache/test_cast_float_to_int/src/cpu/test_cast_float_to_int.cpp.o.d"
+  "libtest_cast_float_to_int.pdb"
+  "libtest_cast_float_to_int.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/test_cast_float_to_int.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
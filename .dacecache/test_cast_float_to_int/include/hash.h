@@ -0,0 +1 @@
+#define __HASH_test_cast_float_to_int "a68616b01cca397d12b923a6682fc9b7e152a0a7de13465ec1d839542b7f7f1e"
@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * test_cast_float_to_intHandle_t;
+extern "C" test_cast_float_to_intHandle_t __dace_init_test_cast_float_to_int();
+extern "C" void __dace_exit_test_cast_float_to_int(test_cast_float_to_intHandle_t handle);
+extern "C" void __program_test_cast_float_to_int(test_cast_float_to_intHandle_t handle, float * __restrict__ X, int * __restrict__ __return);
@@ -0,0 +1,19 @@
+#include <cstdlib>
+#include "../include/test_cast_float_to_int.h"
+
+int main(int argc, char **argv) {
+    test_cast_float_to_intHandle_t handle;
+    float * __restrict__ X = (float*) calloc(8, sizeof(float));
+    int * __restrict__ __return = (int*) calloc(8, sizeof(int));
+
+
+    handle = __dace_init_test_cast_float_to_int();
+    __program_test_cast_float_to_int(handle, X, __return);
+    __dace_exit_test_cast_float_to_int(handle);
+
+    free(X);
+    free(__return);
+
+
+    return 0;
+}
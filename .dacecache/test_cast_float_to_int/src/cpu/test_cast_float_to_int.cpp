@@ -0,0 +1,69 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct test_cast_float_to_int_t {
+
+};
+
+inline void Cast_expansion_0_0_2(test_cast_float_to_int_t *__state, float* input, int* output) {
+
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto i0 = 0; i0 < 2; i0 += 1) {
+                for (auto i1 = 0; i1 < 4; i1 += 1) {
+                    {
+                        float __input = input[((4 * i0) + i1)];
+                        int __output;
+
+                        ///////////////////
+                        // Tasklet code (Cast_tasklet)
+                        __output = __input;
+                        ///////////////////
+
+                        output[((4 * i0) + i1)] = __output;
+                    }
+                }
+            }
+        }
+
+    }
+    
+}
+
+void __program_test_cast_float_to_int_internal(test_cast_float_to_int_t *__state, float * __restrict__ X, int * __restrict__ __return)
+{
+
+    {
+
+        Cast_expansion_0_0_2(__state, &X[0], &__return[0]);
+
+    }
+}
+
+DACE_EXPORTED void __program_test_cast_float_to_int(test_cast_float_to_int_t *__state, float * __restrict__ X, int * __restrict__ __return)
+{
+    __program_test_cast_float_to_int_internal(__state, X, __return);
+}
+
+DACE_EXPORTED test_cast_float_to_int_t *__dace_init_test_cast_float_to_int()
+{
+    int __result = 0;
+    test_cast_float_to_int_t *__state = new test_cast_float_to_int_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED void __dace_exit_test_cast_float_to_int(test_cast_float_to_int_t *__state)
+{
+    delete __state;
+}
+
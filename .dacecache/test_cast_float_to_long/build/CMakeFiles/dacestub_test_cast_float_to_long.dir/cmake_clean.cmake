@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/dacestub_test_cast_float_to_long.dir/tools/dacestub.cpp.o"
+  "CMakeFiles/dacestub_test_cast_float_to_long.dir/tools/dacestub.cpp.o.d"
+  "libdacestub_test_cast_float_to_long.pdb"
+  "libdacestub_test_cast_float_to_long.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/dacestub_test_cast_float_to_long.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/test_cast_float_to_long.dir/root/package/.dacecache/test_cast_float_to_long/src/cpu/test_cast_float_to_long.cpp.o"
+  "CMakeFiles/test_cast_float_to_long.dir/root/package/.dacecache/test_cast_float_to_long/src/cpu/test_cast_float_to_long.cpp.o.d"
+  "libtest_cast_float_to_long.pdb"
+  "libtest_cast_float_to_long.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/test_cast_float_to_long.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
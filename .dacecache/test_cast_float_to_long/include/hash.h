@@ -0,0 +1 @@
+#define __HASH_test_cast_float_to_long "78d0380577f26e9d7d8a60d1e0da99b7a7281580c22ff56466fc516477f561da"
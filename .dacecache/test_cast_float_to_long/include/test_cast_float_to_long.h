@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * test_cast_float_to_longHandle_t;
+extern "C" test_cast_float_to_longHandle_t __dace_init_test_cast_float_to_long();
+extern "C" void __dace_exit_test_cast_float_to_long(test_cast_float_to_longHandle_t handle);
+extern "C" void __program_test_cast_float_to_long(test_cast_float_to_longHandle_t handle, float * __restrict__ X, long long * __restrict__ __return);
@@ -0,0 +1,19 @@
+#include <cstdlib>
+#include "../include/test_cast_float_to_long.h"
+
+int main(int argc, char **argv) {
+    test_cast_float_to_longHandle_t handle;
+    float * __restrict__ X = (float*) calloc(8, sizeof(float));
+    long long * __restrict__ __return = (long long*) calloc(8, sizeof(long long));
+
+
+    handle = __dace_init_test_cast_float_to_long();
+    __program_test_cast_float_to_long(handle, X, __return);
+    __dace_exit_test_cast_float_to_long(handle);
+
+    free(X);
+    free(__return);
+
+
+    return 0;
+}
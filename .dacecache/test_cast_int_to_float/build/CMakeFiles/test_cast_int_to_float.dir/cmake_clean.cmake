@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/test_cast_int_to_float.dir/root/package/.dacecache/test_cast_int_to_float/src/cpu/test_cast_int_to_float.cpp.o"
+  "CMakeFiles/test_cast_int_to_float.dir/root/package/.dacecache/test_cast_int_to_float/src/cpu/test_cast_int_to_float.cpp.o.d"
+  "libtest_cast_int_to_float.pdb"
+  "libtest_cast_int_to_float.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/test_cast_int_to_float.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
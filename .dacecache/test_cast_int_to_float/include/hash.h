@@ -0,0 +1 @@
+#define __HASH_test_cast_int_to_float "dc9abcbece6c5c8b7c708a9327fd04869cda104052fa7e5168760ef04e532440"
@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * test_cast_int_to_floatHandle_t;
+extern "C" test_cast_int_to_floatHandle_t __dace_init_test_cast_int_to_float();
+extern "C" void __dace_exit_test_cast_int_to_float(test_cast_int_to_floatHandle_t handle);
+extern "C" void __program_test_cast_int_to_float(test_cast_int_to_floatHandle_t handle, int * __restrict__ X, float * __restrict__ __return);
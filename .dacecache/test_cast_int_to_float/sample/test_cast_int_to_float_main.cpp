@@ -0,0 +1,19 @@
+#include <cstdlib>
+#include "../include/test_cast_int_to_float.h"
+
+int main(int argc, char **argv) {
+    test_cast_int_to_floatHandle_t handle;
+    int * __restrict__ X = (int*) calloc(8, sizeof(int));
+    float * __restrict__ __return = (float*) calloc(8, sizeof(float));
+
+
+    handle = __dace_init_test_cast_int_to_float();
+    __program_test_cast_int_to_float(handle, X, __return);
+    __dace_exit_test_cast_int_to_float(handle);
+
+    free(X);
+    free(__return);
+
+
+    return 0;
+}
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/test_expansions_add_reshape.dir/root/package/.dacecache/test_expansions_add_reshape/src/cpu/test_expansions_add_reshape.cpp.o"
+  "CMakeFiles/test_expansions_add_reshape.dir/root/package/.dacecache/test_expansions_add_reshape/src/cpu/test_expansions_add_reshape.cpp.o.d"
+  "libtest_expansions_add_reshape.pdb"
+  "libtest_expansions_add_reshape.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/test_expansions_add_reshape.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
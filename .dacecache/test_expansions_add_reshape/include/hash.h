@@ -0,0 +1 @@
+#define __HASH_test_expansions_add_reshape "6cc4910b1da3f7d2956d43337e4805064dc734967e65e5072ac7e9b8deed27cb"
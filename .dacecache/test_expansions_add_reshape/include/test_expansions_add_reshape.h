@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * test_expansions_add_reshapeHandle_t;
+extern "C" test_expansions_add_reshapeHandle_t __dace_init_test_expansions_add_reshape();
+extern "C" void __dace_exit_test_expansions_add_reshape(test_expansions_add_reshapeHandle_t handle);
+extern "C" void __program_test_expansions_add_reshape(test_expansions_add_reshapeHandle_t handle, double * __restrict__ __return, double * __restrict__ bias, double * __restrict__ inp, long long * __restrict__ target_shape);
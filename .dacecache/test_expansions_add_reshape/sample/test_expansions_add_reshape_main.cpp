@@ -0,0 +1,23 @@
+#include <cstdlib>
+#include "../include/test_expansions_add_reshape.h"
+
+int main(int argc, char **argv) {
+    test_expansions_add_reshapeHandle_t handle;
+    double * __restrict__ __return = (double*) calloc(9, sizeof(double));
+    double * __restrict__ bias = (double*) calloc(3, sizeof(double));
+    double * __restrict__ inp = (double*) calloc(9, sizeof(double));
+    long long * __restrict__ target_shape = (long long*) calloc(2, sizeof(long long));
+
+
+    handle = __dace_init_test_expansions_add_reshape();
+    __program_test_expansions_add_reshape(handle, __return, bias, inp, target_shape);
+    __dace_exit_test_expansions_add_reshape(handle);
+
+    free(__return);
+    free(bias);
+    free(inp);
+    free(target_shape);
+
+
+    return 0;
+}
@@ -0,0 +1,78 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct test_expansions_add_reshape_t {
+
+};
+
+inline void daceml_onnx_op_implementations_pure_implementations_ONNXReshape_expansion_0_0_7(test_expansions_add_reshape_t *__state, double* data, double* reshaped) {
+
+    {
+        double* data_0;
+        data_0 = &data[0];
+
+
+        dace::CopyND<double, 1, false, 9>::template ConstDst<1>::Copy(
+        data_0, reshaped, 1);
+
+    }
+    
+}
+
+void __program_test_expansions_add_reshape_internal(test_expansions_add_reshape_t *__state, double * __restrict__ __return, double * __restrict__ bias, double * __restrict__ inp, long long * __restrict__ target_shape)
+{
+
+    {
+        double *reshaped;
+        reshaped = new double DACE_ALIGN(64)[9];
+
+        daceml_onnx_op_implementations_pure_implementations_ONNXReshape_expansion_0_0_7(__state, &inp[0], &reshaped[0]);
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < 3; __i0 += 1) {
+                for (auto __i1 = 0; __i1 < 3; __i1 += 1) {
+                    {
+                        double __in1 = reshaped[((3 * __i0) + __i1)];
+                        double __in2 = bias[__i1];
+                        double __out;
+
+                        ///////////////////
+                        // Tasklet code (_Add_)
+                        __out = (__in1 + __in2);
+                        ///////////////////
+
+                        __return[((3 * __i0) + __i1)] = __out;
+                    }
+                }
+            }
+        }
+        delete[] reshaped;
+
+    }
+}
+
+DACE_EXPORTED void __program_test_expansions_add_reshape(test_expansions_add_reshape_t *__state, double * __restrict__ __return, double * __restrict__ bias, double * __restrict__ inp, long long * __restrict__ target_shape)
+{
+    __program_test_expansions_add_reshape_internal(__state, __return, bias, inp, target_shape);
+}
+
+DACE_EXPORTED test_expansions_add_reshape_t *__dace_init_test_expansions_add_reshape()
+{
+    int __result = 0;
+    test_expansions_add_reshape_t *__state = new test_expansions_add_reshape_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED void __dace_exit_test_expansions_add_reshape(test_expansions_add_reshape_t *__state)
+{
+    delete __state;
+}
+
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/dacestub_test_expansions_gather.dir/tools/dacestub.cpp.o"
+  "CMakeFiles/dacestub_test_expansions_gather.dir/tools/dacestub.cpp.o.d"
+  "libdacestub_test_expansions_gather.pdb"
+  "libdacestub_test_expansions_gather.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/dacestub_test_expansions_gather.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/test_expansions_gather_0.dir/root/package/.dacecache/test_expansions_gather/src/cpu/test_expansions_gather_0.cpp.o"
+  "CMakeFiles/test_expansions_gather_0.dir/root/package/.dacecache/test_expansions_gather/src/cpu/test_expansions_gather_0.cpp.o.d"
+  "libtest_expansions_gather_0.pdb"
+  "libtest_expansions_gather_0.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/test_expansions_gather_0.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
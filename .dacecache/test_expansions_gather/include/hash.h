@@ -0,0 +1 @@
+#define __HASH_test_expansions_gather_0 "db853a8d3a56aa24e89207afd5c3b349a8334842a4d30ab4654e05bf186ef50c"
@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * test_expansions_gather_0Handle_t;
+extern "C" test_expansions_gather_0Handle_t __dace_init_test_expansions_gather_0();
+extern "C" void __dace_exit_test_expansions_gather_0(test_expansions_gather_0Handle_t handle);
+extern "C" void __program_test_expansions_gather_0(test_expansions_gather_0Handle_t handle, double * __restrict__ __return, long long * __restrict__ indices, double * __restrict__ inp);
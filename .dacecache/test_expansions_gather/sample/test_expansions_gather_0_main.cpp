@@ -0,0 +1,21 @@
+#include <cstdlib>
+#include "../include/test_expansions_gather_0.h"
+
+int main(int argc, char **argv) {
+    test_expansions_gather_0Handle_t handle;
+    double * __restrict__ __return = (double*) calloc(6, sizeof(double));
+    long long * __restrict__ indices = (long long*) calloc(2, sizeof(long long));
+    double * __restrict__ inp = (double*) calloc(9, sizeof(double));
+
+
+    handle = __dace_init_test_expansions_gather_0();
+    __program_test_expansions_gather_0(handle, __return, indices, inp);
+    __dace_exit_test_expansions_gather_0(handle);
+
+    free(__return);
+    free(indices);
+    free(inp);
+
+
+    return 0;
+}
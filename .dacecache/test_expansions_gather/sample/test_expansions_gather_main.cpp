@@ -0,0 +1,21 @@
+#include <cstdlib>
+#include "../include/test_expansions_gather.h"
+
+int main(int argc, char **argv) {
+    test_expansions_gatherHandle_t handle;
+    double * __restrict__ __return = (double*) calloc(1024, sizeof(double));
+    double * __restrict__ embs = (double*) calloc(512, sizeof(double));
+    long long * __restrict__ input_ids = (long long*) calloc(128, sizeof(long long));
+
+
+    handle = __dace_init_test_expansions_gather();
+    __program_test_expansions_gather(handle, __return, embs, input_ids);
+    __dace_exit_test_expansions_gather(handle);
+
+    free(__return);
+    free(embs);
+    free(input_ids);
+
+
+    return 0;
+}
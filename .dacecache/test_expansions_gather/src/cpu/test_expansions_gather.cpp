@@ -0,0 +1,62 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct test_expansions_gather_t {
+
+};
+
+void __program_test_expansions_gather_internal(test_expansions_gather_t *__state, double * __restrict__ __return, double * __restrict__ embs, long long * __restrict__ input_ids)
+{
+
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto i0 = 0; i0 < 8; i0 += 1) {
+                for (auto i1 = 0; i1 < 16; i1 += 1) {
+                    for (auto i2 = 0; i2 < 8; i2 += 1) {
+                        {
+                            double* __data = &embs[i2];
+                            long long idx = input_ids[((16 * i0) + i1)];
+                            double __output;
+
+                            ///////////////////
+                            // Tasklet code (ONNXGather_tasklet)
+                            __output = __data[(8 * idx)];
+                            ///////////////////
+
+                            __return[(((128 * i0) + (8 * i1)) + i2)] = __output;
+                        }
+                    }
+                }
+            }
+        }
+
+    }
+}
+
+DACE_EXPORTED void __program_test_expansions_gather(test_expansions_gather_t *__state, double * __restrict__ __return, double * __restrict__ embs, long long * __restrict__ input_ids)
+{
+    __program_test_expansions_gather_internal(__state, __return, embs, input_ids);
+}
+
+DACE_EXPORTED test_expansions_gather_t *__dace_init_test_expansions_gather()
+{
+    int __result = 0;
+    test_expansions_gather_t *__state = new test_expansions_gather_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED void __dace_exit_test_expansions_gather(test_expansions_gather_t *__state)
+{
+    delete __state;
+}
+
@@ -0,0 +1,62 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct test_expansions_gather_0_t {
+
+};
+
+void __program_test_expansions_gather_0_internal(test_expansions_gather_0_t *__state, double * __restrict__ __return, long long * __restrict__ indices, double * __restrict__ inp)
+{
+
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto i0 = 0; i0 < 3; i0 += 1) {
+                for (auto i1 = 0; i1 < 1; i1 += 1) {
+                    for (auto i2 = 0; i2 < 2; i2 += 1) {
+                        {
+                            double* __data = &inp[(3 * i0)];
+                            long long idx = indices[((2 * i1) + i2)];
+                            double __output;
+
+                            ///////////////////
+                            // Tasklet code (ONNXGather_tasklet)
+                            __output = __data[idx];
+                            ///////////////////
+
+                            __return[(((2 * i0) + (2 * i1)) + i2)] = __output;
+                        }
+                    }
+                }
+            }
+        }
+
+    }
+}
+
+DACE_EXPORTED void __program_test_expansions_gather_0(test_expansions_gather_0_t *__state, double * __restrict__ __return, long long * __restrict__ indices, double * __restrict__ inp)
+{
+    __program_test_expansions_gather_0_internal(__state, __return, indices, inp);
+}
+
+DACE_EXPORTED test_expansions_gather_0_t *__dace_init_test_expansions_gather_0()
+{
+    int __result = 0;
+    test_expansions_gather_0_t *__state = new test_expansions_gather_0_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED void __dace_exit_test_expansions_gather_0(test_expansions_gather_0_t *__state)
+{
+    delete __state;
+}
+
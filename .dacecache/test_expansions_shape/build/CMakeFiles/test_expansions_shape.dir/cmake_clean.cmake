@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/test_expansions_shape.dir/root/package/.dacecache/test_expansions_shape/src/cpu/test_expansions_shape.cpp.o"
+  "CMakeFiles/test_expansions_shape.dir/root/package/.dacecache/test_expansions_shape/src/cpu/test_expansions_shape.cpp.o.d"
+  "libtest_expansions_shape.pdb"
+  "libtest_expansions_shape.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/test_expansions_shape.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
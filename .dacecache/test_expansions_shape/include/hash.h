@@ -0,0 +1 @@
+#define __HASH_test_expansions_shape "681f846c7a4ce9dfed3a1054a791255de8d1b162396ea6b25eefd0325c5ade41"
@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * test_expansions_shapeHandle_t;
+extern "C" test_expansions_shapeHandle_t __dace_init_test_expansions_shape();
+extern "C" void __dace_exit_test_expansions_shape(test_expansions_shapeHandle_t handle);
+extern "C" void __program_test_expansions_shape(test_expansions_shapeHandle_t handle, long long * __restrict__ __return, double * __restrict__ inp);
@@ -0,0 +1,19 @@
+#include <cstdlib>
+#include "../include/test_expansions_shape.h"
+
+int main(int argc, char **argv) {
+    test_expansions_shapeHandle_t handle;
+    long long * __restrict__ __return = (long long*) calloc(3, sizeof(long long));
+    double * __restrict__ inp = (double*) calloc(135, sizeof(double));
+
+
+    handle = __dace_init_test_expansions_shape();
+    __program_test_expansions_shape(handle, __return, inp);
+    __dace_exit_test_expansions_shape(handle);
+
+    free(__return);
+    free(inp);
+
+
+    return 0;
+}
@@ -0,0 +1,71 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct test_expansions_shape_t {
+
+};
+
+void __program_test_expansions_shape_internal(test_expansions_shape_t *__state, long long * __restrict__ __return, double * __restrict__ inp)
+{
+
+    {
+
+        {
+            long long shape_scalar;
+
+            ///////////////////
+            // Tasklet code (write_shape)
+            shape_scalar = 9;
+            ///////////////////
+
+            __return[0] = shape_scalar;
+        }
+        {
+            long long shape_scalar;
+
+            ///////////////////
+            // Tasklet code (write_shape)
+            shape_scalar = 5;
+            ///////////////////
+
+            __return[1] = shape_scalar;
+        }
+        {
+            long long shape_scalar;
+
+            ///////////////////
+            // Tasklet code (write_shape)
+            shape_scalar = 3;
+            ///////////////////
+
+            __return[2] = shape_scalar;
+        }
+
+    }
+}
+
+DACE_EXPORTED void __program_test_expansions_shape(test_expansions_shape_t *__state, long long * __restrict__ __return, double * __restrict__ inp)
+{
+    __program_test_expansions_shape_internal(__state, __return, inp);
+}
+
+DACE_EXPORTED test_expansions_shape_t *__dace_init_test_expansions_shape()
+{
+    int __result = 0;
+    test_expansions_shape_t *__state = new test_expansions_shape_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED void __dace_exit_test_expansions_shape(test_expansions_shape_t *__state)
+{
+    delete __state;
+}
+
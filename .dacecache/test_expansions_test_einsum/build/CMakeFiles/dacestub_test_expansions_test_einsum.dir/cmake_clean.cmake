@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/dacestub_test_expansions_test_einsum.dir/tools/dacestub.cpp.o"
+  "CMakeFiles/dacestub_test_expansions_test_einsum.dir/tools/dacestub.cpp.o.d"
+  "libdacestub_test_expansions_test_einsum.pdb"
+  "libdacestub_test_expansions_test_einsum.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/dacestub_test_expansions_test_einsum.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/test_expansions_test_einsum.dir/root/package/.dacecache/test_expansions_test_einsum/src/cpu/test_expansions_test_einsum.cpp.o"
+  "CMakeFiles/test_expansions_test_einsum.dir/root/package/.dacecache/test_expansions_test_einsum/src/cpu/test_expansions_test_einsum.cpp.o.d"
+  "libtest_expansions_test_einsum.pdb"
+  "libtest_expansions_test_einsum.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/test_expansions_test_einsum.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1 @@
+#define __HASH_test_expansions_test_einsum "750def541a18591940bf1c77096a451162d011bd8dfe87bd6e56d19eac6d600e"
@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * test_expansions_test_einsumHandle_t;
+extern "C" test_expansions_test_einsumHandle_t __dace_init_test_expansions_test_einsum();
+extern "C" void __dace_exit_test_expansions_test_einsum(test_expansions_test_einsumHandle_t handle);
+extern "C" void __program_test_expansions_test_einsum(test_expansions_test_einsumHandle_t handle, double * __restrict__ A, double * __restrict__ B, double * __restrict__ __return);
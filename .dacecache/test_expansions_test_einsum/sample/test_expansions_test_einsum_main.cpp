@@ -0,0 +1,21 @@
+#include <cstdlib>
+#include "../include/test_expansions_test_einsum.h"
+
+int main(int argc, char **argv) {
+    test_expansions_test_einsumHandle_t handle;
+    double * __restrict__ A = (double*) calloc(60, sizeof(double));
+    double * __restrict__ B = (double*) calloc(6, sizeof(double));
+    double * __restrict__ __return = (double*) calloc(40, sizeof(double));
+
+
+    handle = __dace_init_test_expansions_test_einsum();
+    __program_test_expansions_test_einsum(handle, A, B, __return);
+    __dace_exit_test_expansions_test_einsum(handle);
+
+    free(A);
+    free(B);
+    free(__return);
+
+
+    return 0;
+}
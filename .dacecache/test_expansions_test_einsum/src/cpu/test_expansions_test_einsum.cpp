@@ -0,0 +1,113 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct test_expansions_test_einsum_t {
+
+};
+
+inline void einsum_gemmgemm_sdfg_2_0_3(test_expansions_test_einsum_t *__state, double* _a, double* _b, double* _c, int K, int M, int N) {
+
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto _o0 = 0; _o0 < M; _o0 += 1) {
+                for (auto _o1 = 0; _o1 < N; _o1 += 1) {
+                    {
+                        double out;
+
+                        ///////////////////
+                        // Tasklet code (gemm_init)
+                        out = 0;
+                        ///////////////////
+
+                        _c[((2 * _o0) + _o1)] = out;
+                    }
+                }
+            }
+        }
+
+    }
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < M; __i0 += 1) {
+                for (auto __i1 = 0; __i1 < N; __i1 += 1) {
+                    for (auto __i2 = 0; __i2 < K; __i2 += 1) {
+                        {
+                            double __a = _a[((3 * __i0) + __i2)];
+                            double __b = _b[(__i1 + (2 * __i2))];
+                            double __out;
+
+                            ///////////////////
+                            // Tasklet code (gemm)
+                            __out = (__a * __b);
+                            ///////////////////
+
+                            dace::wcr_fixed<dace::ReductionType::Sum, double>::reduce_atomic(_c + ((2 * __i0) + __i1), __out);
+                        }
+                    }
+                }
+            }
+        }
+
+    }
+    
+}
+
+inline void einsum_1_0_3(test_expansions_test_einsum_t *__state, double* X, double* Y, double* Z, long long BATCH, int K, int M, int N, long long sAB, long long sAK, long long sAM, long long sBB, long long sBK, long long sBN, long long sCB, long long sCM, long long sCN) {
+
+    {
+
+        einsum_gemmgemm_sdfg_2_0_3(__state, &X[0], &Y[0], &Z[0], K, M, N);
+
+    }
+    
+}
+
+inline void ONNXEinsum_expansion_0_0_3(test_expansions_test_einsum_t *__state, double* Inputs__0, double* Inputs__1, double* Output) {
+
+    {
+
+        einsum_1_0_3(__state, &Inputs__0[0], &Inputs__1[0], &Output[0], 1, 3, 20, 2, 1, 1, 3, 1, 2, 1, 1, 2, 1);
+
+    }
+    
+}
+
+void __program_test_expansions_test_einsum_internal(test_expansions_test_einsum_t *__state, double * __restrict__ A, double * __restrict__ B, double * __restrict__ __return)
+{
+
+    {
+
+        ONNXEinsum_expansion_0_0_3(__state, &A[0], &B[0], &__return[0]);
+
+    }
+}
+
+DACE_EXPORTED void __program_test_expansions_test_einsum(test_expansions_test_einsum_t *__state, double * __restrict__ A, double * __restrict__ B, double * __restrict__ __return)
+{
+    __program_test_expansions_test_einsum_internal(__state, A, B, __return);
+}
+
+DACE_EXPORTED test_expansions_test_einsum_t *__dace_init_test_expansions_test_einsum()
+{
+    int __result = 0;
+    test_expansions_test_einsum_t *__state = new test_expansions_test_einsum_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED void __dace_exit_test_expansions_test_einsum(test_expansions_test_einsum_t *__state)
+{
+    delete __state;
+}
+
@@ -0,0 +1,19 @@
+
+# Consider dependencies only in project.
+set(CMAKE_DEPENDS_IN_PROJECT_ONLY OFF)
+
+# The set of languages for which implicit dependencies are needed:
+set(CMAKE_DEPENDS_LANGUAGES
+  )
+
+# The set of dependency files which are needed:
+set(CMAKE_DEPENDS_DEPENDENCY_FILES
+  "/root/package/.dacecache/test_expansions_test_sum_arrays_input_desc0/src/cpu/test_expansions_test_sum_arrays_input_desc0.cpp" "CMakeFiles/test_expansions_test_sum_arrays_input_desc0.dir/root/package/.dacecache/test_expansions_test_sum_arrays_input_desc0/src/cpu/test_expansions_test_sum_arrays_input_desc0.cpp.o" "gcc" "CMakeFiles/test_expansions_test_sum_arrays_input_desc0.dir/root/package/.dacecache/test_expansions_test_sum_arrays_input_desc0/src/cpu/test_expansions_test_sum_arrays_input_desc0.cpp.o.d"
+  )
+
+# Targets to which this target links.
+set(CMAKE_TARGET_LINKED_INFO_FILES
+  )
+
+# Fortran module output directory.
+set(CMAKE_Fortran_TARGET_MODULE_DIR "")
@@ -0,0 +1 @@
+#define __HASH_test_expansions_test_sum_arrays_input_desc0 "d75cb8830278598341af6c4572936e8cb335f8ced5c26f59c79a281211b6eb72"
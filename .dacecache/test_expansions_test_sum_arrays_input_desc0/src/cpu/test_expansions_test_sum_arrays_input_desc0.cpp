@@ -0,0 +1,71 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct test_expansions_test_sum_arrays_input_desc0_t {
+
+};
+
+inline void ONNXSum_0_0_4(test_expansions_test_sum_arrays_input_desc0_t *__state, float* data_0__0, float* data_0__1, float* data_0__2, float* sum) {
+
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto i0 = 0; i0 < 2; i0 += 1) {
+                for (auto i1 = 0; i1 < 3; i1 += 1) {
+                    {
+                        float __data_0__0 = data_0__0[((3 * i0) + i1)];
+                        float __data_0__1 = data_0__1[((3 * i0) + i1)];
+                        float __data_0__2 = data_0__2[((3 * i0) + i1)];
+                        float __sum;
+
+                        ///////////////////
+                        // Tasklet code (ONNXSum_tasklet)
+                        __sum = ((__data_0__0 + __data_0__1) + __data_0__2);
+                        ///////////////////
+
+                        sum[((3 * i0) + i1)] = __sum;
+                    }
+                }
+            }
+        }
+
+    }
+    
+}
+
+void __program_test_expansions_test_sum_arrays_input_desc0_internal(test_expansions_test_sum_arrays_input_desc0_t *__state, float * __restrict__ __return, float * __restrict__ inp0, float * __restrict__ inp1, float * __restrict__ inp2)
+{
+
+    {
+
+        ONNXSum_0_0_4(__state, &inp0[0], &inp1[0], &inp2[0], &__return[0]);
+
+    }
+}
+
+DACE_EXPORTED void __program_test_expansions_test_sum_arrays_input_desc0(test_expansions_test_sum_arrays_input_desc0_t *__state, float * __restrict__ __return, float * __restrict__ inp0, float * __restrict__ inp1, float * __restrict__ inp2)
+{
+    __program_test_expansions_test_sum_arrays_input_desc0_internal(__state, __return, inp0, inp1, inp2);
+}
+
+DACE_EXPORTED test_expansions_test_sum_arrays_input_desc0_t *__dace_init_test_expansions_test_sum_arrays_input_desc0()
+{
+    int __result = 0;
+    test_expansions_test_sum_arrays_input_desc0_t *__state = new test_expansions_test_sum_arrays_input_desc0_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED void __dace_exit_test_expansions_test_sum_arrays_input_desc0(test_expansions_test_sum_arrays_input_desc0_t *__state)
+{
+    delete __state;
+}
+
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/test_expansions_test_sum_arrays_input_desc1.dir/root/package/.dacecache/test_expansions_test_sum_arrays_input_desc1/src/cpu/test_expansions_test_sum_arrays_input_desc1.cpp.o"
+  "CMakeFiles/test_expansions_test_sum_arrays_input_desc1.dir/root/package/.dacecache/test_expansions_test_sum_arrays_input_desc1/src/cpu/test_expansions_test_sum_arrays_input_desc1.cpp.o.d"
+  "libtest_expansions_test_sum_arrays_input_desc1.pdb"
+  "libtest_expansions_test_sum_arrays_input_desc1.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/test_expansions_test_sum_arrays_input_desc1.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1 @@
+#define __HASH_test_expansions_test_sum_arrays_input_desc1 "6ebc16d2f602fae50bcb5a72fee91b7f35840d35391fd9942c8c499136c5bc64"
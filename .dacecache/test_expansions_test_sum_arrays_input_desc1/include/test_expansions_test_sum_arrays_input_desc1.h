@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * test_expansions_test_sum_arrays_input_desc1Handle_t;
+extern "C" test_expansions_test_sum_arrays_input_desc1Handle_t __dace_init_test_expansions_test_sum_arrays_input_desc1();
+extern "C" void __dace_exit_test_expansions_test_sum_arrays_input_desc1(test_expansions_test_sum_arrays_input_desc1Handle_t handle);
+extern "C" void __program_test_expansions_test_sum_arrays_input_desc1(test_expansions_test_sum_arrays_input_desc1Handle_t handle, float * __restrict__ __return, float * __restrict__ inp0, float * __restrict__ inp1, float * __restrict__ inp2);
@@ -0,0 +1,23 @@
+#include <cstdlib>
+#include "../include/test_expansions_test_sum_arrays_input_desc1.h"
+
+int main(int argc, char **argv) {
+    test_expansions_test_sum_arrays_input_desc1Handle_t handle;
+    float * __restrict__ __return = (float*) calloc(1, sizeof(float));
+    float * __restrict__ inp0 = (float*) calloc(1, sizeof(float));
+    float * __restrict__ inp1 = (float*) calloc(1, sizeof(float));
+    float * __restrict__ inp2 = (float*) calloc(1, sizeof(float));
+
+
+    handle = __dace_init_test_expansions_test_sum_arrays_input_desc1();
+    __program_test_expansions_test_sum_arrays_input_desc1(handle, __return, inp0, inp1, inp2);
+    __dace_exit_test_expansions_test_sum_arrays_input_desc1(handle);
+
+    free(__return);
+    free(inp0);
+    free(inp1);
+    free(inp2);
+
+
+    return 0;
+}
@@ -0,0 +1,69 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct test_expansions_test_sum_arrays_input_desc1_t {
+
+};
+
+inline void ONNXSum_0_0_4(test_expansions_test_sum_arrays_input_desc1_t *__state, const float& data_0__0, const float& data_0__1, const float& data_0__2, float& sum) {
+
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto i0 = 0; i0 < 1; i0 += 1) {
+                {
+                    float __data_0__0 = data_0__0;
+                    float __data_0__1 = data_0__1;
+                    float __data_0__2 = data_0__2;
+                    float __sum;
+
+                    ///////////////////
+                    // Tasklet code (ONNXSum_tasklet)
+                    __sum = ((__data_0__0 + __data_0__1) + __data_0__2);
+                    ///////////////////
+
+                    sum = __sum;
+                }
+            }
+        }
+
+    }
+    
+}
+
+void __program_test_expansions_test_sum_arrays_input_desc1_internal(test_expansions_test_sum_arrays_input_desc1_t *__state, float * __restrict__ __return, float * __restrict__ inp0, float * __restrict__ inp1, float * __restrict__ inp2)
+{
+
+    {
+
+        ONNXSum_0_0_4(__state, inp0[0], inp1[0], inp2[0], __return[0]);
+
+    }
+}
+
+DACE_EXPORTED void __program_test_expansions_test_sum_arrays_input_desc1(test_expansions_test_sum_arrays_input_desc1_t *__state, float * __restrict__ __return, float * __restrict__ inp0, float * __restrict__ inp1, float * __restrict__ inp2)
+{
+    __program_test_expansions_test_sum_arrays_input_desc1_internal(__state, __return, inp0, inp1, inp2);
+}
+
+DACE_EXPORTED test_expansions_test_sum_arrays_input_desc1_t *__dace_init_test_expansions_test_sum_arrays_input_desc1()
+{
+    int __result = 0;
+    test_expansions_test_sum_arrays_input_desc1_t *__state = new test_expansions_test_sum_arrays_input_desc1_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED void __dace_exit_test_expansions_test_sum_arrays_input_desc1(test_expansions_test_sum_arrays_input_desc1_t *__state)
+{
+    delete __state;
+}
+
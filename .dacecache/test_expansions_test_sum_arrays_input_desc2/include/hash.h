@@ -0,0 +1 @@
+#define __HASH_test_expansions_test_sum_arrays_input_desc2 "8cc6d85d62929670cde64e17ad83d4820241a5a63ff9cdeb61fb1b3b59a1ecb7"
@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * test_expansions_test_sum_arrays_input_desc2Handle_t;
+extern "C" test_expansions_test_sum_arrays_input_desc2Handle_t __dace_init_test_expansions_test_sum_arrays_input_desc2();
+extern "C" void __dace_exit_test_expansions_test_sum_arrays_input_desc2(test_expansions_test_sum_arrays_input_desc2Handle_t handle);
+extern "C" void __program_test_expansions_test_sum_arrays_input_desc2(test_expansions_test_sum_arrays_input_desc2Handle_t handle, float * __restrict__ __return, float inp0, float inp1, float inp2);
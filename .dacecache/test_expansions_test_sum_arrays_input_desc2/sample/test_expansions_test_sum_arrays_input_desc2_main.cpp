@@ -0,0 +1,20 @@
+#include <cstdlib>
+#include "../include/test_expansions_test_sum_arrays_input_desc2.h"
+
+int main(int argc, char **argv) {
+    test_expansions_test_sum_arrays_input_desc2Handle_t handle;
+    float inp0 = 42;
+    float inp1 = 42;
+    float inp2 = 42;
+    float * __restrict__ __return = (float*) calloc(1, sizeof(float));
+
+
+    handle = __dace_init_test_expansions_test_sum_arrays_input_desc2();
+    __program_test_expansions_test_sum_arrays_input_desc2(handle, __return, inp0, inp1, inp2);
+    __dace_exit_test_expansions_test_sum_arrays_input_desc2(handle);
+
+    free(__return);
+
+
+    return 0;
+}
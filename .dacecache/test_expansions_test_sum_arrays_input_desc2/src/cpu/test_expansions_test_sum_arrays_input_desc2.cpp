@@ -0,0 +1,69 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct test_expansions_test_sum_arrays_input_desc2_t {
+
+};
+
+inline void ONNXSum_0_0_4(test_expansions_test_sum_arrays_input_desc2_t *__state, float& data_0__0, float& data_0__1, float& data_0__2, float& sum) {
+
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto i0 = 0; i0 < 1; i0 += 1) {
+                {
+                    float __data_0__0 = data_0__0;
+                    float __data_0__1 = data_0__1;
+                    float __data_0__2 = data_0__2;
+                    float __sum;
+
+                    ///////////////////
+                    // Tasklet code (ONNXSum_tasklet)
+                    __sum = ((__data_0__0 + __data_0__1) + __data_0__2);
+                    ///////////////////
+
+                    sum = __sum;
+                }
+            }
+        }
+
+    }
+    
+}
+
+void __program_test_expansions_test_sum_arrays_input_desc2_internal(test_expansions_test_sum_arrays_input_desc2_t *__state, float * __restrict__ __return, float inp0, float inp1, float inp2)
+{
+
+    {
+
+        ONNXSum_0_0_4(__state, inp0, inp1, inp2, __return[0]);
+
+    }
+}
+
+DACE_EXPORTED void __program_test_expansions_test_sum_arrays_input_desc2(test_expansions_test_sum_arrays_input_desc2_t *__state, float * __restrict__ __return, float inp0, float inp1, float inp2)
+{
+    __program_test_expansions_test_sum_arrays_input_desc2_internal(__state, __return, inp0, inp1, inp2);
+}
+
+DACE_EXPORTED test_expansions_test_sum_arrays_input_desc2_t *__dace_init_test_expansions_test_sum_arrays_input_desc2()
+{
+    int __result = 0;
+    test_expansions_test_sum_arrays_input_desc2_t *__state = new test_expansions_test_sum_arrays_input_desc2_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED void __dace_exit_test_expansions_test_sum_arrays_input_desc2(test_expansions_test_sum_arrays_input_desc2_t *__state)
+{
+    delete __state;
+}
+
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/test_expansions_unsqueeze.dir/root/package/.dacecache/test_expansions_unsqueeze/src/cpu/test_expansions_unsqueeze.cpp.o"
+  "CMakeFiles/test_expansions_unsqueeze.dir/root/package/.dacecache/test_expansions_unsqueeze/src/cpu/test_expansions_unsqueeze.cpp.o.d"
+  "libtest_expansions_unsqueeze.pdb"
+  "libtest_expansions_unsqueeze.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/test_expansions_unsqueeze.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1 @@
+#define __HASH_test_expansions_unsqueeze "4488185a8e4ae471aeaefb40ec1653cf82e744153b9092a0bbed8d3c6877d30d"
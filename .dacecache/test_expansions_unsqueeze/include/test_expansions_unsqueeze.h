@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * test_expansions_unsqueezeHandle_t;
+extern "C" test_expansions_unsqueezeHandle_t __dace_init_test_expansions_unsqueeze();
+extern "C" void __dace_exit_test_expansions_unsqueeze(test_expansions_unsqueezeHandle_t handle);
+extern "C" void __program_test_expansions_unsqueeze(test_expansions_unsqueezeHandle_t handle, double * __restrict__ __return, double * __restrict__ inp);
@@ -0,0 +1,19 @@
+#include <cstdlib>
+#include "../include/test_expansions_unsqueeze.h"
+
+int main(int argc, char **argv) {
+    test_expansions_unsqueezeHandle_t handle;
+    double * __restrict__ __return = (double*) calloc(9, sizeof(double));
+    double * __restrict__ inp = (double*) calloc(9, sizeof(double));
+
+
+    handle = __dace_init_test_expansions_unsqueeze();
+    __program_test_expansions_unsqueeze(handle, __return, inp);
+    __dace_exit_test_expansions_unsqueeze(handle);
+
+    free(__return);
+    free(inp);
+
+
+    return 0;
+}
@@ -0,0 +1,56 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct test_expansions_unsqueeze_t {
+
+};
+
+inline void daceml_onnx_op_implementations_pure_implementations_ONNXUnsqueeze_expansion_0_0_2(test_expansions_unsqueeze_t *__state, double* data, double* expanded) {
+
+    {
+        double* data_0;
+        data_0 = &data[0];
+
+
+        dace::CopyND<double, 1, false, 9>::template ConstDst<1>::Copy(
+        data_0, expanded, 1);
+
+    }
+    
+}
+
+void __program_test_expansions_unsqueeze_internal(test_expansions_unsqueeze_t *__state, double * __restrict__ __return, double * __restrict__ inp)
+{
+
+    {
+
+        daceml_onnx_op_implementations_pure_implementations_ONNXUnsqueeze_expansion_0_0_2(__state, &inp[0], &__return[0]);
+
+    }
+}
+
+DACE_EXPORTED void __program_test_expansions_unsqueeze(test_expansions_unsqueeze_t *__state, double * __restrict__ __return, double * __restrict__ inp)
+{
+    __program_test_expansions_unsqueeze_internal(__state, __return, inp);
+}
+
+DACE_EXPORTED test_expansions_unsqueeze_t *__dace_init_test_expansions_unsqueeze()
+{
+    int __result = 0;
+    test_expansions_unsqueeze_t *__state = new test_expansions_unsqueeze_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED void __dace_exit_test_expansions_unsqueeze(test_expansions_unsqueeze_t *__state)
+{
+    delete __state;
+}
+
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/dacestub_test_flatten.dir/tools/dacestub.cpp.o"
+  "CMakeFiles/dacestub_test_flatten.dir/tools/dacestub.cpp.o.d"
+  "libdacestub_test_flatten.pdb"
+  "libdacestub_test_flatten.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/dacestub_test_flatten.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/test_flatten.dir/root/package/.dacecache/test_flatten/src/cpu/test_flatten.cpp.o"
+  "CMakeFiles/test_flatten.dir/root/package/.dacecache/test_flatten/src/cpu/test_flatten.cpp.o.d"
+  "libtest_flatten.pdb"
+  "libtest_flatten.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/test_flatten.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1 @@
+#define __HASH_test_flatten "87a752fc02d8dddc461e8eba2081b70e70ba12be3fb817b603db81c77306d4c6"
@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * test_flattenHandle_t;
+extern "C" test_flattenHandle_t __dace_init_test_flatten();
+extern "C" void __dace_exit_test_flatten(test_flattenHandle_t handle);
+extern "C" void __program_test_flatten(test_flattenHandle_t handle, float * __restrict__ X, float * __restrict__ __return);
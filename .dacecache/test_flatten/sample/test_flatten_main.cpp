@@ -0,0 +1,19 @@
+#include <cstdlib>
+#include "../include/test_flatten.h"
+
+int main(int argc, char **argv) {
+    test_flattenHandle_t handle;
+    float * __restrict__ X = (float*) calloc(80, sizeof(float));
+    float * __restrict__ __return = (float*) calloc(80, sizeof(float));
+
+
+    handle = __dace_init_test_flatten();
+    __program_test_flatten(handle, X, __return);
+    __dace_exit_test_flatten(handle);
+
+    free(X);
+    free(__return);
+
+
+    return 0;
+}
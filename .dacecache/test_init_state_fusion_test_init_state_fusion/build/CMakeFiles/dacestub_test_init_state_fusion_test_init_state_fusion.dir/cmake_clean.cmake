@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/dacestub_test_init_state_fusion_test_init_state_fusion.dir/tools/dacestub.cpp.o"
+  "CMakeFiles/dacestub_test_init_state_fusion_test_init_state_fusion.dir/tools/dacestub.cpp.o.d"
+  "libdacestub_test_init_state_fusion_test_init_state_fusion.pdb"
+  "libdacestub_test_init_state_fusion_test_init_state_fusion.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/dacestub_test_init_state_fusion_test_init_state_fusion.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
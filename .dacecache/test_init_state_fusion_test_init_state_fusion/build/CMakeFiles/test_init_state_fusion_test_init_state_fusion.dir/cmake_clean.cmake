@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/test_init_state_fusion_test_init_state_fusion.dir/root/package/.dacecache/test_init_state_fusion_test_init_state_fusion/src/cpu/test_init_state_fusion_test_init_state_fusion.cpp.o"
+  "CMakeFiles/test_init_state_fusion_test_init_state_fusion.dir/root/package/.dacecache/test_init_state_fusion_test_init_state_fusion/src/cpu/test_init_state_fusion_test_init_state_fusion.cpp.o.d"
+  "libtest_init_state_fusion_test_init_state_fusion.pdb"
+  "libtest_init_state_fusion_test_init_state_fusion.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/test_init_state_fusion_test_init_state_fusion.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
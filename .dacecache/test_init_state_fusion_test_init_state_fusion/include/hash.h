@@ -0,0 +1 @@
+#define __HASH_test_init_state_fusion_test_init_state_fusion "9b8c42ecf20810a7779392c7b81620bf2fc9b4916ee937dd1e41c3d04a3c22a5"
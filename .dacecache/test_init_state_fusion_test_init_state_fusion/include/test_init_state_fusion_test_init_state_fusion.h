@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * test_init_state_fusion_test_init_state_fusionHandle_t;
+extern "C" test_init_state_fusion_test_init_state_fusionHandle_t __dace_init_test_init_state_fusion_test_init_state_fusion();
+extern "C" void __dace_exit_test_init_state_fusion_test_init_state_fusion(test_init_state_fusion_test_init_state_fusionHandle_t handle);
+extern "C" void __program_test_init_state_fusion_test_init_state_fusion(test_init_state_fusion_test_init_state_fusionHandle_t handle, float * __restrict__ W_arr, float * __restrict__ X_arr, float * __restrict__ Y_arr);
@@ -0,0 +1,21 @@
+#include <cstdlib>
+#include "../include/test_init_state_fusion_test_init_state_fusion.h"
+
+int main(int argc, char **argv) {
+    test_init_state_fusion_test_init_state_fusionHandle_t handle;
+    float * __restrict__ W_arr = (float*) calloc(432, sizeof(float));
+    float * __restrict__ X_arr = (float*) calloc(1500, sizeof(float));
+    float * __restrict__ Y_arr = (float*) calloc(5120, sizeof(float));
+
+
+    handle = __dace_init_test_init_state_fusion_test_init_state_fusion();
+    __program_test_init_state_fusion_test_init_state_fusion(handle, W_arr, X_arr, Y_arr);
+    __dace_exit_test_init_state_fusion_test_init_state_fusion(handle);
+
+    free(W_arr);
+    free(X_arr);
+    free(Y_arr);
+
+
+    return 0;
+}
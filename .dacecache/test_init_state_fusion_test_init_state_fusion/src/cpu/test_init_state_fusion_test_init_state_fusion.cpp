@@ -0,0 +1,114 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct test_init_state_fusion_test_init_state_fusion_t {
+
+};
+
+inline void nested_MapState_1_0_5(test_init_state_fusion_test_init_state_fusion_t *__state, float* W, float* X, float* Y_global) {
+    float Y[1]  DACE_ALIGN(64);
+
+    {
+
+        {
+            float outp;
+
+            ///////////////////
+            // Tasklet code (daceml_onnx_op_implementations_img_op_implementations_zero_init_259)
+            outp = 0;
+            ///////////////////
+
+            Y[0] = outp;
+        }
+
+    }
+    {
+
+        {
+            for (auto cin = 0; cin < 3; cin += 1) {
+                for (auto hx = 0; hx < 3; hx += 1) {
+                    for (auto hy = 0; hy < 3; hy += 1) {
+                        {
+                            float filter = W[(((9 * cin) + (3 * hx)) + hy)];
+                            float image = X[(((100 * cin) + (10 * hx)) + hy)];
+                            float out;
+
+                            ///////////////////
+                            // Tasklet code (daceml_onnx_op_implementations_img_op_implementations_ONNXConv_expansion_271)
+                            out = (filter * image);
+                            ///////////////////
+
+                            dace::wcr_fixed<dace::ReductionType::Sum, float>::reduce(Y, out);
+                        }
+                    }
+                }
+            }
+        }
+
+    }
+    {
+
+
+        dace::CopyND<float, 1, false, 1>::template ConstDst<1>::Copy(
+        Y, Y_global, 1);
+
+    }
+    
+}
+
+inline void daceml_onnx_op_implementations_img_op_implementations_ONNXConv_expansion_0_0_3(test_init_state_fusion_test_init_state_fusion_t *__state, float* W, float* X, float* Y) {
+
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto b = 0; b < 5; b += 1) {
+                for (auto m = 0; m < 16; m += 1) {
+                    for (auto out_x = 0; out_x < 8; out_x += 1) {
+                        for (auto out_y = 0; out_y < 8; out_y += 1) {
+                            nested_MapState_1_0_5(__state, &W[(27 * m)], &X[(((300 * b) + (10 * out_x)) + out_y)], &Y[((((1024 * b) + (64 * m)) + (8 * out_x)) + out_y)]);
+                        }
+                    }
+                }
+            }
+        }
+
+    }
+    
+}
+
+void __program_test_init_state_fusion_test_init_state_fusion_internal(test_init_state_fusion_test_init_state_fusion_t *__state, float * __restrict__ W_arr, float * __restrict__ X_arr, float * __restrict__ Y_arr)
+{
+
+    {
+
+        daceml_onnx_op_implementations_img_op_implementations_ONNXConv_expansion_0_0_3(__state, &W_arr[0], &X_arr[0], &Y_arr[0]);
+
+    }
+}
+
+DACE_EXPORTED void __program_test_init_state_fusion_test_init_state_fusion(test_init_state_fusion_test_init_state_fusion_t *__state, float * __restrict__ W_arr, float * __restrict__ X_arr, float * __restrict__ Y_arr)
+{
+    __program_test_init_state_fusion_test_init_state_fusion_internal(__state, W_arr, X_arr, Y_arr);
+}
+
+DACE_EXPORTED test_init_state_fusion_test_init_state_fusion_t *__dace_init_test_init_state_fusion_test_init_state_fusion()
+{
+    int __result = 0;
+    test_init_state_fusion_test_init_state_fusion_t *__state = new test_init_state_fusion_test_init_state_fusion_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED void __dace_exit_test_init_state_fusion_test_init_state_fusion(test_init_state_fusion_test_init_state_fusion_t *__state)
+{
+    delete __state;
+}
+
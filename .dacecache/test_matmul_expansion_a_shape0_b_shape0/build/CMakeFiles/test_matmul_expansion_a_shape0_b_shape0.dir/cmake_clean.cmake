@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/test_matmul_expansion_a_shape0_b_shape0.dir/root/package/.dacecache/test_matmul_expansion_a_shape0_b_shape0/src/cpu/test_matmul_expansion_a_shape0_b_shape0.cpp.o"
+  "CMakeFiles/test_matmul_expansion_a_shape0_b_shape0.dir/root/package/.dacecache/test_matmul_expansion_a_shape0_b_shape0/src/cpu/test_matmul_expansion_a_shape0_b_shape0.cpp.o.d"
+  "libtest_matmul_expansion_a_shape0_b_shape0.pdb"
+  "libtest_matmul_expansion_a_shape0_b_shape0.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/test_matmul_expansion_a_shape0_b_shape0.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
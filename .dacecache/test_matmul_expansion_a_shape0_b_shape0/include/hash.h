@@ -0,0 +1 @@
+#define __HASH_test_matmul_expansion_a_shape0_b_shape0 "0ab648530e4887bc1cc2dff27d8c26d266d0a5f9441a415bd39b3906e4d4c698"
@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * test_matmul_expansion_a_shape0_b_shape0Handle_t;
+extern "C" test_matmul_expansion_a_shape0_b_shape0Handle_t __dace_init_test_matmul_expansion_a_shape0_b_shape0();
+extern "C" void __dace_exit_test_matmul_expansion_a_shape0_b_shape0(test_matmul_expansion_a_shape0_b_shape0Handle_t handle);
+extern "C" void __program_test_matmul_expansion_a_shape0_b_shape0(test_matmul_expansion_a_shape0_b_shape0Handle_t handle, float * __restrict__ X, float * __restrict__ Z, float * __restrict__ __return);
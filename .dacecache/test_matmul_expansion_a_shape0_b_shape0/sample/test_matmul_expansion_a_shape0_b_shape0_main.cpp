@@ -0,0 +1,21 @@
+#include <cstdlib>
+#include "../include/test_matmul_expansion_a_shape0_b_shape0.h"
+
+int main(int argc, char **argv) {
+    test_matmul_expansion_a_shape0_b_shape0Handle_t handle;
+    float * __restrict__ X = (float*) calloc(8, sizeof(float));
+    float * __restrict__ Z = (float*) calloc(12, sizeof(float));
+    float * __restrict__ __return = (float*) calloc(6, sizeof(float));
+
+
+    handle = __dace_init_test_matmul_expansion_a_shape0_b_shape0();
+    __program_test_matmul_expansion_a_shape0_b_shape0(handle, X, Z, __return);
+    __dace_exit_test_matmul_expansion_a_shape0_b_shape0(handle);
+
+    free(X);
+    free(Z);
+    free(__return);
+
+
+    return 0;
+}
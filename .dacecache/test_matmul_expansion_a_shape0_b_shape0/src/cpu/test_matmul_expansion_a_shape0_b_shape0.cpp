@@ -0,0 +1,123 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct test_matmul_expansion_a_shape0_b_shape0_t {
+
+};
+
+inline void einsum_gemmgemm_sdfg_3_0_3(test_matmul_expansion_a_shape0_b_shape0_t *__state, float* _a, float* _b, float* _c, int K, int M, int N) {
+
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto _o0 = 0; _o0 < M; _o0 += 1) {
+                for (auto _o1 = 0; _o1 < N; _o1 += 1) {
+                    {
+                        float out;
+
+                        ///////////////////
+                        // Tasklet code (gemm_init)
+                        out = 0;
+                        ///////////////////
+
+                        _c[((3 * _o0) + _o1)] = out;
+                    }
+                }
+            }
+        }
+
+    }
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < M; __i0 += 1) {
+                for (auto __i1 = 0; __i1 < N; __i1 += 1) {
+                    for (auto __i2 = 0; __i2 < K; __i2 += 1) {
+                        {
+                            float __a = _a[((4 * __i0) + __i2)];
+                            float __b = _b[(__i1 + (3 * __i2))];
+                            float __out;
+
+                            ///////////////////
+                            // Tasklet code (gemm)
+                            __out = (__a * __b);
+                            ///////////////////
+
+                            dace::wcr_fixed<dace::ReductionType::Sum, float>::reduce_atomic(_c + ((3 * __i0) + __i1), __out);
+                        }
+                    }
+                }
+            }
+        }
+
+    }
+    
+}
+
+inline void einsum_2_0_3(test_matmul_expansion_a_shape0_b_shape0_t *__state, float* X, float* Y, float* Z, long long BATCH, int K, int M, int N, long long sAB, long long sAK, long long sAM, long long sBB, long long sBK, long long sBN, long long sCB, long long sCM, long long sCN) {
+
+    {
+
+        einsum_gemmgemm_sdfg_3_0_3(__state, &X[0], &Y[0], &Z[0], K, M, N);
+
+    }
+    
+}
+
+inline void Matmul_einsum_expansion_expansion_1_0_3(test_matmul_expansion_a_shape0_b_shape0_t *__state, float* Inputs__0, float* Inputs__1, float* Output) {
+
+    {
+
+        einsum_2_0_3(__state, &Inputs__0[0], &Inputs__1[0], &Output[0], 1, 4, 2, 3, 1, 1, 4, 1, 3, 1, 1, 3, 1);
+
+    }
+    
+}
+
+inline void Matmul_expansion_0_0_3(test_matmul_expansion_a_shape0_b_shape0_t *__state, float* A, float* B, float* Y) {
+
+    {
+
+        Matmul_einsum_expansion_expansion_1_0_3(__state, &A[0], &B[0], &Y[0]);
+
+    }
+    
+}
+
+void __program_test_matmul_expansion_a_shape0_b_shape0_internal(test_matmul_expansion_a_shape0_b_shape0_t *__state, float * __restrict__ X, float * __restrict__ Z, float * __restrict__ __return)
+{
+
+    {
+
+        Matmul_expansion_0_0_3(__state, &X[0], &Z[0], &__return[0]);
+
+    }
+}
+
+DACE_EXPORTED void __program_test_matmul_expansion_a_shape0_b_shape0(test_matmul_expansion_a_shape0_b_shape0_t *__state, float * __restrict__ X, float * __restrict__ Z, float * __restrict__ __return)
+{
+    __program_test_matmul_expansion_a_shape0_b_shape0_internal(__state, X, Z, __return);
+}
+
+DACE_EXPORTED test_matmul_expansion_a_shape0_b_shape0_t *__dace_init_test_matmul_expansion_a_shape0_b_shape0()
+{
+    int __result = 0;
+    test_matmul_expansion_a_shape0_b_shape0_t *__state = new test_matmul_expansion_a_shape0_b_shape0_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED void __dace_exit_test_matmul_expansion_a_shape0_b_shape0(test_matmul_expansion_a_shape0_b_shape0_t *__state)
+{
+    delete __state;
+}
+
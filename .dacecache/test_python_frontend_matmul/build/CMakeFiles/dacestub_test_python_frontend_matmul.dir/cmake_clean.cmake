@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/dacestub_test_python_frontend_matmul.dir/tools/dacestub.cpp.o"
+  "CMakeFiles/dacestub_test_python_frontend_matmul.dir/tools/dacestub.cpp.o.d"
+  "libdacestub_test_python_frontend_matmul.pdb"
+  "libdacestub_test_python_frontend_matmul.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/dacestub_test_python_frontend_matmul.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/test_python_frontend_matmul.dir/root/package/.dacecache/test_python_frontend_matmul/src/cpu/test_python_frontend_matmul.cpp.o"
+  "CMakeFiles/test_python_frontend_matmul.dir/root/package/.dacecache/test_python_frontend_matmul/src/cpu/test_python_frontend_matmul.cpp.o.d"
+  "libtest_python_frontend_matmul.pdb"
+  "libtest_python_frontend_matmul.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/test_python_frontend_matmul.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1 @@
+#define __HASH_test_python_frontend_matmul "7912bb2b93dfd1d510e3b75bb408e7fe6bde74b0225d831bf0cfdbe9dc288559"
@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * test_python_frontend_matmulHandle_t;
+extern "C" test_python_frontend_matmulHandle_t __dace_init_test_python_frontend_matmul();
+extern "C" void __dace_exit_test_python_frontend_matmul(test_python_frontend_matmulHandle_t handle);
+extern "C" void __program_test_python_frontend_matmul(test_python_frontend_matmulHandle_t handle, float * __restrict__ __return, float * __restrict__ inp1, float * __restrict__ inp2);
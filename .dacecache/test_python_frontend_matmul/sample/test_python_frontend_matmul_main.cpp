@@ -0,0 +1,21 @@
+#include <cstdlib>
+#include "../include/test_python_frontend_matmul.h"
+
+int main(int argc, char **argv) {
+    test_python_frontend_matmulHandle_t handle;
+    float * __restrict__ __return = (float*) calloc(15, sizeof(float));
+    float * __restrict__ inp1 = (float*) calloc(25, sizeof(float));
+    float * __restrict__ inp2 = (float*) calloc(15, sizeof(float));
+
+
+    handle = __dace_init_test_python_frontend_matmul();
+    __program_test_python_frontend_matmul(handle, __return, inp1, inp2);
+    __dace_exit_test_python_frontend_matmul(handle);
+
+    free(__return);
+    free(inp1);
+    free(inp2);
+
+
+    return 0;
+}
@@ -0,0 +1,123 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct test_python_frontend_matmul_t {
+
+};
+
+inline void einsum_gemmgemm_sdfg_3_0_3(test_python_frontend_matmul_t *__state, float* _a, float* _b, float* _c, int K, int M, int N) {
+
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto _o0 = 0; _o0 < M; _o0 += 1) {
+                for (auto _o1 = 0; _o1 < N; _o1 += 1) {
+                    {
+                        float out;
+
+                        ///////////////////
+                        // Tasklet code (gemm_init)
+                        out = 0;
+                        ///////////////////
+
+                        _c[((3 * _o0) + _o1)] = out;
+                    }
+                }
+            }
+        }
+
+    }
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < M; __i0 += 1) {
+                for (auto __i1 = 0; __i1 < N; __i1 += 1) {
+                    for (auto __i2 = 0; __i2 < K; __i2 += 1) {
+                        {
+                            float __a = _a[((5 * __i0) + __i2)];
+                            float __b = _b[(__i1 + (3 * __i2))];
+                            float __out;
+
+                            ///////////////////
+                            // Tasklet code (gemm)
+                            __out = (__a * __b);
+                            ///////////////////
+
+                            dace::wcr_fixed<dace::ReductionType::Sum, float>::reduce_atomic(_c + ((3 * __i0) + __i1), __out);
+                        }
+                    }
+                }
+            }
+        }
+
+    }
+    
+}
+
+inline void einsum_2_0_3(test_python_frontend_matmul_t *__state, float* X, float* Y, float* Z, long long BATCH, int K, int M, int N, long long sAB, long long sAK, long long sAM, long long sBB, long long sBK, long long sBN, long long sCB, long long sCM, long long sCN) {
+
+    {
+
+        einsum_gemmgemm_sdfg_3_0_3(__state, &X[0], &Y[0], &Z[0], K, M, N);
+
+    }
+    
+}
+
+inline void ONNXMatMul_einsum_expansion_expansion_1_0_3(test_python_frontend_matmul_t *__state, float* Inputs__0, float* Inputs__1, float* Output) {
+
+    {
+
+        einsum_2_0_3(__state, &Inputs__0[0], &Inputs__1[0], &Output[0], 1, 5, 5, 3, 1, 1, 5, 1, 3, 1, 1, 3, 1);
+
+    }
+    
+}
+
+inline void ONNXMatMul_expansion_0_0_3(test_python_frontend_matmul_t *__state, float* A, float* B, float* Y) {
+
+    {
+
+        ONNXMatMul_einsum_expansion_expansion_1_0_3(__state, &A[0], &B[0], &Y[0]);
+
+    }
+    
+}
+
+void __program_test_python_frontend_matmul_internal(test_python_frontend_matmul_t *__state, float * __restrict__ __return, float * __restrict__ inp1, float * __restrict__ inp2)
+{
+
+    {
+
+        ONNXMatMul_expansion_0_0_3(__state, &inp1[0], &inp2[0], &__return[0]);
+
+    }
+}
+
+DACE_EXPORTED void __program_test_python_frontend_matmul(test_python_frontend_matmul_t *__state, float * __restrict__ __return, float * __restrict__ inp1, float * __restrict__ inp2)
+{
+    __program_test_python_frontend_matmul_internal(__state, __return, inp1, inp2);
+}
+
+DACE_EXPORTED test_python_frontend_matmul_t *__dace_init_test_python_frontend_matmul()
+{
+    int __result = 0;
+    test_python_frontend_matmul_t *__state = new test_python_frontend_matmul_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED void __dace_exit_test_python_frontend_matmul(test_python_frontend_matmul_t *__state)
+{
+    delete __state;
+}
+
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/dacestub_test_reciprocal.dir/tools/dacestub.cpp.o"
+  "CMakeFiles/dacestub_test_reciprocal.dir/tools/dacestub.cpp.o.d"
+  "libdacestub_test_reciprocal.pdb"
+  "libdacestub_test_reciprocal.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/dacestub_test_reciprocal.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/test_reciprocal.dir/root/package/.dacecache/test_reciprocal/src/cpu/test_reciprocal.cpp.o"
+  "CMakeFiles/test_reciprocal.dir/root/package/.dacecache/test_reciprocal/src/cpu/test_reciprocal.cpp.o.d"
+  "libtest_reciprocal.pdb"
+  "libtest_reciprocal.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/test_reciprocal.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
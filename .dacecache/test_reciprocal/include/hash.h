@@ -0,0 +1 @@
+#define __HASH_test_reciprocal "29e252af36014e397c336bf91df7a1d342a20976bc6a3f86d4d89f15c12951df"
@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * test_reciprocalHandle_t;
+extern "C" test_reciprocalHandle_t __dace_init_test_reciprocal();
+extern "C" void __dace_exit_test_reciprocal(test_reciprocalHandle_t handle);
+extern "C" void __program_test_reciprocal(test_reciprocalHandle_t handle, float * __restrict__ X, float * __restrict__ __return);
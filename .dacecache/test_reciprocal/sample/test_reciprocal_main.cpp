@@ -0,0 +1,19 @@
+#include <cstdlib>
+#include "../include/test_reciprocal.h"
+
+int main(int argc, char **argv) {
+    test_reciprocalHandle_t handle;
+    float * __restrict__ X = (float*) calloc(80, sizeof(float));
+    float * __restrict__ __return = (float*) calloc(80, sizeof(float));
+
+
+    handle = __dace_init_test_reciprocal();
+    __program_test_reciprocal(handle, X, __return);
+    __dace_exit_test_reciprocal(handle);
+
+    free(X);
+    free(__return);
+
+
+    return 0;
+}
@@ -0,0 +1,71 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct test_reciprocal_t {
+
+};
+
+inline void daceml_onnx_op_implementations_pure_implementations_reciprocal_expansion_0_0_2(test_reciprocal_t *__state, float* X, float* Y) {
+
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < 2; __i0 += 1) {
+                for (auto __i1 = 0; __i1 < 4; __i1 += 1) {
+                    for (auto __i2 = 0; __i2 < 10; __i2 += 1) {
+                        {
+                            float __inp = X[(((40 * __i0) + (10 * __i1)) + __i2)];
+                            float __out;
+
+                            ///////////////////
+                            // Tasklet code (_elementwise_)
+                            __out = (dace::float32(1) / __inp);
+                            ///////////////////
+
+                            Y[(((40 * __i0) + (10 * __i1)) + __i2)] = __out;
+                        }
+                    }
+                }
+            }
+        }
+
+    }
+    
+}
+
+void __program_test_reciprocal_internal(test_reciprocal_t *__state, float * __restrict__ X, float * __restrict__ __return)
+{
+
+    {
+
+        daceml_onnx_op_implementations_pure_implementations_reciprocal_expansion_0_0_2(__state, &X[0], &__return[0]);
+
+    }
+}
+
+DACE_EXPORTED void __program_test_reciprocal(test_reciprocal_t *__state, float * __restrict__ X, float * __restrict__ __return)
+{
+    __program_test_reciprocal_internal(__state, X, __return);
+}
+
+DACE_EXPORTED test_reciprocal_t *__dace_init_test_reciprocal()
+{
+    int __result = 0;
+    test_reciprocal_t *__state = new test_reciprocal_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED void __dace_exit_test_reciprocal(test_reciprocal_t *__state)
+{
+    delete __state;
+}
+
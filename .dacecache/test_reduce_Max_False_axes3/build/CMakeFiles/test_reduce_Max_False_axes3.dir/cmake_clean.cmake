@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/test_reduce_Max_False_axes3.dir/root/package/.dacecache/test_reduce_Max_False_axes3/src/cpu/test_reduce_Max_False_axes3.cpp.o"
+  "CMakeFiles/test_reduce_Max_False_axes3.dir/root/package/.dacecache/test_reduce_Max_False_axes3/src/cpu/test_reduce_Max_False_axes3.cpp.o.d"
+  "libtest_reduce_Max_False_axes3.pdb"
+  "libtest_reduce_Max_False_axes3.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/test_reduce_Max_False_axes3.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1 @@
+#define __HASH_test_reduce_Max_False_axes3 "59d2361c6520c34dd89d0911f2142d76861212d2a131bf38c885cc89a5336ff2"
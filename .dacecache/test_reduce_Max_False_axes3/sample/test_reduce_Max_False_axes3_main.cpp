@@ -0,0 +1,19 @@
+#include <cstdlib>
+#include "../include/test_reduce_Max_False_axes3.h"
+
+int main(int argc, char **argv) {
+    test_reduce_Max_False_axes3Handle_t handle;
+    float * __restrict__ X = (float*) calloc(80, sizeof(float));
+    float * __restrict__ __return = (float*) calloc(4, sizeof(float));
+
+
+    handle = __dace_init_test_reduce_Max_False_axes3();
+    __program_test_reduce_Max_False_axes3(handle, X, __return);
+    __dace_exit_test_reduce_Max_False_axes3(handle);
+
+    free(X);
+    free(__return);
+
+
+    return 0;
+}
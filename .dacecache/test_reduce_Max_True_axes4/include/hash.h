@@ -0,0 +1 @@
+#define __HASH_test_reduce_Max_True_axes4 "0c06a0c97facc35b5003c8d719ba1424c08ffbd598ed8fc5a470ea9bcab29b2e"
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/dacestub_test_reduce_Max_True_axes5.dir/tools/dacestub.cpp.o"
+  "CMakeFiles/dacestub_test_reduce_Max_True_axes5.dir/tools/dacestub.cpp.o.d"
+  "libdacestub_test_reduce_Max_True_axes5.pdb"
+  "libdacestub_test_reduce_Max_True_axes5.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/dacestub_test_reduce_Max_True_axes5.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/test_reduce_Max_True_axes5.dir/root/package/.dacecache/test_reduce_Max_True_axes5/src/cpu/test_reduce_Max_True_axes5.cpp.o"
+  "CMakeFiles/test_reduce_Max_True_axes5.dir/root/package/.dacecache/test_reduce_Max_True_axes5/src/cpu/test_reduce_Max_True_axes5.cpp.o.d"
+  "libtest_reduce_Max_True_axes5.pdb"
+  "libtest_reduce_Max_True_axes5.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/test_reduce_Max_True_axes5.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1 @@
+#define __HASH_test_reduce_Max_True_axes5 "73573369cbd3b352115a72bec8fa1dc9fef5f97909cb347ad94389a836074344"
@@ -0,0 +1,19 @@
+#include <cstdlib>
+#include "../include/test_reduce_Max_True_axes5.h"
+
+int main(int argc, char **argv) {
+    test_reduce_Max_True_axes5Handle_t handle;
+    float * __restrict__ X = (float*) calloc(80, sizeof(float));
+    float * __restrict__ __return = (float*) calloc(8, sizeof(float));
+
+
+    handle = __dace_init_test_reduce_Max_True_axes5();
+    __program_test_reduce_Max_True_axes5(handle, X, __return);
+    __dace_exit_test_reduce_Max_True_axes5(handle);
+
+    free(X);
+    free(__return);
+
+
+    return 0;
+}
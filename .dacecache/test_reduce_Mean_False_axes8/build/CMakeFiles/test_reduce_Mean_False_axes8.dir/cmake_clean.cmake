@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/test_reduce_Mean_False_axes8.dir/root/package/.dacecache/test_reduce_Mean_False_axes8/src/cpu/test_reduce_Mean_False_axes8.cpp.o"
+  "CMakeFiles/test_reduce_Mean_False_axes8.dir/root/package/.dacecache/test_reduce_Mean_False_axes8/src/cpu/test_reduce_Mean_False_axes8.cpp.o.d"
+  "libtest_reduce_Mean_False_axes8.pdb"
+  "libtest_reduce_Mean_False_axes8.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/test_reduce_Mean_False_axes8.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1 @@
+#define __HASH_test_reduce_Mean_False_axes8 "3b3d4844e211087dce668755deb1791e7e983e309e7d2b4460298151fe7f5c54"
@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * test_reduce_Mean_False_axes8Handle_t;
+extern "C" test_reduce_Mean_False_axes8Handle_t __dace_init_test_reduce_Mean_False_axes8();
+extern "C" void __dace_exit_test_reduce_Mean_False_axes8(test_reduce_Mean_False_axes8Handle_t handle);
+extern "C" void __program_test_reduce_Mean_False_axes8(test_reduce_Mean_False_axes8Handle_t handle, float * __restrict__ X, float * __restrict__ __return);
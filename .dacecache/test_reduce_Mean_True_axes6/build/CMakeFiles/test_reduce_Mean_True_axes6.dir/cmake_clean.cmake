@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/test_reduce_Mean_True_axes6.dir/root/package/.dacecache/test_reduce_Mean_True_axes6/src/cpu/test_reduce_Mean_True_axes6.cpp.o"
+  "CMakeFiles/test_reduce_Mean_True_axes6.dir/root/package/.dacecache/test_reduce_Mean_True_axes6/src/cpu/test_reduce_Mean_True_axes6.cpp.o.d"
+  "libtest_reduce_Mean_True_axes6.pdb"
+  "libtest_reduce_Mean_True_axes6.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/test_reduce_Mean_True_axes6.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
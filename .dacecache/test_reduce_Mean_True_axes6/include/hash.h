@@ -0,0 +1 @@
+#define __HASH_test_reduce_Mean_True_axes6 "8d2b82cc55566987e517e3b921aab8b689e65758292217eee25c0d4f47ed234b"
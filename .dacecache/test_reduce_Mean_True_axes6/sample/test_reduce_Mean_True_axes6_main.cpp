@@ -0,0 +1,19 @@
+#include <cstdlib>
+#include "../include/test_reduce_Mean_True_axes6.h"
+
+int main(int argc, char **argv) {
+    test_reduce_Mean_True_axes6Handle_t handle;
+    float * __restrict__ X = (float*) calloc(80, sizeof(float));
+    float * __restrict__ __return = (float*) calloc(8, sizeof(float));
+
+
+    handle = __dace_init_test_reduce_Mean_True_axes6();
+    __program_test_reduce_Mean_True_axes6(handle, X, __return);
+    __dace_exit_test_reduce_Mean_True_axes6(handle);
+
+    free(X);
+    free(__return);
+
+
+    return 0;
+}
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/test_reduce_Mean_True_axes7.dir/root/package/.dacecache/test_reduce_Mean_True_axes7/src/cpu/test_reduce_Mean_True_axes7.cpp.o"
+  "CMakeFiles/test_reduce_Mean_True_axes7.dir/root/package/.dacecache/test_reduce_Mean_True_axes7/src/cpu/test_reduce_Mean_True_axes7.cpp.o.d"
+  "libtest_reduce_Mean_True_axes7.pdb"
+  "libtest_reduce_Mean_True_axes7.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/test_reduce_Mean_True_axes7.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1 @@
+#define __HASH_test_reduce_Mean_True_axes7 "ce8be19b22a80b6dcd25c73c0062fabfe949a7da24055fe052ca9bc901f2e116"
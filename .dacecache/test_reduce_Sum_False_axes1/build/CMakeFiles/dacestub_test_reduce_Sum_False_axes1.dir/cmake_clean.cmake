@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/dacestub_test_reduce_Sum_False_axes1.dir/tools/dacestub.cpp.o"
+  "CMakeFiles/dacestub_test_reduce_Sum_False_axes1.dir/tools/dacestub.cpp.o.d"
+  "libdacestub_test_reduce_Sum_False_axes1.pdb"
+  "libdacestub_test_reduce_Sum_False_axes1.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/dacestub_test_reduce_Sum_False_axes1.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/test_reduce_Sum_False_axes1.dir/root/package/.dacecache/test_reduce_Sum_False_axes1/src/cpu/test_reduce_Sum_False_axes1.cpp.o"
+  "CMakeFiles/test_reduce_Sum_False_axes1.dir/root/package/.dacecache/test_reduce_Sum_False_axes1/src/cpu/test_reduce_Sum_False_axes1.cpp.o.d"
+  "libtest_reduce_Sum_False_axes1.pdb"
+  "libtest_reduce_Sum_False_axes1.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/test_reduce_Sum_False_axes1.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1 @@
+#define __HASH_test_reduce_Sum_False_axes1 "3433e977afe4297698109e5ebe403254e7314256dd04a48b2eda19bf9f762148"
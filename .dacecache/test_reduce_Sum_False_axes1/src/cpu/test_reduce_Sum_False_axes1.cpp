@@ -0,0 +1,104 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct test_reduce_Sum_False_axes1_t {
+
+};
+
+inline void reduce_1_0_3(test_reduce_Sum_False_axes1_t *__state, float* _in, float* _out) {
+
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto _o0 = 0; _o0 < 2; _o0 += 1) {
+                for (auto _o1 = 0; _o1 < 4; _o1 += 1) {
+                    {
+                        float __out;
+
+                        ///////////////////
+                        // Tasklet code (reduce_init)
+                        __out = 0;
+                        ///////////////////
+
+                        _out[((4 * _o0) + _o1)] = __out;
+                    }
+                }
+            }
+        }
+
+    }
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto _o0 = 0; _o0 < 2; _o0 += 1) {
+                for (auto _o1 = 0; _o1 < 4; _o1 += 1) {
+                    for (auto _i0 = 0; _i0 < 10; _i0 += 1) {
+                        {
+                            float __inp = _in[((_i0 + (40 * _o0)) + (10 * _o1))];
+                            float __out;
+
+                            ///////////////////
+                            // Tasklet code (identity)
+                            __out = __inp;
+                            ///////////////////
+
+                            dace::wcr_fixed<dace::ReductionType::Sum, float>::reduce_atomic(_out + ((4 * _o0) + _o1), __out);
+                        }
+                    }
+                }
+            }
+        }
+
+    }
+    
+}
+
+inline void daceml_onnx_op_implementations_pure_implementations_reduce_expansion_0_0_2(test_reduce_Sum_False_axes1_t *__state, float* data, float* reduced) {
+
+    {
+        float* __tmp0;
+        __tmp0 = &reduced[0];
+
+        reduce_1_0_3(__state, &data[0], &__tmp0[0]);
+
+    }
+    
+}
+
+void __program_test_reduce_Sum_False_axes1_internal(test_reduce_Sum_False_axes1_t *__state, float * __restrict__ X, float * __restrict__ __return)
+{
+
+    {
+
+        daceml_onnx_op_implementations_pure_implementations_reduce_expansion_0_0_2(__state, &X[0], &__return[0]);
+
+    }
+}
+
+DACE_EXPORTED void __program_test_reduce_Sum_False_axes1(test_reduce_Sum_False_axes1_t *__state, float * __restrict__ X, float * __restrict__ __return)
+{
+    __program_test_reduce_Sum_False_axes1_internal(__state, X, __return);
+}
+
+DACE_EXPORTED test_reduce_Sum_False_axes1_t *__dace_init_test_reduce_Sum_False_axes1()
+{
+    int __result = 0;
+    test_reduce_Sum_False_axes1_t *__state = new test_reduce_Sum_False_axes1_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED void __dace_exit_test_reduce_Sum_False_axes1(test_reduce_Sum_False_axes1_t *__state)
+{
+    delete __state;
+}
+
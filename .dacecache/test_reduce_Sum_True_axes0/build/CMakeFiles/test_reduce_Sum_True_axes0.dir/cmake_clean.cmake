@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/test_reduce_Sum_True_axes0.dir/root/package/.dacecache/test_reduce_Sum_True_axes0/src/cpu/test_reduce_Sum_True_axes0.cpp.o"
+  "CMakeFiles/test_reduce_Sum_True_axes0.dir/root/package/.dacecache/test_reduce_Sum_True_axes0/src/cpu/test_reduce_Sum_True_axes0.cpp.o.d"
+  "libtest_reduce_Sum_True_axes0.pdb"
+  "libtest_reduce_Sum_True_axes0.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/test_reduce_Sum_True_axes0.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
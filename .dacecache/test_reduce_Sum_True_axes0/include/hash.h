@@ -0,0 +1 @@
+#define __HASH_test_reduce_Sum_True_axes0 "58ffdbacec2ec919c6e3944c56cb45e99fec1ae5d4edea2a6580c6ab20a162e1"
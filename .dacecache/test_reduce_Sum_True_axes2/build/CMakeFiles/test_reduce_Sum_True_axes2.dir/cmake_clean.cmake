@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/test_reduce_Sum_True_axes2.dir/root/package/.dacecache/test_reduce_Sum_True_axes2/src/cpu/test_reduce_Sum_True_axes2.cpp.o"
+  "CMakeFiles/test_reduce_Sum_True_axes2.dir/root/package/.dacecache/test_reduce_Sum_True_axes2/src/cpu/test_reduce_Sum_True_axes2.cpp.o.d"
+  "libtest_reduce_Sum_True_axes2.pdb"
+  "libtest_reduce_Sum_True_axes2.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/test_reduce_Sum_True_axes2.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1 @@
+#define __HASH_test_reduce_Sum_True_axes2 "7cece146170a28cc4af6ed8c2c7382763d7ac7b2315cbc1016b66c0e81cb4922"
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/dacestub_test_reduce_scalar.dir/tools/dacestub.cpp.o"
+  "CMakeFiles/dacestub_test_reduce_scalar.dir/tools/dacestub.cpp.o.d"
+  "libdacestub_test_reduce_scalar.pdb"
+  "libdacestub_test_reduce_scalar.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/dacestub_test_reduce_scalar.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/test_reduce_scalar.dir/root/package/.dacecache/test_reduce_scalar/src/cpu/test_reduce_scalar.cpp.o"
+  "CMakeFiles/test_reduce_scalar.dir/root/package/.dacecache/test_reduce_scalar/src/cpu/test_reduce_scalar.cpp.o.d"
+  "libtest_reduce_scalar.pdb"
+  "libtest_reduce_scalar.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/test_reduce_scalar.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1 @@
+#define __HASH_test_reduce_scalar "6d2ea55bce94a79e3636fe5b42d1e37a47827ac2b0abfcdf2d3531895b340b37"
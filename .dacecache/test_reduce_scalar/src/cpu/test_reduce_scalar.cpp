@@ -0,0 +1,130 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct test_reduce_scalar_t {
+
+};
+
+inline void reduce_1_0_6(test_reduce_scalar_t *__state, float* _in, float* _out) {
+
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto _o0 = 0; _o0 < 1; _o0 += 1) {
+                {
+                    float __out;
+
+                    ///////////////////
+                    // Tasklet code (reduce_init)
+                    __out = 0;
+                    ///////////////////
+
+                    _out[_o0] = __out;
+                }
+            }
+        }
+
+    }
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto _i0 = 0; _i0 < 2; _i0 += 1) {
+                for (auto _i1 = 0; _i1 < 4; _i1 += 1) {
+                    for (auto _i2 = 0; _i2 < 10; _i2 += 1) {
+                        {
+                            float __inp = _in[(((40 * _i0) + (10 * _i1)) + _i2)];
+                            float __out;
+
+                            ///////////////////
+                            // Tasklet code (identity)
+                            __out = __inp;
+                            ///////////////////
+
+                            dace::wcr_fixed<dace::ReductionType::Sum, float>::reduce_atomic(_out, __out);
+                        }
+                    }
+                }
+            }
+        }
+
+    }
+    
+}
+
+inline void daceml_onnx_op_implementations_pure_implementations_mean_expansion_0_0_3(test_reduce_scalar_t *__state, float* data, float& reduced) {
+
+    {
+        float __tmp0;
+        float *__tmp1;
+        __tmp1 = new float DACE_ALIGN(64)[1];
+
+        reduce_1_0_6(__state, &data[0], &__tmp0);
+        {
+            float __inp = __tmp0;
+            float __out;
+
+            ///////////////////
+            // Tasklet code (_elementwise_)
+            __out = (__inp / 80);
+            ///////////////////
+
+            __tmp1[0] = __out;
+        }
+        {
+            float __inp = __tmp1[0];
+            float __out;
+
+            ///////////////////
+            // Tasklet code (assign_103_4)
+            __out = __inp;
+            ///////////////////
+
+            reduced = __out;
+        }
+        delete[] __tmp1;
+
+    }
+    
+}
+
+void __program_test_reduce_scalar_internal(test_reduce_scalar_t *__state, float * __restrict__ X, float * __restrict__ __return)
+{
+
+    {
+        float Y;
+
+        daceml_onnx_op_implementations_pure_implementations_mean_expansion_0_0_3(__state, &X[0], Y);
+
+        dace::CopyND<float, 1, false, 1>::template ConstDst<1>::Copy(
+        &Y, __return, 1);
+
+    }
+}
+
+DACE_EXPORTED void __program_test_reduce_scalar(test_reduce_scalar_t *__state, float * __restrict__ X, float * __restrict__ __return)
+{
+    __program_test_reduce_scalar_internal(__state, X, __return);
+}
+
+DACE_EXPORTED test_reduce_scalar_t *__dace_init_test_reduce_scalar()
+{
+    int __result = 0;
+    test_reduce_scalar_t *__state = new test_reduce_scalar_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED void __dace_exit_test_reduce_scalar(test_reduce_scalar_t *__state)
+{
+    delete __state;
+}
+
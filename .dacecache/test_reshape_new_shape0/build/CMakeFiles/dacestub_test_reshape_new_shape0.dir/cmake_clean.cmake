@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/dacestub_test_reshape_new_shape0.dir/tools/dacestub.cpp.o"
+  "CMakeFiles/dacestub_test_reshape_new_shape0.dir/tools/dacestub.cpp.o.d"
+  "libdacestub_test_reshape_new_shape0.pdb"
+  "libdacestub_test_reshape_new_shape0.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/dacestub_test_reshape_new_shape0.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
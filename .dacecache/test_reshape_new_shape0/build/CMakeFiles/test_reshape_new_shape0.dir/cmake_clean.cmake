@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/test_reshape_new_shape0.dir/root/package/.dacecache/test_reshape_new_shape0/src/cpu/test_reshape_new_shape0.cpp.o"
+  "CMakeFiles/test_reshape_new_shape0.dir/root/package/.dacecache/test_reshape_new_shape0/src/cpu/test_reshape_new_shape0.cpp.o.d"
+  "libtest_reshape_new_shape0.pdb"
+  "libtest_reshape_new_shape0.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/test_reshape_new_shape0.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
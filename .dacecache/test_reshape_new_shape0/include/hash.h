@@ -0,0 +1 @@
+#define __HASH_test_reshape_new_shape0 "e459e12511aba555cd48ce54ce7a4eea4d0efa58f0bc4b83feecd3b424c3358b"
@@ -0,0 +1,56 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct test_reshape_new_shape0_t {
+
+};
+
+inline void daceml_onnx_op_implementations_pure_implementations_reshape_expansion_0_0_2(test_reshape_new_shape0_t *__state, float* data, float* reshaped) {
+
+    {
+        float* data_0;
+        data_0 = &data[0];
+
+
+        dace::CopyND<float, 1, false, 80>::template ConstDst<1>::Copy(
+        data_0, reshaped, 1);
+
+    }
+    
+}
+
+void __program_test_reshape_new_shape0_internal(test_reshape_new_shape0_t *__state, float * __restrict__ X, float * __restrict__ __return)
+{
+
+    {
+
+        daceml_onnx_op_implementations_pure_implementations_reshape_expansion_0_0_2(__state, &X[0], &__return[0]);
+
+    }
+}
+
+DACE_EXPORTED void __program_test_reshape_new_shape0(test_reshape_new_shape0_t *__state, float * __restrict__ X, float * __restrict__ __return)
+{
+    __program_test_reshape_new_shape0_internal(__state, X, __return);
+}
+
+DACE_EXPORTED test_reshape_new_shape0_t *__dace_init_test_reshape_new_shape0()
+{
+    int __result = 0;
+    test_reshape_new_shape0_t *__state = new test_reshape_new_shape0_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED void __dace_exit_test_reshape_new_shape0(test_reshape_new_shape0_t *__state)
+{
+    delete __state;
+}
+
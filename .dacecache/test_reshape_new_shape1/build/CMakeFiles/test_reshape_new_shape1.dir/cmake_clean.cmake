@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/test_reshape_new_shape1.dir/root/package/.dacecache/test_reshape_new_shape1/src/cpu/test_reshape_new_shape1.cpp.o"
+  "CMakeFiles/test_reshape_new_shape1.dir/root/package/.dacecache/test_reshape_new_shape1/src/cpu/test_reshape_new_shape1.cpp.o.d"
+  "libtest_reshape_new_shape1.pdb"
+  "libtest_reshape_new_shape1.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/test_reshape_new_shape1.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1 @@
+#define __HASH_test_reshape_new_shape1 "1db33040a21828c9bd8125783d8bd0ecae56f019be879cfa684e96f97a6bbfe6"
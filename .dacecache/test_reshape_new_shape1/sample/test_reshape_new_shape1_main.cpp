@@ -0,0 +1,19 @@
+#include <cstdlib>
+#include "../include/test_reshape_new_shape1.h"
+
+int main(int argc, char **argv) {
+    test_reshape_new_shape1Handle_t handle;
+    float * __restrict__ X = (float*) calloc(80, sizeof(float));
+    float * __restrict__ __return = (float*) calloc(80, sizeof(float));
+
+
+    handle = __dace_init_test_reshape_new_shape1();
+    __program_test_reshape_new_shape1(handle, X, __return);
+    __dace_exit_test_reshape_new_shape1(handle);
+
+    free(X);
+    free(__return);
+
+
+    return 0;
+}
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/test_reshape_new_shape2.dir/root/package/.dacecache/test_reshape_new_shape2/src/cpu/test_reshape_new_shape2.cpp.o"
+  "CMakeFiles/test_reshape_new_shape2.dir/root/package/.dacecache/test_reshape_new_shape2/src/cpu/test_reshape_new_shape2.cpp.o.d"
+  "libtest_reshape_new_shape2.pdb"
+  "libtest_reshape_new_shape2.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/test_reshape_new_shape2.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
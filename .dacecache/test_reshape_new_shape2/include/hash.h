@@ -0,0 +1 @@
+#define __HASH_test_reshape_new_shape2 "d776a39c9606302e749b697856f6a6161fd5481fc2844a27178fe85d962cd53f"
@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * test_reshape_new_shape2Handle_t;
+extern "C" test_reshape_new_shape2Handle_t __dace_init_test_reshape_new_shape2();
+extern "C" void __dace_exit_test_reshape_new_shape2(test_reshape_new_shape2Handle_t handle);
+extern "C" void __program_test_reshape_new_shape2(test_reshape_new_shape2Handle_t handle, float * __restrict__ X, float * __restrict__ __return);
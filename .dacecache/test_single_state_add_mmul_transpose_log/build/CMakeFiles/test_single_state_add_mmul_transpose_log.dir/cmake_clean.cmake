@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/test_single_state_add_mmul_transpose_log.dir/root/package/.dacecache/test_single_state_add_mmul_transpose_log/src/cpu/test_single_state_add_mmul_transpose_log.cpp.o"
+  "CMakeFiles/test_single_state_add_mmul_transpose_log.dir/root/package/.dacecache/test_single_state_add_mmul_transpose_log/src/cpu/test_single_state_add_mmul_transpose_log.cpp.o.d"
+  "libtest_single_state_add_mmul_transpose_log.pdb"
+  "libtest_single_state_add_mmul_transpose_log.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/test_single_state_add_mmul_transpose_log.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
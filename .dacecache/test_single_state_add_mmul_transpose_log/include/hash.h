@@ -0,0 +1 @@
+#define __HASH_test_single_state_add_mmul_transpose_log "2cd9e37f72a15a71f3414cc05e7cea538f84a63ea0785b17228c31c8d908c388"
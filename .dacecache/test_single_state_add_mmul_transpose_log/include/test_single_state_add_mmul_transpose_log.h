@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * test_single_state_add_mmul_transpose_logHandle_t;
+extern "C" test_single_state_add_mmul_transpose_logHandle_t __dace_init_test_single_state_add_mmul_transpose_log();
+extern "C" void __dace_exit_test_single_state_add_mmul_transpose_log(test_single_state_add_mmul_transpose_logHandle_t handle);
+extern "C" void __program_test_single_state_add_mmul_transpose_log(test_single_state_add_mmul_transpose_logHandle_t handle, float * __restrict__ S, float * __restrict__ W, float * __restrict__ X, float * __restrict__ Y, float * __restrict__ gradient_S, float * __restrict__ gradient_W, float * __restrict__ gradient_X, float * __restrict__ gradient_Y);
@@ -0,0 +1,31 @@
+#include <cstdlib>
+#include "../include/test_single_state_add_mmul_transpose_log.h"
+
+int main(int argc, char **argv) {
+    test_single_state_add_mmul_transpose_logHandle_t handle;
+    float * __restrict__ S = (float*) calloc(1, sizeof(float));
+    float * __restrict__ W = (float*) calloc(12, sizeof(float));
+    float * __restrict__ X = (float*) calloc(20, sizeof(float));
+    float * __restrict__ Y = (float*) calloc(12, sizeof(float));
+    float * __restrict__ gradient_S = (float*) calloc(1, sizeof(float));
+    float * __restrict__ gradient_W = (float*) calloc(12, sizeof(float));
+    float * __restrict__ gradient_X = (float*) calloc(20, sizeof(float));
+    float * __restrict__ gradient_Y = (float*) calloc(12, sizeof(float));
+
+
+    handle = __dace_init_test_single_state_add_mmul_transpose_log();
+    __program_test_single_state_add_mmul_transpose_log(handle, S, W, X, Y, gradient_S, gradient_W, gradient_X, gradient_Y);
+    __dace_exit_test_single_state_add_mmul_transpose_log(handle);
+
+    free(S);
+    free(W);
+    free(X);
+    free(Y);
+    free(gradient_S);
+    free(gradient_W);
+    free(gradient_X);
+    free(gradient_Y);
+
+
+    return 0;
+}
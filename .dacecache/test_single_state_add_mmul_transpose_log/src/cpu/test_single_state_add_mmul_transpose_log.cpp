@@ -0,0 +1,327 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct test_single_state_add_mmul_transpose_log_t {
+
+};
+
+inline void _Transpose__sdfg_0_0_13(test_single_state_add_mmul_transpose_log_t *__state, float* _inp, float* _out) {
+
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < 4; __i0 += 1) {
+                for (auto __i1 = 0; __i1 < 5; __i1 += 1) {
+                    {
+                        float __inp = _inp[((5 * __i0) + __i1)];
+                        float __out;
+
+                        ///////////////////
+                        // Tasklet code (transpose)
+                        __out = __inp;
+                        ///////////////////
+
+                        _out[(__i0 + (4 * __i1))] = __out;
+                    }
+                }
+            }
+        }
+
+    }
+    
+}
+
+inline void _MatMult_gemm_sdfg_0_0_14(test_single_state_add_mmul_transpose_log_t *__state, float* _a, float* _b, float* _c) {
+
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto _o0 = 0; _o0 < 5; _o0 += 1) {
+                for (auto _o1 = 0; _o1 < 3; _o1 += 1) {
+                    {
+                        float out;
+
+                        ///////////////////
+                        // Tasklet code (gemm_init)
+                        out = 0;
+                        ///////////////////
+
+                        _c[((3 * _o0) + _o1)] = out;
+                    }
+                }
+            }
+        }
+
+    }
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < 5; __i0 += 1) {
+                for (auto __i1 = 0; __i1 < 3; __i1 += 1) {
+                    for (auto __i2 = 0; __i2 < 4; __i2 += 1) {
+                        {
+                            float __a = _a[((4 * __i0) + __i2)];
+                            float __b = _b[(__i1 + (3 * __i2))];
+                            float __out;
+
+                            ///////////////////
+                            // Tasklet code (gemm)
+                            __out = (__a * __b);
+                            ///////////////////
+
+                            dace::wcr_fixed<dace::ReductionType::Sum, float>::reduce_atomic(_c + ((3 * __i0) + __i1), __out);
+                        }
+                    }
+                }
+            }
+        }
+
+    }
+    
+}
+
+inline void _MatMult_gemm_sdfg_backward_0_1_6(test_single_state_add_mmul_transpose_log_t *__state, float* _a, float* _b, float* gradient__c, float* gradient__a, float* gradient__b) {
+
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto i0 = 0; i0 < 4; i0 += 1) {
+                for (auto i1 = 0; i1 < 3; i1 += 1) {
+                    {
+                        float __out;
+
+                        ///////////////////
+                        // Tasklet code (_init_gradient__b_)
+                        __out = 0;
+                        ///////////////////
+
+                        gradient__b[((3 * i0) + i1)] = __out;
+                    }
+                }
+            }
+        }
+
+    }
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto i0 = 0; i0 < 5; i0 += 1) {
+                for (auto i1 = 0; i1 < 4; i1 += 1) {
+                    {
+                        float __out;
+
+                        ///////////////////
+                        // Tasklet code (_init_gradient__a_)
+                        __out = 0;
+                        ///////////////////
+
+                        gradient__a[((4 * i0) + i1)] = __out;
+                    }
+                }
+            }
+        }
+
+    }
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < 5; __i0 += 1) {
+                for (auto __i1 = 0; __i1 < 3; __i1 += 1) {
+                    for (auto __i2 = 0; __i2 < 4; __i2 += 1) {
+                        {
+                            float __out_gradient = gradient__c[((3 * __i0) + __i1)];
+                            float __a = _a[((4 * __i0) + __i2)];
+                            float __b = _b[(__i1 + (3 * __i2))];
+                            float __a_gradient;
+                            float __b_gradient;
+
+                            ///////////////////
+                            // Tasklet code (_gemm_reverse_)
+                            __a_gradient = (__out_gradient * __b);
+                            __b_gradient = (__out_gradient * __a);
+                            ///////////////////
+
+                            dace::wcr_fixed<dace::ReductionType::Sum, float>::reduce_atomic(gradient__a + ((4 * __i0) + __i2), __a_gradient);
+                            dace::wcr_fixed<dace::ReductionType::Sum, float>::reduce_atomic(gradient__b + (__i1 + (3 * __i2)), __b_gradient);
+                        }
+                    }
+                }
+            }
+        }
+
+    }
+    
+}
+
+inline void _Transpose__sdfg_backward_0_1_18(test_single_state_add_mmul_transpose_log_t *__state, float* gradient__out, float* gradient__inp) {
+
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < 4; __i0 += 1) {
+                for (auto __i1 = 0; __i1 < 5; __i1 += 1) {
+                    {
+                        float __out_gradient = gradient__out[(__i0 + (4 * __i1))];
+                        float __inp_gradient;
+
+                        ///////////////////
+                        // Tasklet code (_transpose_reverse_)
+                        __inp_gradient = (__out_gradient * 1);
+                        ///////////////////
+
+                        gradient__inp[((5 * __i0) + __i1)] = __inp_gradient;
+                    }
+                }
+            }
+        }
+
+    }
+    
+}
+
+void __program_test_single_state_add_mmul_transpose_log_internal(test_single_state_add_mmul_transpose_log_t *__state, float * __restrict__ S, float * __restrict__ W, float * __restrict__ X, float * __restrict__ Y, float * __restrict__ gradient_S, float * __restrict__ gradient_W, float * __restrict__ gradient_X, float * __restrict__ gradient_Y)
+{
+    float *Xt;
+    Xt = new float DACE_ALIGN(64)[20];
+    float *YW;
+    YW = new float DACE_ALIGN(64)[12];
+    float *Z;
+    Z = new float DACE_ALIGN(64)[15];
+
+    {
+
+        _Transpose__sdfg_0_0_13(__state, &X[0], &Xt[0]);
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < 4; __i0 += 1) {
+                for (auto __i1 = 0; __i1 < 3; __i1 += 1) {
+                    {
+                        float __in1 = W[((3 * __i0) + __i1)];
+                        float __in2 = Y[((3 * __i0) + __i1)];
+                        float __out;
+
+                        ///////////////////
+                        // Tasklet code (_Mult_)
+                        __out = (__in1 * __in2);
+                        ///////////////////
+
+                        YW[((3 * __i0) + __i1)] = __out;
+                    }
+                }
+            }
+        }
+        _MatMult_gemm_sdfg_0_0_14(__state, &Xt[0], &YW[0], &Z[0]);
+        {
+            #pragma omp parallel for
+            for (auto i = 0; i < 5; i += 1) {
+                for (auto j = 0; j < 3; j += 1) {
+                    {
+                        float z = Z[((3 * i) + j)];
+                        float s;
+
+                        ///////////////////
+                        // Tasklet code (summap)
+                        s = log((z + 1));
+                        ///////////////////
+
+                        dace::wcr_fixed<dace::ReductionType::Sum, float>::reduce_atomic(S, s);
+                    }
+                }
+            }
+        }
+
+    }
+    {
+        float *gradient_Z;
+        gradient_Z = new float DACE_ALIGN(64)[15];
+        float *gradient_YW;
+        gradient_YW = new float DACE_ALIGN(64)[12];
+        float *gradient_Xt;
+        gradient_Xt = new float DACE_ALIGN(64)[20];
+
+        {
+            #pragma omp parallel for
+            for (auto i = 0; i < 5; i += 1) {
+                for (auto j = 0; j < 3; j += 1) {
+                    {
+                        float s_gradient = gradient_S[0];
+                        float z = Z[((3 * i) + j)];
+                        float z_gradient;
+
+                        ///////////////////
+                        // Tasklet code (_summap_reverse_)
+                        z_gradient = (s_gradient * (dace::float32(1) / (z + dace::float32(1))));
+                        ///////////////////
+
+                        gradient_Z[((3 * i) + j)] = z_gradient;
+                    }
+                }
+            }
+        }
+        _MatMult_gemm_sdfg_backward_0_1_6(__state, &Xt[0], &YW[0], &gradient_Z[0], &gradient_Xt[0], &gradient_YW[0]);
+        _Transpose__sdfg_backward_0_1_18(__state, &gradient_Xt[0], &gradient_X[0]);
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < 4; __i0 += 1) {
+                for (auto __i1 = 0; __i1 < 3; __i1 += 1) {
+                    {
+                        float __out_gradient = gradient_YW[((3 * __i0) + __i1)];
+                        float __in1 = W[((3 * __i0) + __i1)];
+                        float __in2 = Y[((3 * __i0) + __i1)];
+                        float __in1_gradient;
+                        float __in2_gradient;
+
+                        ///////////////////
+                        // Tasklet code (__Mult__reverse_)
+                        __in1_gradient = (__out_gradient * __in2);
+                        __in2_gradient = (__out_gradient * __in1);
+                        ///////////////////
+
+                        gradient_W[((3 * __i0) + __i1)] = __in1_gradient;
+                        gradient_Y[((3 * __i0) + __i1)] = __in2_gradient;
+                    }
+                }
+            }
+        }
+        delete[] gradient_Z;
+        delete[] gradient_YW;
+        delete[] gradient_Xt;
+
+    }
+    delete[] Xt;
+    delete[] YW;
+    delete[] Z;
+}
+
+DACE_EXPORTED void __program_test_single_state_add_mmul_transpose_log(test_single_state_add_mmul_transpose_log_t *__state, float * __restrict__ S, float * __restrict__ W, float * __restrict__ X, float * __restrict__ Y, float * __restrict__ gradient_S, float * __restrict__ gradient_W, float * __restrict__ gradient_X, float * __restrict__ gradient_Y)
+{
+    __program_test_single_state_add_mmul_transpose_log_internal(__state, S, W, X, Y, gradient_S, gradient_W, gradient_X, gradient_Y);
+}
+
+DACE_EXPORTED test_single_state_add_mmul_transpose_log_t *__dace_init_test_single_state_add_mmul_transpose_log()
+{
+    int __result = 0;
+    test_single_state_add_mmul_transpose_log_t *__state = new test_single_state_add_mmul_transpose_log_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED void __dace_exit_test_single_state_add_mmul_transpose_log(test_single_state_add_mmul_transpose_log_t *__state)
+{
+    delete __state;
+}
+
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/test_single_state_dace_gemm.dir/root/package/.dacecache/test_single_state_dace_gemm/src/cpu/test_single_state_dace_gemm.cpp.o"
+  "CMakeFiles/test_single_state_dace_gemm.dir/root/package/.dacecache/test_single_state_dace_gemm/src/cpu/test_single_state_dace_gemm.cpp.o.d"
+  "libtest_single_state_dace_gemm.pdb"
+  "libtest_single_state_dace_gemm.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/test_single_state_dace_gemm.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1 @@
+#define __HASH_test_single_state_dace_gemm "891e0a28ef312803d4b6ca0755f3f1b0d46259285ae1943c1d934892cd344daf"
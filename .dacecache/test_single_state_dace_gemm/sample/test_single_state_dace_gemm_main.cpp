@@ -0,0 +1,31 @@
+#include <cstdlib>
+#include "../include/test_single_state_dace_gemm.h"
+
+int main(int argc, char **argv) {
+    test_single_state_dace_gemmHandle_t handle;
+    float * __restrict__ S = (float*) calloc(1, sizeof(float));
+    float * __restrict__ X = (float*) calloc(20, sizeof(float));
+    float * __restrict__ Y = (float*) calloc(12, sizeof(float));
+    float * __restrict__ Z = (float*) calloc(15, sizeof(float));
+    float * __restrict__ gradient_S = (float*) calloc(1, sizeof(float));
+    float * __restrict__ gradient_X = (float*) calloc(20, sizeof(float));
+    float * __restrict__ gradient_Y = (float*) calloc(12, sizeof(float));
+    float * __restrict__ gradient_Z = (float*) calloc(15, sizeof(float));
+
+
+    handle = __dace_init_test_single_state_dace_gemm();
+    __program_test_single_state_dace_gemm(handle, S, X, Y, Z, gradient_S, gradient_X, gradient_Y, gradient_Z);
+    __dace_exit_test_single_state_dace_gemm(handle);
+
+    free(S);
+    free(X);
+    free(Y);
+    free(Z);
+    free(gradient_S);
+    free(gradient_X);
+    free(gradient_Y);
+    free(gradient_Z);
+
+
+    return 0;
+}
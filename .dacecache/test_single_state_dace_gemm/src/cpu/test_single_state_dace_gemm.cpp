@@ -0,0 +1,210 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct test_single_state_dace_gemm_t {
+
+};
+
+inline void _MatMult_gemm_sdfg_0_0_7(test_single_state_dace_gemm_t *__state, float* _a, float* _b, float* _c) {
+
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto _o0 = 0; _o0 < 5; _o0 += 1) {
+                for (auto _o1 = 0; _o1 < 3; _o1 += 1) {
+                    {
+                        float out;
+
+                        ///////////////////
+                        // Tasklet code (gemm_init)
+                        out = 0;
+                        ///////////////////
+
+                        _c[((3 * _o0) + _o1)] = out;
+                    }
+                }
+            }
+        }
+
+    }
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < 5; __i0 += 1) {
+                for (auto __i1 = 0; __i1 < 3; __i1 += 1) {
+                    for (auto __i2 = 0; __i2 < 4; __i2 += 1) {
+                        {
+                            float __a = _a[((4 * __i0) + __i2)];
+                            float __b = _b[(__i1 + (3 * __i2))];
+                            float __out;
+
+                            ///////////////////
+                            // Tasklet code (gemm)
+                            __out = (__a * __b);
+                            ///////////////////
+
+                            dace::wcr_fixed<dace::ReductionType::Sum, float>::reduce_atomic(_c + ((3 * __i0) + __i1), __out);
+                        }
+                    }
+                }
+            }
+        }
+
+    }
+    
+}
+
+inline void _MatMult_gemm_sdfg_backward_0_1_5(test_single_state_dace_gemm_t *__state, float* _a, float* _b, float* gradient__c, float* gradient__a, float* gradient__b) {
+
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto i0 = 0; i0 < 4; i0 += 1) {
+                for (auto i1 = 0; i1 < 3; i1 += 1) {
+                    {
+                        float __out;
+
+                        ///////////////////
+                        // Tasklet code (_init_gradient__b_)
+                        __out = 0;
+                        ///////////////////
+
+                        gradient__b[((3 * i0) + i1)] = __out;
+                    }
+                }
+            }
+        }
+
+    }
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto i0 = 0; i0 < 5; i0 += 1) {
+                for (auto i1 = 0; i1 < 4; i1 += 1) {
+                    {
+                        float __out;
+
+                        ///////////////////
+                        // Tasklet code (_init_gradient__a_)
+                        __out = 0;
+                        ///////////////////
+
+                        gradient__a[((4 * i0) + i1)] = __out;
+                    }
+                }
+            }
+        }
+
+    }
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < 5; __i0 += 1) {
+                for (auto __i1 = 0; __i1 < 3; __i1 += 1) {
+                    for (auto __i2 = 0; __i2 < 4; __i2 += 1) {
+                        {
+                            float __out_gradient = gradient__c[((3 * __i0) + __i1)];
+                            float __a = _a[((4 * __i0) + __i2)];
+                            float __b = _b[(__i1 + (3 * __i2))];
+                            float __a_gradient;
+                            float __b_gradient;
+
+                            ///////////////////
+                            // Tasklet code (_gemm_reverse_)
+                            __a_gradient = (__out_gradient * __b);
+                            __b_gradient = (__out_gradient * __a);
+                            ///////////////////
+
+                            dace::wcr_fixed<dace::ReductionType::Sum, float>::reduce_atomic(gradient__a + ((4 * __i0) + __i2), __a_gradient);
+                            dace::wcr_fixed<dace::ReductionType::Sum, float>::reduce_atomic(gradient__b + (__i1 + (3 * __i2)), __b_gradient);
+                        }
+                    }
+                }
+            }
+        }
+
+    }
+    
+}
+
+void __program_test_single_state_dace_gemm_internal(test_single_state_dace_gemm_t *__state, float * __restrict__ S, float * __restrict__ X, float * __restrict__ Y, float * __restrict__ Z, float * __restrict__ gradient_S, float * __restrict__ gradient_X, float * __restrict__ gradient_Y, float * __restrict__ gradient_Z)
+{
+
+    {
+
+        _MatMult_gemm_sdfg_0_0_7(__state, &X[0], &Y[0], &Z[0]);
+        {
+            #pragma omp parallel for
+            for (auto i = 0; i < 5; i += 1) {
+                for (auto j = 0; j < 3; j += 1) {
+                    {
+                        float z = Z[((3 * i) + j)];
+                        float s;
+
+                        ///////////////////
+                        // Tasklet code (summap)
+                        s = z;
+                        ///////////////////
+
+                        dace::wcr_fixed<dace::ReductionType::Sum, float>::reduce_atomic(S, s);
+                    }
+                }
+            }
+        }
+
+    }
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto i = 0; i < 5; i += 1) {
+                for (auto j = 0; j < 3; j += 1) {
+                    {
+                        float s_gradient = gradient_S[0];
+                        float z_gradient;
+
+                        ///////////////////
+                        // Tasklet code (_summap_reverse_)
+                        z_gradient = (s_gradient * 1);
+                        ///////////////////
+
+                        gradient_Z[((3 * i) + j)] = z_gradient;
+                    }
+                }
+            }
+        }
+        _MatMult_gemm_sdfg_backward_0_1_5(__state, &X[0], &Y[0], &gradient_Z[0], &gradient_X[0], &gradient_Y[0]);
+
+    }
+}
+
+DACE_EXPORTED void __program_test_single_state_dace_gemm(test_single_state_dace_gemm_t *__state, float * __restrict__ S, float * __restrict__ X, float * __restrict__ Y, float * __restrict__ Z, float * __restrict__ gradient_S, float * __restrict__ gradient_X, float * __restrict__ gradient_Y, float * __restrict__ gradient_Z)
+{
+    __program_test_single_state_dace_gemm_internal(__state, S, X, Y, Z, gradient_S, gradient_X, gradient_Y, gradient_Z);
+}
+
+DACE_EXPORTED test_single_state_dace_gemm_t *__dace_init_test_single_state_dace_gemm()
+{
+    int __result = 0;
+    test_single_state_dace_gemm_t *__state = new test_single_state_dace_gemm_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED void __dace_exit_test_single_state_dace_gemm(test_single_state_dace_gemm_t *__state)
+{
+    delete __state;
+}
+
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/dacestub_test_single_state_dace_sum.dir/tools/dacestub.cpp.o"
+  "CMakeFiles/dacestub_test_single_state_dace_sum.dir/tools/dacestub.cpp.o.d"
+  "libdacestub_test_single_state_dace_sum.pdb"
+  "libdacestub_test_single_state_dace_sum.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/dacestub_test_single_state_dace_sum.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/test_single_state_dace_sum.dir/root/package/.dacecache/test_single_state_dace_sum/src/cpu/test_single_state_dace_sum.cpp.o"
+  "CMakeFiles/test_single_state_dace_sum.dir/root/package/.dacecache/test_single_state_dace_sum/src/cpu/test_single_state_dace_sum.cpp.o.d"
+  "libtest_single_state_dace_sum.pdb"
+  "libtest_single_state_dace_sum.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/test_single_state_dace_sum.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1 @@
+#define __HASH_test_single_state_dace_sum "1588fdf89bb9dd606951cab09696e3c8581a19655f9979d486ee0767f5c7d0a0"
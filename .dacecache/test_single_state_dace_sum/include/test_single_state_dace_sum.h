@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * test_single_state_dace_sumHandle_t;
+extern "C" test_single_state_dace_sumHandle_t __dace_init_test_single_state_dace_sum();
+extern "C" void __dace_exit_test_single_state_dace_sum(test_single_state_dace_sumHandle_t handle);
+extern "C" void __program_test_single_state_dace_sum(test_single_state_dace_sumHandle_t handle, float * __restrict__ S, float * __restrict__ X, float * __restrict__ Y, float * __restrict__ Z, float * __restrict__ gradient_S, float * __restrict__ gradient_X, float * __restrict__ gradient_Y, float * __restrict__ gradient_Z);
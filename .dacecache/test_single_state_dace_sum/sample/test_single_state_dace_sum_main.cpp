@@ -0,0 +1,31 @@
+#include <cstdlib>
+#include "../include/test_single_state_dace_sum.h"
+
+int main(int argc, char **argv) {
+    test_single_state_dace_sumHandle_t handle;
+    float * __restrict__ S = (float*) calloc(1, sizeof(float));
+    float * __restrict__ X = (float*) calloc(9, sizeof(float));
+    float * __restrict__ Y = (float*) calloc(9, sizeof(float));
+    float * __restrict__ Z = (float*) calloc(9, sizeof(float));
+    float * __restrict__ gradient_S = (float*) calloc(1, sizeof(float));
+    float * __restrict__ gradient_X = (float*) calloc(9, sizeof(float));
+    float * __restrict__ gradient_Y = (float*) calloc(9, sizeof(float));
+    float * __restrict__ gradient_Z = (float*) calloc(9, sizeof(float));
+
+
+    handle = __dace_init_test_single_state_dace_sum();
+    __program_test_single_state_dace_sum(handle, S, X, Y, Z, gradient_S, gradient_X, gradient_Y, gradient_Z);
+    __dace_exit_test_single_state_dace_sum(handle);
+
+    free(S);
+    free(X);
+    free(Y);
+    free(Z);
+    free(gradient_S);
+    free(gradient_X);
+    free(gradient_Y);
+    free(gradient_Z);
+
+
+    return 0;
+}
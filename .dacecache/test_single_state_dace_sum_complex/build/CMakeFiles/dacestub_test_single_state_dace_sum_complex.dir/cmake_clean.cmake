@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/dacestub_test_single_state_dace_sum_complex.dir/tools/dacestub.cpp.o"
+  "CMakeFiles/dacestub_test_single_state_dace_sum_complex.dir/tools/dacestub.cpp.o.d"
+  "libdacestub_test_single_state_dace_sum_complex.pdb"
+  "libdacestub_test_single_state_dace_sum_complex.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/dacestub_test_single_state_dace_sum_complex.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/test_single_state_dace_sum_complex.dir/root/package/.dacecache/test_single_state_dace_sum_complex/src/cpu/test_single_state_dace_sum_complex.cpp.o"
+  "CMakeFiles/test_single_state_dace_sum_complex.dir/root/package/.dacecache/test_single_state_dace_sum_complex/src/cpu/test_single_state_dace_sum_complex.cpp.o.d"
+  "libtest_single_state_dace_sum_complex.pdb"
+  "libtest_single_state_dace_sum_complex.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/test_single_state_dace_sum_complex.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
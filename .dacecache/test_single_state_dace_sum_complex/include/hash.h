@@ -0,0 +1 @@
+#define __HASH_test_single_state_dace_sum_complex "97d02f89ed097a2575592c0bb3838a098e559d379880c472935f133f091dd66b"
@@ -0,0 +1,125 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct test_single_state_dace_sum_complex_t {
+
+};
+
+void __program_test_single_state_dace_sum_complex_internal(test_single_state_dace_sum_complex_t *__state, float * __restrict__ S, float * __restrict__ X, float * __restrict__ Y, float * __restrict__ Z, float * __restrict__ gradient_S, float * __restrict__ gradient_X, float * __restrict__ gradient_Y, float * __restrict__ gradient_Z)
+{
+
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < 3; __i0 += 1) {
+                for (auto __i1 = 0; __i1 < 3; __i1 += 1) {
+                    {
+                        float __in1 = X[((3 * __i0) + __i1)];
+                        float __in2 = Y[((3 * __i0) + __i1)];
+                        float __out;
+
+                        ///////////////////
+                        // Tasklet code (_Add_)
+                        __out = (__in1 + __in2);
+                        ///////////////////
+
+                        Z[((3 * __i0) + __i1)] = __out;
+                    }
+                }
+            }
+        }
+        {
+            #pragma omp parallel for
+            for (auto i = 0; i < 3; i += 1) {
+                for (auto j = 0; j < 3; j += 1) {
+                    {
+                        float z = Z[((3 * i) + j)];
+                        float s;
+
+                        ///////////////////
+                        // Tasklet code (summap)
+                        auto z1 = (z + 1);
+                        log(3);
+                        auto z2 = (z - (1 * (2 / 2)));
+                        s = (z1 * z2);
+                        ///////////////////
+
+                        dace::wcr_fixed<dace::ReductionType::Sum, float>::reduce_atomic(S, s);
+                    }
+                }
+            }
+        }
+
+    }
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto i = 0; i < 3; i += 1) {
+                for (auto j = 0; j < 3; j += 1) {
+                    {
+                        float s_gradient = gradient_S[0];
+                        float z = Z[((3 * i) + j)];
+                        float z_gradient;
+
+                        ///////////////////
+                        // Tasklet code (_summap_reverse_)
+                        z_gradient = (s_gradient * (2 * z));
+                        ///////////////////
+
+                        gradient_Z[((3 * i) + j)] = z_gradient;
+                    }
+                }
+            }
+        }
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < 3; __i0 += 1) {
+                for (auto __i1 = 0; __i1 < 3; __i1 += 1) {
+                    {
+                        float __out_gradient = gradient_Z[((3 * __i0) + __i1)];
+                        float __in1_gradient;
+                        float __in2_gradient;
+
+                        ///////////////////
+                        // Tasklet code (__Add__reverse_)
+                        __in1_gradient = (__out_gradient * 1);
+                        __in2_gradient = (__out_gradient * 1);
+                        ///////////////////
+
+                        gradient_X[((3 * __i0) + __i1)] = __in1_gradient;
+                        gradient_Y[((3 * __i0) + __i1)] = __in2_gradient;
+                    }
+                }
+            }
+        }
+
+    }
+}
+
+DACE_EXPORTED void __program_test_single_state_dace_sum_complex(test_single_state_dace_sum_complex_t *__state, float * __restrict__ S, float * __restrict__ X, float * __restrict__ Y, float * __restrict__ Z, float * __restrict__ gradient_S, float * __restrict__ gradient_X, float * __restrict__ gradient_Y, float * __restrict__ gradient_Z)
+{
+    __program_test_single_state_dace_sum_complex_internal(__state, S, X, Y, Z, gradient_S, gradient_X, gradient_Y, gradient_Z);
+}
+
+DACE_EXPORTED test_single_state_dace_sum_complex_t *__dace_init_test_single_state_dace_sum_complex()
+{
+    int __result = 0;
+    test_single_state_dace_sum_complex_t *__state = new test_single_state_dace_sum_complex_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED void __dace_exit_test_single_state_dace_sum_complex(test_single_state_dace_sum_complex_t *__state)
+{
+    delete __state;
+}
+
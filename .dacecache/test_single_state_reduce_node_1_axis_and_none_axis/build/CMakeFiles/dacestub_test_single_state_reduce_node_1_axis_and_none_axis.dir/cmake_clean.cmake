@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/dacestub_test_single_state_reduce_node_1_axis_and_none_axis.dir/tools/dacestub.cpp.o"
+  "CMakeFiles/dacestub_test_single_state_reduce_node_1_axis_and_none_axis.dir/tools/dacestub.cpp.o.d"
+  "libdacestub_test_single_state_reduce_node_1_axis_and_none_axis.pdb"
+  "libdacestub_test_single_state_reduce_node_1_axis_and_none_axis.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/dacestub_test_single_state_reduce_node_1_axis_and_none_axis.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/test_single_state_reduce_node_1_axis_and_none_axis.dir/root/package/.dacecache/test_single_state_reduce_node_1_axis_and_none_axis/src/cpu/test_single_state_reduce_node_1_axis_and_none_axis.cpp.o"
+  "CMakeFiles/test_single_state_reduce_node_1_axis_and_none_axis.dir/root/package/.dacecache/test_single_state_reduce_node_1_axis_and_none_axis/src/cpu/test_single_state_reduce_node_1_axis_and_none_axis.cpp.o.d"
+  "libtest_single_state_reduce_node_1_axis_and_none_axis.pdb"
+  "libtest_single_state_reduce_node_1_axis_and_none_axis.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/test_single_state_reduce_node_1_axis_and_none_axis.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
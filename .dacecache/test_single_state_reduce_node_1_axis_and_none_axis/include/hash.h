@@ -0,0 +1 @@
+#define __HASH_test_single_state_reduce_node_1_axis_and_none_axis "21bc2d54a6298949d0840dc979b5f05515565db8bba6e8dd008657f419f2ed03"
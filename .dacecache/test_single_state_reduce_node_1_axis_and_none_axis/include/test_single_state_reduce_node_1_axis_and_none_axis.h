@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * test_single_state_reduce_node_1_axis_and_none_axisHandle_t;
+extern "C" test_single_state_reduce_node_1_axis_and_none_axisHandle_t __dace_init_test_single_state_reduce_node_1_axis_and_none_axis();
+extern "C" void __dace_exit_test_single_state_reduce_node_1_axis_and_none_axis(test_single_state_reduce_node_1_axis_and_none_axisHandle_t handle);
+extern "C" void __program_test_single_state_reduce_node_1_axis_and_none_axis(test_single_state_reduce_node_1_axis_and_none_axisHandle_t handle, float * __restrict__ W, float * __restrict__ X, float * __restrict__ Y, float * __restrict__ __return, float * __restrict__ gradient_W, float * __restrict__ gradient_X, float * __restrict__ gradient_Y, float * __restrict__ gradient___return);
@@ -0,0 +1,31 @@
+#include <cstdlib>
+#include "../include/test_single_state_reduce_node_1_axis_and_none_axis.h"
+
+int main(int argc, char **argv) {
+    test_single_state_reduce_node_1_axis_and_none_axisHandle_t handle;
+    float * __restrict__ W = (float*) calloc(84, sizeof(float));
+    float * __restrict__ X = (float*) calloc(20, sizeof(float));
+    float * __restrict__ Y = (float*) calloc(12, sizeof(float));
+    float * __restrict__ __return = (float*) calloc(1, sizeof(float));
+    float * __restrict__ gradient_W = (float*) calloc(84, sizeof(float));
+    float * __restrict__ gradient_X = (float*) calloc(20, sizeof(float));
+    float * __restrict__ gradient_Y = (float*) calloc(12, sizeof(float));
+    float * __restrict__ gradient___return = (float*) calloc(1, sizeof(float));
+
+
+    handle = __dace_init_test_single_state_reduce_node_1_axis_and_none_axis();
+    __program_test_single_state_reduce_node_1_axis_and_none_axis(handle, W, X, Y, __return, gradient_W, gradient_X, gradient_Y, gradient___return);
+    __dace_exit_test_single_state_reduce_node_1_axis_and_none_axis(handle);
+
+    free(W);
+    free(X);
+    free(Y);
+    free(__return);
+    free(gradient_W);
+    free(gradient_X);
+    free(gradient_Y);
+    free(gradient___return);
+
+
+    return 0;
+}
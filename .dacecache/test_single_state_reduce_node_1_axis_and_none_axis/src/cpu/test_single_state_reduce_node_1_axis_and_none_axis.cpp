@@ -0,0 +1,519 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct test_single_state_reduce_node_1_axis_and_none_axis_t {
+
+};
+
+inline void _Transpose__sdfg_0_0_17(test_single_state_reduce_node_1_axis_and_none_axis_t *__state, float* _inp, float* _out) {
+
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < 4; __i0 += 1) {
+                for (auto __i1 = 0; __i1 < 5; __i1 += 1) {
+                    {
+                        float __inp = _inp[((5 * __i0) + __i1)];
+                        float __out;
+
+                        ///////////////////
+                        // Tasklet code (transpose)
+                        __out = __inp;
+                        ///////////////////
+
+                        _out[(__i0 + (4 * __i1))] = __out;
+                    }
+                }
+            }
+        }
+
+    }
+    
+}
+
+inline void reduce_1_0_0_19(test_single_state_reduce_node_1_axis_and_none_axis_t *__state, float* _in, float* _out) {
+
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto _o0 = 0; _o0 < 4; _o0 += 1) {
+                for (auto _o1 = 0; _o1 < 3; _o1 += 1) {
+                    {
+                        float __out;
+
+                        ///////////////////
+                        // Tasklet code (reduce_init)
+                        __out = 0;
+                        ///////////////////
+
+                        _out[((3 * _o0) + _o1)] = __out;
+                    }
+                }
+            }
+        }
+
+    }
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto _o0 = 0; _o0 < 4; _o0 += 1) {
+                for (auto _o1 = 0; _o1 < 3; _o1 += 1) {
+                    for (auto _i0 = 0; _i0 < 7; _i0 += 1) {
+                        {
+                            float __inp = _in[(((12 * _i0) + (3 * _o0)) + _o1)];
+                            float __out;
+
+                            ///////////////////
+                            // Tasklet code (identity)
+                            __out = __inp;
+                            ///////////////////
+
+                            dace::wcr_fixed<dace::ReductionType::Sum, float>::reduce_atomic(_out + ((3 * _o0) + _o1), __out);
+                        }
+                    }
+                }
+            }
+        }
+
+    }
+    
+}
+
+inline void _MatMult_gemm_sdfg_0_0_18(test_single_state_reduce_node_1_axis_and_none_axis_t *__state, float* _a, float* _b, float* _c) {
+
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto _o0 = 0; _o0 < 5; _o0 += 1) {
+                for (auto _o1 = 0; _o1 < 3; _o1 += 1) {
+                    {
+                        float out;
+
+                        ///////////////////
+                        // Tasklet code (gemm_init)
+                        out = 0;
+                        ///////////////////
+
+                        _c[((3 * _o0) + _o1)] = out;
+                    }
+                }
+            }
+        }
+
+    }
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < 5; __i0 += 1) {
+                for (auto __i1 = 0; __i1 < 3; __i1 += 1) {
+                    for (auto __i2 = 0; __i2 < 4; __i2 += 1) {
+                        {
+                            float __a = _a[((4 * __i0) + __i2)];
+                            float __b = _b[(__i1 + (3 * __i2))];
+                            float __out;
+
+                            ///////////////////
+                            // Tasklet code (gemm)
+                            __out = (__a * __b);
+                            ///////////////////
+
+                            dace::wcr_fixed<dace::ReductionType::Sum, float>::reduce_atomic(_c + ((3 * __i0) + __i1), __out);
+                        }
+                    }
+                }
+            }
+        }
+
+    }
+    
+}
+
+inline void reduce_0_0_20(test_single_state_reduce_node_1_axis_and_none_axis_t *__state, float* _in, float* _out) {
+
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto _o0 = 0; _o0 < 1; _o0 += 1) {
+                {
+                    float __out;
+
+                    ///////////////////
+                    // Tasklet code (reduce_init)
+                    __out = 0;
+                    ///////////////////
+
+                    _out[_o0] = __out;
+                }
+            }
+        }
+
+    }
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto _i0 = 0; _i0 < 5; _i0 += 1) {
+                for (auto _i1 = 0; _i1 < 3; _i1 += 1) {
+                    {
+                        float __inp = _in[((3 * _i0) + _i1)];
+                        float __out;
+
+                        ///////////////////
+                        // Tasklet code (identity)
+                        __out = __inp;
+                        ///////////////////
+
+                        dace::wcr_fixed<dace::ReductionType::Sum, float>::reduce_atomic(_out, __out);
+                    }
+                }
+            }
+        }
+
+    }
+    
+}
+
+inline void _reverse_ReductionType_Sum__1_0_1_3(test_single_state_reduce_node_1_axis_and_none_axis_t *__state, float* input_gradient, float* output_gradient) {
+
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto i0 = 0; i0 < 5; i0 += 1) {
+                for (auto i1 = 0; i1 < 3; i1 += 1) {
+                    {
+                        float __in = input_gradient[0];
+                        float __out;
+
+                        ///////////////////
+                        // Tasklet code (_distribute_grad_ReductionType_Sum_)
+                        __out = __in;
+                        ///////////////////
+
+                        output_gradient[((3 * i0) + i1)] = __out;
+                    }
+                }
+            }
+        }
+
+    }
+    
+}
+
+inline void _MatMult_gemm_sdfg_backward_0_1_10(test_single_state_reduce_node_1_axis_and_none_axis_t *__state, float* _a, float* _b, float* gradient__c, float* gradient__a, float* gradient__b) {
+
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto i0 = 0; i0 < 4; i0 += 1) {
+                for (auto i1 = 0; i1 < 3; i1 += 1) {
+                    {
+                        float __out;
+
+                        ///////////////////
+                        // Tasklet code (_init_gradient__b_)
+                        __out = 0;
+                        ///////////////////
+
+                        gradient__b[((3 * i0) + i1)] = __out;
+                    }
+                }
+            }
+        }
+
+    }
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto i0 = 0; i0 < 5; i0 += 1) {
+                for (auto i1 = 0; i1 < 4; i1 += 1) {
+                    {
+                        float __out;
+
+                        ///////////////////
+                        // Tasklet code (_init_gradient__a_)
+                        __out = 0;
+                        ///////////////////
+
+                        gradient__a[((4 * i0) + i1)] = __out;
+                    }
+                }
+            }
+        }
+
+    }
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < 5; __i0 += 1) {
+                for (auto __i1 = 0; __i1 < 3; __i1 += 1) {
+                    for (auto __i2 = 0; __i2 < 4; __i2 += 1) {
+                        {
+                            float __out_gradient = gradient__c[((3 * __i0) + __i1)];
+                            float __a = _a[((4 * __i0) + __i2)];
+                            float __b = _b[(__i1 + (3 * __i2))];
+                            float __a_gradient;
+                            float __b_gradient;
+
+                            ///////////////////
+                            // Tasklet code (_gemm_reverse_)
+                            __a_gradient = (__out_gradient * __b);
+                            __b_gradient = (__out_gradient * __a);
+                            ///////////////////
+
+                            dace::wcr_fixed<dace::ReductionType::Sum, float>::reduce_atomic(gradient__a + ((4 * __i0) + __i2), __a_gradient);
+                            dace::wcr_fixed<dace::ReductionType::Sum, float>::reduce_atomic(gradient__b + (__i1 + (3 * __i2)), __b_gradient);
+                        }
+                    }
+                }
+            }
+        }
+
+    }
+    
+}
+
+inline void _Transpose__sdfg_backward_0_1_24(test_single_state_reduce_node_1_axis_and_none_axis_t *__state, float* gradient__out, float* gradient__inp) {
+
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < 4; __i0 += 1) {
+                for (auto __i1 = 0; __i1 < 5; __i1 += 1) {
+                    {
+                        float __out_gradient = gradient__out[(__i0 + (4 * __i1))];
+                        float __inp_gradient;
+
+                        ///////////////////
+                        // Tasklet code (_transpose_reverse_)
+                        __inp_gradient = (__out_gradient * 1);
+                        ///////////////////
+
+                        gradient__inp[((5 * __i0) + __i1)] = __inp_gradient;
+                    }
+                }
+            }
+        }
+
+    }
+    
+}
+
+inline void _reverse_ReductionType_Sum__0_1_21(test_single_state_reduce_node_1_axis_and_none_axis_t *__state, float* input_gradient, float* output_gradient) {
+
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto i0 = 0; i0 < 7; i0 += 1) {
+                for (auto i1 = 0; i1 < 4; i1 += 1) {
+                    for (auto i2 = 0; i2 < 3; i2 += 1) {
+                        {
+                            float __in = input_gradient[((3 * i1) + i2)];
+                            float __out;
+
+                            ///////////////////
+                            // Tasklet code (_distribute_grad_ReductionType_Sum_)
+                            __out = __in;
+                            ///////////////////
+
+                            output_gradient[(((12 * i0) + (3 * i1)) + i2)] = __out;
+                        }
+                    }
+                }
+            }
+        }
+
+    }
+    
+}
+
+void __program_test_single_state_reduce_node_1_axis_and_none_axis_internal(test_single_state_reduce_node_1_axis_and_none_axis_t *__state, float * __restrict__ W, float * __restrict__ X, float * __restrict__ Y, float * __restrict__ __return, float * __restrict__ gradient_W, float * __restrict__ gradient_X, float * __restrict__ gradient_Y, float * __restrict__ gradient___return)
+{
+    float *__tmp1;
+    __tmp1 = new float DACE_ALIGN(64)[12];
+    float *Xt;
+    Xt = new float DACE_ALIGN(64)[20];
+    float *YW;
+    YW = new float DACE_ALIGN(64)[12];
+    float *Z;
+    Z = new float DACE_ALIGN(64)[15];
+
+    {
+        float *Zl;
+        Zl = new float DACE_ALIGN(64)[15];
+        float S;
+
+        _Transpose__sdfg_0_0_17(__state, &X[0], &Xt[0]);
+        reduce_1_0_0_19(__state, &W[0], &__tmp1[0]);
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < 4; __i0 += 1) {
+                for (auto __i1 = 0; __i1 < 3; __i1 += 1) {
+                    {
+                        float __in1 = __tmp1[((3 * __i0) + __i1)];
+                        float __in2 = Y[((3 * __i0) + __i1)];
+                        float __out;
+
+                        ///////////////////
+                        // Tasklet code (_Mult_)
+                        __out = (__in1 * __in2);
+                        ///////////////////
+
+                        YW[((3 * __i0) + __i1)] = __out;
+                    }
+                }
+            }
+        }
+        _MatMult_gemm_sdfg_0_0_18(__state, &Xt[0], &YW[0], &Z[0]);
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < 5; __i0 += 1) {
+                for (auto __i1 = 0; __i1 < 3; __i1 += 1) {
+                    {
+                        float __inp = Z[((3 * __i0) + __i1)];
+                        float __out;
+
+                        ///////////////////
+                        // Tasklet code (_elementwise_)
+                        __out = log((__inp + 1));
+                        ///////////////////
+
+                        Zl[((3 * __i0) + __i1)] = __out;
+                    }
+                }
+            }
+        }
+        reduce_0_0_20(__state, &Zl[0], &S);
+        {
+            float __inp = S;
+            float __out;
+
+            ///////////////////
+            // Tasklet code (assign_575_4)
+            __out = __inp;
+            ///////////////////
+
+            __return[0] = __out;
+        }
+        delete[] Zl;
+
+    }
+    {
+        float gradient_S;
+        float *gradient_Zl;
+        gradient_Zl = new float DACE_ALIGN(64)[15];
+        float *gradient_Z;
+        gradient_Z = new float DACE_ALIGN(64)[15];
+        float *gradient_YW;
+        gradient_YW = new float DACE_ALIGN(64)[12];
+        float *gradient___tmp1;
+        gradient___tmp1 = new float DACE_ALIGN(64)[12];
+        float *gradient_Xt;
+        gradient_Xt = new float DACE_ALIGN(64)[20];
+
+        {
+            float __out_gradient = gradient___return[0];
+            float __inp_gradient;
+
+            ///////////////////
+            // Tasklet code (_assign_575_4_reverse_)
+            __inp_gradient = (__out_gradient * 1);
+            ///////////////////
+
+            gradient_S = __inp_gradient;
+        }
+        _reverse_ReductionType_Sum__1_0_1_3(__state, &gradient_S, &gradient_Zl[0]);
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < 5; __i0 += 1) {
+                for (auto __i1 = 0; __i1 < 3; __i1 += 1) {
+                    {
+                        float __out_gradient = gradient_Zl[((3 * __i0) + __i1)];
+                        float __inp = Z[((3 * __i0) + __i1)];
+                        float __inp_gradient;
+
+                        ///////////////////
+                        // Tasklet code (__elementwise__reverse_)
+                        __inp_gradient = (__out_gradient * (dace::float32(1) / (__inp + dace::float32(1))));
+                        ///////////////////
+
+                        gradient_Z[((3 * __i0) + __i1)] = __inp_gradient;
+                    }
+                }
+            }
+        }
+        _MatMult_gemm_sdfg_backward_0_1_10(__state, &Xt[0], &YW[0], &gradient_Z[0], &gradient_Xt[0], &gradient_YW[0]);
+        _Transpose__sdfg_backward_0_1_24(__state, &gradient_Xt[0], &gradient_X[0]);
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < 4; __i0 += 1) {
+                for (auto __i1 = 0; __i1 < 3; __i1 += 1) {
+                    {
+                        float __out_gradient = gradient_YW[((3 * __i0) + __i1)];
+                        float __in1 = __tmp1[((3 * __i0) + __i1)];
+                        float __in2 = Y[((3 * __i0) + __i1)];
+                        float __in1_gradient;
+                        float __in2_gradient;
+
+                        ///////////////////
+                        // Tasklet code (__Mult__reverse_)
+                        __in1_gradient = (__out_gradient * __in2);
+                        __in2_gradient = (__out_gradient * __in1);
+                        ///////////////////
+
+                        gradient___tmp1[((3 * __i0) + __i1)] = __in1_gradient;
+                        gradient_Y[((3 * __i0) + __i1)] = __in2_gradient;
+                    }
+                }
+            }
+        }
+        _reverse_ReductionType_Sum__0_1_21(__state, &gradient___tmp1[0], &gradient_W[0]);
+        delete[] gradient_Zl;
+        delete[] gradient_Z;
+        delete[] gradient_YW;
+        delete[] gradient___tmp1;
+        delete[] gradient_Xt;
+
+    }
+    delete[] __tmp1;
+    delete[] Xt;
+    delete[] YW;
+    delete[] Z;
+}
+
+DACE_EXPORTED void __program_test_single_state_reduce_node_1_axis_and_none_axis(test_single_state_reduce_node_1_axis_and_none_axis_t *__state, float * __restrict__ W, float * __restrict__ X, float * __restrict__ Y, float * __restrict__ __return, float * __restrict__ gradient_W, float * __restrict__ gradient_X, float * __restrict__ gradient_Y, float * __restrict__ gradient___return)
+{
+    __program_test_single_state_reduce_node_1_axis_and_none_axis_internal(__state, W, X, Y, __return, gradient_W, gradient_X, gradient_Y, gradient___return);
+}
+
+DACE_EXPORTED test_single_state_reduce_node_1_axis_and_none_axis_t *__dace_init_test_single_state_reduce_node_1_axis_and_none_axis()
+{
+    int __result = 0;
+    test_single_state_reduce_node_1_axis_and_none_axis_t *__state = new test_single_state_reduce_node_1_axis_and_none_axis_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED void __dace_exit_test_single_state_reduce_node_1_axis_and_none_axis(test_single_state_reduce_node_1_axis_and_none_axis_t *__state)
+{
+    delete __state;
+}
+
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/test_single_state_single_state_reshape.dir/root/package/.dacecache/test_single_state_single_state_reshape/src/cpu/test_single_state_single_state_reshape.cpp.o"
+  "CMakeFiles/test_single_state_single_state_reshape.dir/root/package/.dacecache/test_single_state_single_state_reshape/src/cpu/test_single_state_single_state_reshape.cpp.o.d"
+  "libtest_single_state_single_state_reshape.pdb"
+  "libtest_single_state_single_state_reshape.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/test_single_state_single_state_reshape.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
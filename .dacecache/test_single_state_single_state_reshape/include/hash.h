@@ -0,0 +1 @@
+#define __HASH_test_single_state_single_state_reshape "4b1cc4f62624b162028f60c5582ce8f232ec777b2527bf454fd179a4e905f35f"
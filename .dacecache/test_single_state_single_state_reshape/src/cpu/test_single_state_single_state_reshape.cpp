@@ -0,0 +1,269 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct test_single_state_single_state_reshape_t {
+
+};
+
+inline void daceml_onnx_op_implementations_pure_implementations_ONNXReshape_expansion_0_0_14(test_single_state_single_state_reshape_t *__state, double* data, double* reshaped) {
+
+    {
+        double* data_0;
+        data_0 = &reshaped[0];
+
+
+        dace::CopyND<double, 1, false, 9>::template ConstDst<1>::Copy(
+        data, data_0, 1);
+
+    }
+    
+}
+
+inline void reduce_0_0_15(test_single_state_single_state_reshape_t *__state, double* _in, double* _out) {
+
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto _o0 = 0; _o0 < 1; _o0 += 1) {
+                {
+                    double __out;
+
+                    ///////////////////
+                    // Tasklet code (reduce_init)
+                    __out = 0;
+                    ///////////////////
+
+                    _out[_o0] = __out;
+                }
+            }
+        }
+
+    }
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto _i0 = 0; _i0 < 3; _i0 += 1) {
+                for (auto _i1 = 0; _i1 < 3; _i1 += 1) {
+                    {
+                        double __inp = _in[((3 * _i0) + _i1)];
+                        double __out;
+
+                        ///////////////////
+                        // Tasklet code (identity)
+                        __out = __inp;
+                        ///////////////////
+
+                        dace::wcr_fixed<dace::ReductionType::Sum, double>::reduce_atomic(_out, __out);
+                    }
+                }
+            }
+        }
+
+    }
+    
+}
+
+inline void _reverse_ReductionType_Sum__0_1_3(test_single_state_single_state_reshape_t *__state, double* input_gradient, double* output_gradient) {
+
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto i0 = 0; i0 < 3; i0 += 1) {
+                for (auto i1 = 0; i1 < 3; i1 += 1) {
+                    {
+                        double __in = input_gradient[0];
+                        double __out;
+
+                        ///////////////////
+                        // Tasklet code (_distribute_grad_ReductionType_Sum_)
+                        __out = __in;
+                        ///////////////////
+
+                        output_gradient[((3 * i0) + i1)] = __out;
+                    }
+                }
+            }
+        }
+
+    }
+    
+}
+
+inline void daceml_onnx_op_implementations_pure_implementations_ONNXReshape_expansion_backward_0_1_15(test_single_state_single_state_reshape_t *__state, double* gradient_reshaped, double* gradient_data) {
+
+    {
+        double* gradient_data_0;
+        gradient_data_0 = &gradient_reshaped[0];
+
+
+        dace::CopyND<double, 1, false, 9>::template ConstDst<1>::Copy(
+        gradient_data_0, gradient_data, 1);
+
+    }
+    
+}
+
+void __program_test_single_state_single_state_reshape_internal(test_single_state_single_state_reshape_t *__state, double * __restrict__ __return, double * __restrict__ bias, double * __restrict__ gradient___return, double * __restrict__ gradient_bias, double * __restrict__ gradient_inp, double * __restrict__ inp, long long * __restrict__ target_shape)
+{
+    double *Z;
+    Z = new double DACE_ALIGN(64)[9];
+
+    {
+        double *reshaped;
+        reshaped = new double DACE_ALIGN(64)[9];
+        double *Zl;
+        Zl = new double DACE_ALIGN(64)[9];
+        double S;
+
+        daceml_onnx_op_implementations_pure_implementations_ONNXReshape_expansion_0_0_14(__state, &inp[0], &reshaped[0]);
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < 3; __i0 += 1) {
+                for (auto __i1 = 0; __i1 < 3; __i1 += 1) {
+                    {
+                        double __in1 = reshaped[((3 * __i0) + __i1)];
+                        double __in2 = bias[__i1];
+                        double __out;
+
+                        ///////////////////
+                        // Tasklet code (_Add_)
+                        __out = (__in1 + __in2);
+                        ///////////////////
+
+                        Z[((3 * __i0) + __i1)] = __out;
+                    }
+                }
+            }
+        }
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < 3; __i0 += 1) {
+                for (auto __i1 = 0; __i1 < 3; __i1 += 1) {
+                    {
+                        double __inp = Z[((3 * __i0) + __i1)];
+                        double __out;
+
+                        ///////////////////
+                        // Tasklet code (_elementwise_)
+                        __out = log((__inp + 1));
+                        ///////////////////
+
+                        Zl[((3 * __i0) + __i1)] = __out;
+                    }
+                }
+            }
+        }
+        reduce_0_0_15(__state, &Zl[0], &S);
+        {
+            double __inp = S;
+            double __out;
+
+            ///////////////////
+            // Tasklet code (assign_665_4)
+            __out = __inp;
+            ///////////////////
+
+            __return[0] = __out;
+        }
+        delete[] reshaped;
+        delete[] Zl;
+
+    }
+    {
+        double gradient_S;
+        double *gradient_Zl;
+        gradient_Zl = new double DACE_ALIGN(64)[9];
+        double *gradient_Z;
+        gradient_Z = new double DACE_ALIGN(64)[9];
+        double *gradient_reshaped;
+        gradient_reshaped = new double DACE_ALIGN(64)[9];
+
+        {
+            double __out_gradient = gradient___return[0];
+            double __inp_gradient;
+
+            ///////////////////
+            // Tasklet code (_assign_665_4_reverse_)
+            __inp_gradient = (__out_gradient * 1);
+            ///////////////////
+
+            gradient_S = __inp_gradient;
+        }
+        _reverse_ReductionType_Sum__0_1_3(__state, &gradient_S, &gradient_Zl[0]);
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < 3; __i0 += 1) {
+                for (auto __i1 = 0; __i1 < 3; __i1 += 1) {
+                    {
+                        double __out_gradient = gradient_Zl[((3 * __i0) + __i1)];
+                        double __inp = Z[((3 * __i0) + __i1)];
+                        double __inp_gradient;
+
+                        ///////////////////
+                        // Tasklet code (__elementwise__reverse_)
+                        __inp_gradient = (__out_gradient * (dace::float64(1) / (__inp + dace::float64(1))));
+                        ///////////////////
+
+                        gradient_Z[((3 * __i0) + __i1)] = __inp_gradient;
+                    }
+                }
+            }
+        }
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < 3; __i0 += 1) {
+                for (auto __i1 = 0; __i1 < 3; __i1 += 1) {
+                    {
+                        double __out_gradient = gradient_Z[((3 * __i0) + __i1)];
+                        double __in1_gradient;
+                        double __in2_gradient;
+
+                        ///////////////////
+                        // Tasklet code (__Add__reverse_)
+                        __in1_gradient = (__out_gradient * 1);
+                        __in2_gradient = (__out_gradient * 1);
+                        ///////////////////
+
+                        gradient_reshaped[((3 * __i0) + __i1)] = __in1_gradient;
+                        dace::wcr_fixed<dace::ReductionType::Sum, double>::reduce_atomic(gradient_bias + __i1, __in2_gradient);
+                    }
+                }
+            }
+        }
+        daceml_onnx_op_implementations_pure_implementations_ONNXReshape_expansion_backward_0_1_15(__state, &gradient_reshaped[0], &gradient_inp[0]);
+        delete[] gradient_Zl;
+        delete[] gradient_Z;
+        delete[] gradient_reshaped;
+
+    }
+    delete[] Z;
+}
+
+DACE_EXPORTED void __program_test_single_state_single_state_reshape(test_single_state_single_state_reshape_t *__state, double * __restrict__ __return, double * __restrict__ bias, double * __restrict__ gradient___return, double * __restrict__ gradient_bias, double * __restrict__ gradient_inp, double * __restrict__ inp, long long * __restrict__ target_shape)
+{
+    __program_test_single_state_single_state_reshape_internal(__state, __return, bias, gradient___return, gradient_bias, gradient_inp, inp, target_shape);
+}
+
+DACE_EXPORTED test_single_state_single_state_reshape_t *__dace_init_test_single_state_single_state_reshape()
+{
+    int __result = 0;
+    test_single_state_single_state_reshape_t *__state = new test_single_state_single_state_reshape_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED void __dace_exit_test_single_state_single_state_reshape(test_single_state_single_state_reshape_t *__state)
+{
+    delete __state;
+}
+
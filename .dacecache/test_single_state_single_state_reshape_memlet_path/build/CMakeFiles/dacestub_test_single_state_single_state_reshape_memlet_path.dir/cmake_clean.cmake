@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/dacestub_test_single_state_single_state_reshape_memlet_path.dir/tools/dacestub.cpp.o"
+  "CMakeFiles/dacestub_test_single_state_single_state_reshape_memlet_path.dir/tools/dacestub.cpp.o.d"
+  "libdacestub_test_single_state_single_state_reshape_memlet_path.pdb"
+  "libdacestub_test_single_state_single_state_reshape_memlet_path.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/dacestub_test_single_state_single_state_reshape_memlet_path.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/test_single_state_single_state_reshape_memlet_path.dir/root/package/.dacecache/test_single_state_single_state_reshape_memlet_path/src/cpu/test_single_state_single_state_reshape_memlet_path.cpp.o"
+  "CMakeFiles/test_single_state_single_state_reshape_memlet_path.dir/root/package/.dacecache/test_single_state_single_state_reshape_memlet_path/src/cpu/test_single_state_single_state_reshape_memlet_path.cpp.o.d"
+  "libtest_single_state_single_state_reshape_memlet_path.pdb"
+  "libtest_single_state_single_state_reshape_memlet_path.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/test_single_state_single_state_reshape_memlet_path.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
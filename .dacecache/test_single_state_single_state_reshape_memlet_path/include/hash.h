@@ -0,0 +1 @@
+#define __HASH_test_single_state_single_state_reshape_memlet_path "26b963bc8a9f7f6bcff0928f675e4145cc272e54dc20bb0d5a0d06059893c318"
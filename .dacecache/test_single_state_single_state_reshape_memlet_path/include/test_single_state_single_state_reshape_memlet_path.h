@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * test_single_state_single_state_reshape_memlet_pathHandle_t;
+extern "C" test_single_state_single_state_reshape_memlet_pathHandle_t __dace_init_test_single_state_single_state_reshape_memlet_path();
+extern "C" void __dace_exit_test_single_state_single_state_reshape_memlet_path(test_single_state_single_state_reshape_memlet_pathHandle_t handle);
+extern "C" void __program_test_single_state_single_state_reshape_memlet_path(test_single_state_single_state_reshape_memlet_pathHandle_t handle, double * __restrict__ __return, double * __restrict__ bias, double * __restrict__ gradient___return, double * __restrict__ gradient_bias, double * __restrict__ gradient_inp1, double * __restrict__ inp1, long long * __restrict__ target_shape);
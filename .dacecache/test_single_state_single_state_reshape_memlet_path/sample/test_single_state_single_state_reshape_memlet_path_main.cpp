@@ -0,0 +1,29 @@
+#include <cstdlib>
+#include "../include/test_single_state_single_state_reshape_memlet_path.h"
+
+int main(int argc, char **argv) {
+    test_single_state_single_state_reshape_memlet_pathHandle_t handle;
+    double * __restrict__ __return = (double*) calloc(1, sizeof(double));
+    double * __restrict__ bias = (double*) calloc(3, sizeof(double));
+    double * __restrict__ gradient___return = (double*) calloc(1, sizeof(double));
+    double * __restrict__ gradient_bias = (double*) calloc(3, sizeof(double));
+    double * __restrict__ gradient_inp1 = (double*) calloc(9, sizeof(double));
+    double * __restrict__ inp1 = (double*) calloc(9, sizeof(double));
+    long long * __restrict__ target_shape = (long long*) calloc(2, sizeof(long long));
+
+
+    handle = __dace_init_test_single_state_single_state_reshape_memlet_path();
+    __program_test_single_state_single_state_reshape_memlet_path(handle, __return, bias, gradient___return, gradient_bias, gradient_inp1, inp1, target_shape);
+    __dace_exit_test_single_state_single_state_reshape_memlet_path(handle);
+
+    free(__return);
+    free(bias);
+    free(gradient___return);
+    free(gradient_bias);
+    free(gradient_inp1);
+    free(inp1);
+    free(target_shape);
+
+
+    return 0;
+}
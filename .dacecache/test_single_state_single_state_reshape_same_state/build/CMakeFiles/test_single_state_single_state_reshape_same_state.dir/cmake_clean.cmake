@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/test_single_state_single_state_reshape_same_state.dir/root/package/.dacecache/test_single_state_single_state_reshape_same_state/src/cpu/test_single_state_single_state_reshape_same_state.cpp.o"
+  "CMakeFiles/test_single_state_single_state_reshape_same_state.dir/root/package/.dacecache/test_single_state_single_state_reshape_same_state/src/cpu/test_single_state_single_state_reshape_same_state.cpp.o.d"
+  "libtest_single_state_single_state_reshape_same_state.pdb"
+  "libtest_single_state_single_state_reshape_same_state.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/test_single_state_single_state_reshape_same_state.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1 @@
+#define __HASH_test_single_state_single_state_reshape_same_state "0f1008efbdafa6cd94b671ad03f7364a063037c74b9545d09f88fe266d58b667"
@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * test_single_state_single_state_reshape_same_stateHandle_t;
+extern "C" test_single_state_single_state_reshape_same_stateHandle_t __dace_init_test_single_state_single_state_reshape_same_state();
+extern "C" void __dace_exit_test_single_state_single_state_reshape_same_state(test_single_state_single_state_reshape_same_stateHandle_t handle);
+extern "C" void __program_test_single_state_single_state_reshape_same_state(test_single_state_single_state_reshape_same_stateHandle_t handle, double * __restrict__ __return, double * __restrict__ gradient___return, double * __restrict__ gradient_inp, double * __restrict__ inp, long long * __restrict__ target_shape);
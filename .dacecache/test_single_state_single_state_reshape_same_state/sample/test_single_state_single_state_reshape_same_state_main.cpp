@@ -0,0 +1,25 @@
+#include <cstdlib>
+#include "../include/test_single_state_single_state_reshape_same_state.h"
+
+int main(int argc, char **argv) {
+    test_single_state_single_state_reshape_same_stateHandle_t handle;
+    double * __restrict__ __return = (double*) calloc(1, sizeof(double));
+    double * __restrict__ gradient___return = (double*) calloc(1, sizeof(double));
+    double * __restrict__ gradient_inp = (double*) calloc(9, sizeof(double));
+    double * __restrict__ inp = (double*) calloc(9, sizeof(double));
+    long long * __restrict__ target_shape = (long long*) calloc(2, sizeof(long long));
+
+
+    handle = __dace_init_test_single_state_single_state_reshape_same_state();
+    __program_test_single_state_single_state_reshape_same_state(handle, __return, gradient___return, gradient_inp, inp, target_shape);
+    __dace_exit_test_single_state_single_state_reshape_same_state(handle);
+
+    free(__return);
+    free(gradient___return);
+    free(gradient_inp);
+    free(inp);
+    free(target_shape);
+
+
+    return 0;
+}
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/dacestub_test_single_state_tasklets_multioutput.dir/tools/dacestub.cpp.o"
+  "CMakeFiles/dacestub_test_single_state_tasklets_multioutput.dir/tools/dacestub.cpp.o.d"
+  "libdacestub_test_single_state_tasklets_multioutput.pdb"
+  "libdacestub_test_single_state_tasklets_multioutput.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/dacestub_test_single_state_tasklets_multioutput.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/test_single_state_tasklets_multioutput.dir/root/package/.dacecache/test_single_state_tasklets_multioutput/src/cpu/test_single_state_tasklets_multioutput.cpp.o"
+  "CMakeFiles/test_single_state_tasklets_multioutput.dir/root/package/.dacecache/test_single_state_tasklets_multioutput/src/cpu/test_single_state_tasklets_multioutput.cpp.o.d"
+  "libtest_single_state_tasklets_multioutput.pdb"
+  "libtest_single_state_tasklets_multioutput.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/test_single_state_tasklets_multioutput.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1 @@
+#define __HASH_test_single_state_tasklets_multioutput "c9e9135e1e6871580b2b033ea11dd3c526f39443a960968dfcde2ad6a61019f2"
@@ -0,0 +1,134 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct test_single_state_tasklets_multioutput_t {
+
+};
+
+void __program_test_single_state_tasklets_multioutput_internal(test_single_state_tasklets_multioutput_t *__state, float * __restrict__ A, float * __restrict__ B, float * __restrict__ C, float * __restrict__ gradient_A, float * __restrict__ gradient_B, float * __restrict__ gradient_C)
+{
+    float tmp_a;
+    float tmp_b;
+    float tmp_d;
+
+    {
+
+        {
+            float a = A[0];
+            float a_out;
+
+            ///////////////////
+            // Tasklet code (test_single_state_425)
+            a_out = sqrt(a);
+            ///////////////////
+
+            tmp_a = a_out;
+        }
+        {
+            float b = B[0];
+            float b_out;
+            float d_out;
+
+            ///////////////////
+            // Tasklet code (test_single_state_431)
+            b_out = log((b + 1));
+            d_out = b;
+            ///////////////////
+
+            tmp_b = b_out;
+            tmp_d = d_out;
+        }
+        {
+            float a = tmp_a;
+            float b = tmp_b;
+            float d = tmp_d;
+            float c;
+
+            ///////////////////
+            // Tasklet code (test_single_state_439)
+            c = ((a * b) * d);
+            ///////////////////
+
+            C[0] = c;
+        }
+
+    }
+    {
+        float gradient_tmp_d;
+        float gradient_tmp_b;
+        float gradient_tmp_a;
+
+        {
+            float c_gradient = gradient_C[0];
+            float a = tmp_a;
+            float b = tmp_b;
+            float d = tmp_d;
+            float d_gradient;
+            float b_gradient;
+            float a_gradient;
+
+            ///////////////////
+            // Tasklet code (_test_single_state_439_reverse_)
+            a_gradient = (c_gradient * (b * d));
+            b_gradient = (c_gradient * (a * d));
+            d_gradient = (c_gradient * (a * b));
+            ///////////////////
+
+            gradient_tmp_d = d_gradient;
+            gradient_tmp_b = b_gradient;
+            gradient_tmp_a = a_gradient;
+        }
+        {
+            float b_out_gradient = gradient_tmp_b;
+            float d_out_gradient = gradient_tmp_d;
+            float b = B[0];
+            float b_gradient;
+
+            ///////////////////
+            // Tasklet code (_test_single_state_431_reverse_)
+            b_gradient = ((b_out_gradient * (dace::float32(1) / (b + dace::float32(1)))) + (d_out_gradient * 1));
+            ///////////////////
+
+            gradient_B[0] = b_gradient;
+        }
+        {
+            float a_out_gradient = gradient_tmp_a;
+            float a = A[0];
+            float a_gradient;
+
+            ///////////////////
+            // Tasklet code (_test_single_state_425_reverse_)
+            a_gradient = (a_out_gradient * (dace::float32(1) / (dace::float32(2) * sqrt(a))));
+            ///////////////////
+
+            gradient_A[0] = a_gradient;
+        }
+
+    }
+}
+
+DACE_EXPORTED void __program_test_single_state_tasklets_multioutput(test_single_state_tasklets_multioutput_t *__state, float * __restrict__ A, float * __restrict__ B, float * __restrict__ C, float * __restrict__ gradient_A, float * __restrict__ gradient_B, float * __restrict__ gradient_C)
+{
+    __program_test_single_state_tasklets_multioutput_internal(__state, A, B, C, gradient_A, gradient_B, gradient_C);
+}
+
+DACE_EXPORTED test_single_state_tasklets_multioutput_t *__dace_init_test_single_state_tasklets_multioutput()
+{
+    int __result = 0;
+    test_single_state_tasklets_multioutput_t *__state = new test_single_state_tasklets_multioutput_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED void __dace_exit_test_single_state_tasklets_multioutput(test_single_state_tasklets_multioutput_t *__state)
+{
+    delete __state;
+}
+
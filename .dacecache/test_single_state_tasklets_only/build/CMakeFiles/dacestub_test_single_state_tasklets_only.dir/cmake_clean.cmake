@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/dacestub_test_single_state_tasklets_only.dir/tools/dacestub.cpp.o"
+  "CMakeFiles/dacestub_test_single_state_tasklets_only.dir/tools/dacestub.cpp.o.d"
+  "libdacestub_test_single_state_tasklets_only.pdb"
+  "libdacestub_test_single_state_tasklets_only.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/dacestub_test_single_state_tasklets_only.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/test_single_state_tasklets_only.dir/root/package/.dacecache/test_single_state_tasklets_only/src/cpu/test_single_state_tasklets_only.cpp.o"
+  "CMakeFiles/test_single_state_tasklets_only.dir/root/package/.dacecache/test_single_state_tasklets_only/src/cpu/test_single_state_tasklets_only.cpp.o.d"
+  "libtest_single_state_tasklets_only.pdb"
+  "libtest_single_state_tasklets_only.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/test_single_state_tasklets_only.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1 @@
+#define __HASH_test_single_state_tasklets_only "387ba2f842fab3a8154ba074d8d02a84edba48dcf5a558d6745cc23aa725c6b7"
@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * test_single_state_tasklets_onlyHandle_t;
+extern "C" test_single_state_tasklets_onlyHandle_t __dace_init_test_single_state_tasklets_only();
+extern "C" void __dace_exit_test_single_state_tasklets_only(test_single_state_tasklets_onlyHandle_t handle);
+extern "C" void __program_test_single_state_tasklets_only(test_single_state_tasklets_onlyHandle_t handle, float * __restrict__ A, float * __restrict__ B, float * __restrict__ C, float * __restrict__ gradient_A, float * __restrict__ gradient_B, float * __restrict__ gradient_C);
@@ -0,0 +1,27 @@
+#include <cstdlib>
+#include "../include/test_single_state_tasklets_only.h"
+
+int main(int argc, char **argv) {
+    test_single_state_tasklets_onlyHandle_t handle;
+    float * __restrict__ A = (float*) calloc(1, sizeof(float));
+    float * __restrict__ B = (float*) calloc(1, sizeof(float));
+    float * __restrict__ C = (float*) calloc(1, sizeof(float));
+    float * __restrict__ gradient_A = (float*) calloc(1, sizeof(float));
+    float * __restrict__ gradient_B = (float*) calloc(1, sizeof(float));
+    float * __restrict__ gradient_C = (float*) calloc(1, sizeof(float));
+
+
+    handle = __dace_init_test_single_state_tasklets_only();
+    __program_test_single_state_tasklets_only(handle, A, B, C, gradient_A, gradient_B, gradient_C);
+    __dace_exit_test_single_state_tasklets_only(handle);
+
+    free(A);
+    free(B);
+    free(C);
+    free(gradient_A);
+    free(gradient_B);
+    free(gradient_C);
+
+
+    return 0;
+}
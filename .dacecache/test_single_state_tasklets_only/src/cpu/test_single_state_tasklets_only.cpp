@@ -0,0 +1,123 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct test_single_state_tasklets_only_t {
+
+};
+
+void __program_test_single_state_tasklets_only_internal(test_single_state_tasklets_only_t *__state, float * __restrict__ A, float * __restrict__ B, float * __restrict__ C, float * __restrict__ gradient_A, float * __restrict__ gradient_B, float * __restrict__ gradient_C)
+{
+    float tmp_a;
+    float tmp_b;
+
+    {
+
+        {
+            float a = A[0];
+            float a_out;
+
+            ///////////////////
+            // Tasklet code (test_single_state_476)
+            a_out = sqrt(a);
+            ///////////////////
+
+            tmp_a = a_out;
+        }
+        {
+            float a = B[0];
+            float a_out;
+
+            ///////////////////
+            // Tasklet code (test_single_state_482)
+            a_out = log((a + 1));
+            ///////////////////
+
+            tmp_b = a_out;
+        }
+        {
+            float b = tmp_b;
+            float a = tmp_a;
+            float c;
+
+            ///////////////////
+            // Tasklet code (test_single_state_488)
+            c = (a * b);
+            ///////////////////
+
+            C[0] = c;
+        }
+
+    }
+    {
+        float gradient_tmp_b;
+        float gradient_tmp_a;
+
+        {
+            float c_gradient = gradient_C[0];
+            float b = tmp_b;
+            float a = tmp_a;
+            float b_gradient;
+            float a_gradient;
+
+            ///////////////////
+            // Tasklet code (_test_single_state_488_reverse_)
+            a_gradient = (c_gradient * b);
+            b_gradient = (c_gradient * a);
+            ///////////////////
+
+            gradient_tmp_b = b_gradient;
+            gradient_tmp_a = a_gradient;
+        }
+        {
+            float a_out_gradient = gradient_tmp_b;
+            float a = B[0];
+            float a_gradient;
+
+            ///////////////////
+            // Tasklet code (_test_single_state_482_reverse_)
+            a_gradient = (a_out_gradient * (dace::float32(1) / (a + dace::float32(1))));
+            ///////////////////
+
+            gradient_B[0] = a_gradient;
+        }
+        {
+            float a_out_gradient = gradient_tmp_a;
+            float a = A[0];
+            float a_gradient;
+
+            ///////////////////
+            // Tasklet code (_test_single_state_476_reverse_)
+            a_gradient = (a_out_gradient * (dace::float32(1) / (dace::float32(2) * sqrt(a))));
+            ///////////////////
+
+            gradient_A[0] = a_gradient;
+        }
+
+    }
+}
+
+DACE_EXPORTED void __program_test_single_state_tasklets_only(test_single_state_tasklets_only_t *__state, float * __restrict__ A, float * __restrict__ B, float * __restrict__ C, float * __restrict__ gradient_A, float * __restrict__ gradient_B, float * __restrict__ gradient_C)
+{
+    __program_test_single_state_tasklets_only_internal(__state, A, B, C, gradient_A, gradient_B, gradient_C);
+}
+
+DACE_EXPORTED test_single_state_tasklets_only_t *__dace_init_test_single_state_tasklets_only()
+{
+    int __result = 0;
+    test_single_state_tasklets_only_t *__state = new test_single_state_tasklets_only_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED void __dace_exit_test_single_state_tasklets_only(test_single_state_tasklets_only_t *__state)
+{
+    delete __state;
+}
+
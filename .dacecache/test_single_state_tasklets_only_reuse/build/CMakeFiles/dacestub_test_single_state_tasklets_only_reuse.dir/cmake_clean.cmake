@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/dacestub_test_single_state_tasklets_only_reuse.dir/tools/dacestub.cpp.o"
+  "CMakeFiles/dacestub_test_single_state_tasklets_only_reuse.dir/tools/dacestub.cpp.o.d"
+  "libdacestub_test_single_state_tasklets_only_reuse.pdb"
+  "libdacestub_test_single_state_tasklets_only_reuse.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/dacestub_test_single_state_tasklets_only_reuse.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
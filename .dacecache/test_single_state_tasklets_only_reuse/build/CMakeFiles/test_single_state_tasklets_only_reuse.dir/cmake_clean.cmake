@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/test_single_state_tasklets_only_reuse.dir/root/package/.dacecache/test_single_state_tasklets_only_reuse/src/cpu/test_single_state_tasklets_only_reuse.cpp.o"
+  "CMakeFiles/test_single_state_tasklets_only_reuse.dir/root/package/.dacecache/test_single_state_tasklets_only_reuse/src/cpu/test_single_state_tasklets_only_reuse.cpp.o.d"
+  "libtest_single_state_tasklets_only_reuse.pdb"
+  "libtest_single_state_tasklets_only_reuse.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/test_single_state_tasklets_only_reuse.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1 @@
+#define __HASH_test_single_state_tasklets_only_reuse "e1bdc13137512bbdbb577cdfeaf72d9613fcfa1d8946a1a30766aee28139e20b"
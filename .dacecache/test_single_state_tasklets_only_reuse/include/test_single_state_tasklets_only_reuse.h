@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * test_single_state_tasklets_only_reuseHandle_t;
+extern "C" test_single_state_tasklets_only_reuseHandle_t __dace_init_test_single_state_tasklets_only_reuse();
+extern "C" void __dace_exit_test_single_state_tasklets_only_reuse(test_single_state_tasklets_only_reuseHandle_t handle);
+extern "C" void __program_test_single_state_tasklets_only_reuse(test_single_state_tasklets_only_reuseHandle_t handle, float * __restrict__ A, float * __restrict__ C, float * __restrict__ gradient_A, float * __restrict__ gradient_C);
@@ -0,0 +1,23 @@
+#include <cstdlib>
+#include "../include/test_single_state_tasklets_only_reuse.h"
+
+int main(int argc, char **argv) {
+    test_single_state_tasklets_only_reuseHandle_t handle;
+    float * __restrict__ A = (float*) calloc(1, sizeof(float));
+    float * __restrict__ C = (float*) calloc(1, sizeof(float));
+    float * __restrict__ gradient_A = (float*) calloc(1, sizeof(float));
+    float * __restrict__ gradient_C = (float*) calloc(1, sizeof(float));
+
+
+    handle = __dace_init_test_single_state_tasklets_only_reuse();
+    __program_test_single_state_tasklets_only_reuse(handle, A, C, gradient_A, gradient_C);
+    __dace_exit_test_single_state_tasklets_only_reuse(handle);
+
+    free(A);
+    free(C);
+    free(gradient_A);
+    free(gradient_C);
+
+
+    return 0;
+}
@@ -0,0 +1,156 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct test_single_state_tasklets_only_reuse_t {
+
+};
+
+inline void sum_gradient_A_0_1_13(test_single_state_tasklets_only_reuse_t *__state, const float& data_0__0, const float& data_0__1, float& sum) {
+
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto i0 = 0; i0 < 1; i0 += 1) {
+                {
+                    float __data_0__0 = data_0__0;
+                    float __data_0__1 = data_0__1;
+                    float __sum;
+
+                    ///////////////////
+                    // Tasklet code (sum_gradient_A_tasklet)
+                    __sum = (__data_0__0 + __data_0__1);
+                    ///////////////////
+
+                    sum = __sum;
+                }
+            }
+        }
+
+    }
+    
+}
+
+void __program_test_single_state_tasklets_only_reuse_internal(test_single_state_tasklets_only_reuse_t *__state, float * __restrict__ A, float * __restrict__ C, float * __restrict__ gradient_A, float * __restrict__ gradient_C)
+{
+    float tmp_a;
+    float tmp_b;
+
+    {
+
+        {
+            float a = A[0];
+            float a_out;
+
+            ///////////////////
+            // Tasklet code (test_single_state_tasklets_379)
+            a_out = sqrt(a);
+            ///////////////////
+
+            tmp_a = a_out;
+        }
+        {
+            float a = A[0];
+            float a_out;
+
+            ///////////////////
+            // Tasklet code (test_single_state_tasklets_385)
+            a_out = log((a + 1));
+            ///////////////////
+
+            tmp_b = a_out;
+        }
+        {
+            float b = tmp_b;
+            float a = tmp_a;
+            float c;
+
+            ///////////////////
+            // Tasklet code (test_single_state_tasklets_391)
+            c = (a * b);
+            ///////////////////
+
+            C[0] = c;
+        }
+
+    }
+    {
+        float gradient_tmp_b;
+        float gradient_tmp_a;
+        float *gradient_A_contribution_0;
+        gradient_A_contribution_0 = new float DACE_ALIGN(64)[1];
+        float *gradient_A_contribution_1;
+        gradient_A_contribution_1 = new float DACE_ALIGN(64)[1];
+
+        {
+            float c_gradient = gradient_C[0];
+            float b = tmp_b;
+            float a = tmp_a;
+            float b_gradient;
+            float a_gradient;
+
+            ///////////////////
+            // Tasklet code (_test_single_state_tasklets_391_reverse_)
+            a_gradient = (c_gradient * b);
+            b_gradient = (c_gradient * a);
+            ///////////////////
+
+            gradient_tmp_b = b_gradient;
+            gradient_tmp_a = a_gradient;
+        }
+        {
+            float a_out_gradient = gradient_tmp_b;
+            float a = A[0];
+            float a_gradient;
+
+            ///////////////////
+            // Tasklet code (_test_single_state_tasklets_385_reverse_)
+            a_gradient = (a_out_gradient * (dace::float32(1) / (a + dace::float32(1))));
+            ///////////////////
+
+            gradient_A_contribution_1[0] = a_gradient;
+        }
+        {
+            float a_out_gradient = gradient_tmp_a;
+            float a = A[0];
+            float a_gradient;
+
+            ///////////////////
+            // Tasklet code (_test_single_state_tasklets_379_reverse_)
+            a_gradient = (a_out_gradient * (dace::float32(1) / (dace::float32(2) * sqrt(a))));
+            ///////////////////
+
+            gradient_A_contribution_0[0] = a_gradient;
+        }
+        sum_gradient_A_0_1_13(__state, gradient_A_contribution_0[0], gradient_A_contribution_1[0], gradient_A[0]);
+        delete[] gradient_A_contribution_0;
+        delete[] gradient_A_contribution_1;
+
+    }
+}
+
+DACE_EXPORTED void __program_test_single_state_tasklets_only_reuse(test_single_state_tasklets_only_reuse_t *__state, float * __restrict__ A, float * __restrict__ C, float * __restrict__ gradient_A, float * __restrict__ gradient_C)
+{
+    __program_test_single_state_tasklets_only_reuse_internal(__state, A, C, gradient_A, gradient_C);
+}
+
+DACE_EXPORTED test_single_state_tasklets_only_reuse_t *__dace_init_test_single_state_tasklets_only_reuse()
+{
+    int __result = 0;
+    test_single_state_tasklets_only_reuse_t *__state = new test_single_state_tasklets_only_reuse_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED void __dace_exit_test_single_state_tasklets_only_reuse(test_single_state_tasklets_only_reuse_t *__state)
+{
+    delete __state;
+}
+
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/test_tasklet_fusion_test_basic_tf.dir/root/package/.dacecache/test_tasklet_fusion_test_basic_tf/src/cpu/test_tasklet_fusion_test_basic_tf.cpp.o"
+  "CMakeFiles/test_tasklet_fusion_test_basic_tf.dir/root/package/.dacecache/test_tasklet_fusion_test_basic_tf/src/cpu/test_tasklet_fusion_test_basic_tf.cpp.o.d"
+  "libtest_tasklet_fusion_test_basic_tf.pdb"
+  "libtest_tasklet_fusion_test_basic_tf.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/test_tasklet_fusion_test_basic_tf.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
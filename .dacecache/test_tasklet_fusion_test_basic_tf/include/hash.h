@@ -0,0 +1 @@
+#define __HASH_test_tasklet_fusion_test_basic_tf "f4023629890a34e7ff35ddcef9b433a3aca415172d9ff5e12ca66368e051e567"
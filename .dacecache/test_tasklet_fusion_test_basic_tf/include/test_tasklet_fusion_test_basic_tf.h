@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * test_tasklet_fusion_test_basic_tfHandle_t;
+extern "C" test_tasklet_fusion_test_basic_tfHandle_t __dace_init_test_tasklet_fusion_test_basic_tf();
+extern "C" void __dace_exit_test_tasklet_fusion_test_basic_tf(test_tasklet_fusion_test_basic_tfHandle_t handle);
+extern "C" void __program_test_tasklet_fusion_test_basic_tf(test_tasklet_fusion_test_basic_tfHandle_t handle, float * __restrict__ __return, float A, float D);
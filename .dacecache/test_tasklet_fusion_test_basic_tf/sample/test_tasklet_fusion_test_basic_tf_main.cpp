@@ -0,0 +1,19 @@
+#include <cstdlib>
+#include "../include/test_tasklet_fusion_test_basic_tf.h"
+
+int main(int argc, char **argv) {
+    test_tasklet_fusion_test_basic_tfHandle_t handle;
+    float A = 42;
+    float D = 42;
+    float * __restrict__ __return = (float*) calloc(1, sizeof(float));
+
+
+    handle = __dace_init_test_tasklet_fusion_test_basic_tf();
+    __program_test_tasklet_fusion_test_basic_tf(handle, __return, A, D);
+    __dace_exit_test_tasklet_fusion_test_basic_tf(handle);
+
+    free(__return);
+
+
+    return 0;
+}
@@ -0,0 +1,76 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct test_tasklet_fusion_test_basic_tf_t {
+
+};
+
+void __program_test_tasklet_fusion_test_basic_tf_internal(test_tasklet_fusion_test_basic_tf_t *__state, float * __restrict__ __return, float A, float D)
+{
+
+    {
+        float B;
+
+        {
+            float a = A;
+            float c;
+
+            ///////////////////
+            // Tasklet code (test_tasklet_fusion_test_125_1)
+            c = (a * 3);
+            ///////////////////
+
+            __return[0] = c;
+        }
+        {
+            float d = D;
+            float b;
+
+            ///////////////////
+            // Tasklet code (test_tasklet_fusion_test_125_0)
+            b = (d + 1);
+            ///////////////////
+
+            B = b;
+        }
+        {
+            float __in1 = __return[0];
+            float __in2 = B;
+            float __out;
+
+            ///////////////////
+            // Tasklet code (augassign_134_4)
+            __out = (__in1 + __in2);
+            ///////////////////
+
+            __return[0] = __out;
+        }
+
+    }
+}
+
+DACE_EXPORTED void __program_test_tasklet_fusion_test_basic_tf(test_tasklet_fusion_test_basic_tf_t *__state, float * __restrict__ __return, float A, float D)
+{
+    __program_test_tasklet_fusion_test_basic_tf_internal(__state, __return, A, D);
+}
+
+DACE_EXPORTED test_tasklet_fusion_test_basic_tf_t *__dace_init_test_tasklet_fusion_test_basic_tf()
+{
+    int __result = 0;
+    test_tasklet_fusion_test_basic_tf_t *__state = new test_tasklet_fusion_test_basic_tf_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED void __dace_exit_test_tasklet_fusion_test_basic_tf(test_tasklet_fusion_test_basic_tf_t *__state)
+{
+    delete __state;
+}
+
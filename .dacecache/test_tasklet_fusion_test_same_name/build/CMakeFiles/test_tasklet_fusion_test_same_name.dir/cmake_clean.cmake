@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/test_tasklet_fusion_test_same_name.dir/root/package/.dacecache/test_tasklet_fusion_test_same_name/src/cpu/test_tasklet_fusion_test_same_name.cpp.o"
+  "CMakeFiles/test_tasklet_fusion_test_same_name.dir/root/package/.dacecache/test_tasklet_fusion_test_same_name/src/cpu/test_tasklet_fusion_test_same_name.cpp.o.d"
+  "libtest_tasklet_fusion_test_same_name.pdb"
+  "libtest_tasklet_fusion_test_same_name.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/test_tasklet_fusion_test_same_name.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
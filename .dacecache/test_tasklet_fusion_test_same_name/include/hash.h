@@ -0,0 +1 @@
+#define __HASH_test_tasklet_fusion_test_same_name "80bbb5c62bbd5208ea2ca430b48e46068f9194c8e113dab147df142e703a51fe"
@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * test_tasklet_fusion_test_same_nameHandle_t;
+extern "C" test_tasklet_fusion_test_same_nameHandle_t __dace_init_test_tasklet_fusion_test_same_name();
+extern "C" void __dace_exit_test_tasklet_fusion_test_same_name(test_tasklet_fusion_test_same_nameHandle_t handle);
+extern "C" void __program_test_tasklet_fusion_test_same_name(test_tasklet_fusion_test_same_nameHandle_t handle, float * __restrict__ A, float * __restrict__ __return);
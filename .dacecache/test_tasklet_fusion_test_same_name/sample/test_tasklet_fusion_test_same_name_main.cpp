@@ -0,0 +1,19 @@
+#include <cstdlib>
+#include "../include/test_tasklet_fusion_test_same_name.h"
+
+int main(int argc, char **argv) {
+    test_tasklet_fusion_test_same_nameHandle_t handle;
+    float * __restrict__ A = (float*) calloc(25, sizeof(float));
+    float * __restrict__ __return = (float*) calloc(25, sizeof(float));
+
+
+    handle = __dace_init_test_tasklet_fusion_test_same_name();
+    __program_test_tasklet_fusion_test_same_name(handle, A, __return);
+    __dace_exit_test_tasklet_fusion_test_same_name(handle);
+
+    free(A);
+    free(__return);
+
+
+    return 0;
+}
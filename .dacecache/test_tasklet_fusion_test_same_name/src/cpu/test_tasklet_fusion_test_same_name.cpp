@@ -0,0 +1,59 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct test_tasklet_fusion_test_same_name_t {
+
+};
+
+void __program_test_tasklet_fusion_test_same_name_internal(test_tasklet_fusion_test_same_name_t *__state, float * __restrict__ A, float * __restrict__ __return)
+{
+
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < 5; __i0 += 1) {
+                for (auto __i1 = 0; __i1 < 5; __i1 += 1) {
+                    {
+                        float __in1 = A[((5 * __i0) + __i1)];
+                        float __out;
+
+                        ///////////////////
+                        // Tasklet code (_Mult__fused__Add__fused__Add_)
+                        __out = ((__in1 + dace::float32(1)) + (__in1 * dace::float32(3)));
+                        ///////////////////
+
+                        __return[((5 * __i0) + __i1)] = __out;
+                    }
+                }
+            }
+        }
+
+    }
+}
+
+DACE_EXPORTED void __program_test_tasklet_fusion_test_same_name(test_tasklet_fusion_test_same_name_t *__state, float * __restrict__ A, float * __restrict__ __return)
+{
+    __program_test_tasklet_fusion_test_same_name_internal(__state, A, __return);
+}
+
+DACE_EXPORTED test_tasklet_fusion_test_same_name_t *__dace_init_test_tasklet_fusion_test_same_name()
+{
+    int __result = 0;
+    test_tasklet_fusion_test_same_name_t *__state = new test_tasklet_fusion_test_same_name_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED void __dace_exit_test_tasklet_fusion_test_same_name(test_tasklet_fusion_test_same_name_t *__state)
+{
+    delete __state;
+}
+
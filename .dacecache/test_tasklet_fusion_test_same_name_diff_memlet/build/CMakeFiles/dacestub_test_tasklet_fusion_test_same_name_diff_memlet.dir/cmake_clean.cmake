@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/dacestub_test_tasklet_fusion_test_same_name_diff_memlet.dir/tools/dacestub.cpp.o"
+  "CMakeFiles/dacestub_test_tasklet_fusion_test_same_name_diff_memlet.dir/tools/dacestub.cpp.o.d"
+  "libdacestub_test_tasklet_fusion_test_same_name_diff_memlet.pdb"
+  "libdacestub_test_tasklet_fusion_test_same_name_diff_memlet.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/dacestub_test_tasklet_fusion_test_same_name_diff_memlet.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
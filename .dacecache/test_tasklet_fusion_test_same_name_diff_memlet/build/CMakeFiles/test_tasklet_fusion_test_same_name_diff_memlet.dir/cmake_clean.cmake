@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/test_tasklet_fusion_test_same_name_diff_memlet.dir/root/package/.dacecache/test_tasklet_fusion_test_same_name_diff_memlet/src/cpu/test_tasklet_fusion_test_same_name_diff_memlet.cpp.o"
+  "CMakeFiles/test_tasklet_fusion_test_same_name_diff_memlet.dir/root/package/.dacecache/test_tasklet_fusion_test_same_name_diff_memlet/src/cpu/test_tasklet_fusion_test_same_name_diff_memlet.cpp.o.d"
+  "libtest_tasklet_fusion_test_same_name_diff_memlet.pdb"
+  "libtest_tasklet_fusion_test_same_name_diff_memlet.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/test_tasklet_fusion_test_same_name_diff_memlet.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
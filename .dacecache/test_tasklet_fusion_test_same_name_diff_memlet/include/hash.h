@@ -0,0 +1 @@
+#define __HASH_test_tasklet_fusion_test_same_name_diff_memlet "468a7b74aaa2a1d83c596498a10a8e3e34c7b19e259afec18236fc9764179648"
@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * test_tasklet_fusion_test_same_name_diff_memletHandle_t;
+extern "C" test_tasklet_fusion_test_same_name_diff_memletHandle_t __dace_init_test_tasklet_fusion_test_same_name_diff_memlet();
+extern "C" void __dace_exit_test_tasklet_fusion_test_same_name_diff_memlet(test_tasklet_fusion_test_same_name_diff_memletHandle_t handle);
+extern "C" void __program_test_tasklet_fusion_test_same_name_diff_memlet(test_tasklet_fusion_test_same_name_diff_memletHandle_t handle, float * __restrict__ A, float * __restrict__ B, float * __restrict__ __return);
@@ -0,0 +1,21 @@
+#include <cstdlib>
+#include "../include/test_tasklet_fusion_test_same_name_diff_memlet.h"
+
+int main(int argc, char **argv) {
+    test_tasklet_fusion_test_same_name_diff_memletHandle_t handle;
+    float * __restrict__ A = (float*) calloc(25, sizeof(float));
+    float * __restrict__ B = (float*) calloc(25, sizeof(float));
+    float * __restrict__ __return = (float*) calloc(25, sizeof(float));
+
+
+    handle = __dace_init_test_tasklet_fusion_test_same_name_diff_memlet();
+    __program_test_tasklet_fusion_test_same_name_diff_memlet(handle, A, B, __return);
+    __dace_exit_test_tasklet_fusion_test_same_name_diff_memlet(handle);
+
+    free(A);
+    free(B);
+    free(__return);
+
+
+    return 0;
+}
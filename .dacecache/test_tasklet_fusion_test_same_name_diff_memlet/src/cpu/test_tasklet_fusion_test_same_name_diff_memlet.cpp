@@ -0,0 +1,60 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct test_tasklet_fusion_test_same_name_diff_memlet_t {
+
+};
+
+void __program_test_tasklet_fusion_test_same_name_diff_memlet_internal(test_tasklet_fusion_test_same_name_diff_memlet_t *__state, float * __restrict__ A, float * __restrict__ B, float * __restrict__ __return)
+{
+
+    {
+
+        {
+            #pragma omp parallel for
+            for (auto __i0 = 0; __i0 < 5; __i0 += 1) {
+                for (auto __i1 = 0; __i1 < 5; __i1 += 1) {
+                    {
+                        float __in1_0 = B[((5 * __i0) + __i1)];
+                        float __in1 = A[((5 * __i0) + __i1)];
+                        float __out;
+
+                        ///////////////////
+                        // Tasklet code (_Mult__fused__Add__fused__Add_)
+                        __out = ((__in1 + dace::float32(1)) + (__in1_0 * dace::float32(3)));
+                        ///////////////////
+
+                        __return[((5 * __i0) + __i1)] = __out;
+                    }
+                }
+            }
+        }
+
+    }
+}
+
+DACE_EXPORTED void __program_test_tasklet_fusion_test_same_name_diff_memlet(test_tasklet_fusion_test_same_name_diff_memlet_t *__state, float * __restrict__ A, float * __restrict__ B, float * __restrict__ __return)
+{
+    __program_test_tasklet_fusion_test_same_name_diff_memlet_internal(__state, A, B, __return);
+}
+
+DACE_EXPORTED test_tasklet_fusion_test_same_name_diff_memlet_t *__dace_init_test_tasklet_fusion_test_same_name_diff_memlet()
+{
+    int __result = 0;
+    test_tasklet_fusion_test_same_name_diff_memlet_t *__state = new test_tasklet_fusion_test_same_name_diff_memlet_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED void __dace_exit_test_tasklet_fusion_test_same_name_diff_memlet(test_tasklet_fusion_test_same_name_diff_memlet_t *__state)
+{
+    delete __state;
+}
+
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/test_tasklet_fusion_test_tf_multiline.dir/root/package/.dacecache/test_tasklet_fusion_test_tf_multiline/src/cpu/test_tasklet_fusion_test_tf_multiline.cpp.o"
+  "CMakeFiles/test_tasklet_fusion_test_tf_multiline.dir/root/package/.dacecache/test_tasklet_fusion_test_tf_multiline/src/cpu/test_tasklet_fusion_test_tf_multiline.cpp.o.d"
+  "libtest_tasklet_fusion_test_tf_multiline.pdb"
+  "libtest_tasklet_fusion_test_tf_multiline.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/test_tasklet_fusion_test_tf_multiline.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1 @@
+#define __HASH_test_tasklet_fusion_test_tf_multiline "101c485aed2fd7d1fce47d4ae605a0e465e647e2c5e38e31899d32032cc8dd15"
@@ -0,0 +1,5 @@
+#include <dace/dace.h>
+typedef void * test_tasklet_fusion_test_tf_multilineHandle_t;
+extern "C" test_tasklet_fusion_test_tf_multilineHandle_t __dace_init_test_tasklet_fusion_test_tf_multiline();
+extern "C" void __dace_exit_test_tasklet_fusion_test_tf_multiline(test_tasklet_fusion_test_tf_multilineHandle_t handle);
+extern "C" void __program_test_tasklet_fusion_test_tf_multiline(test_tasklet_fusion_test_tf_multilineHandle_t handle, float * __restrict__ __return, float A);
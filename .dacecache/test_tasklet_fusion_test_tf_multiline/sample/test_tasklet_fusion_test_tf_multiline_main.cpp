@@ -0,0 +1,18 @@
+#include <cstdlib>
+#include "../include/test_tasklet_fusion_test_tf_multiline.h"
+
+int main(int argc, char **argv) {
+    test_tasklet_fusion_test_tf_multilineHandle_t handle;
+    float A = 42;
+    float * __restrict__ __return = (float*) calloc(1, sizeof(float));
+
+
+    handle = __dace_init_test_tasklet_fusion_test_tf_multiline();
+    __program_test_tasklet_fusion_test_tf_multiline(handle, __return, A);
+    __dace_exit_test_tasklet_fusion_test_tf_multiline(handle);
+
+    free(__return);
+
+
+    return 0;
+}
@@ -0,0 +1,73 @@
+/* DaCe AUTO-GENERATED FILE. DO NOT MODIFY */
+#include <dace/dace.h>
+#include "../../include/hash.h"
+
+struct test_tasklet_fusion_test_tf_multiline_t {
+
+};
+
+void __program_test_tasklet_fusion_test_tf_multiline_internal(test_tasklet_fusion_test_tf_multiline_t *__state, float * __restrict__ __return, float A)
+{
+
+    {
+        float *D;
+        D = new float DACE_ALIGN(64)[1];
+        float *C;
+        C = new float DACE_ALIGN(64)[1];
+
+        {
+            float __in1 = A;
+            float c;
+            float d;
+
+            ///////////////////
+            // Tasklet code (_Add__fused_test_tasklet_fusion_test_153)
+            d = ((dace::float64(__in1) + dace::float64(1)) * 3);
+            c = ((dace::float64(__in1) + dace::float64(1)) + 3);
+            ///////////////////
+
+            C[0] = c;
+            D[0] = d;
+        }
+        {
+            float __in1 = C[0];
+            float __in2 = D[0];
+            float __out;
+
+            ///////////////////
+            // Tasklet code (_Add_)
+            __out = (__in1 + __in2);
+            ///////////////////
+
+            __return[0] = __out;
+        }
+        delete[] D;
+        delete[] C;
+
+    }
+}
+
+DACE_EXPORTED void __program_test_tasklet_fusion_test_tf_multiline(test_tasklet_fusion_test_tf_multiline_t *__state, float * __restrict__ __return, float A)
+{
+    __program_test_tasklet_fusion_test_tf_multiline_internal(__state, __return, A);
+}
+
+DACE_EXPORTED test_tasklet_fusion_test_tf_multiline_t *__dace_init_test_tasklet_fusion_test_tf_multiline()
+{
+    int __result = 0;
+    test_tasklet_fusion_test_tf_multiline_t *__state = new test_tasklet_fusion_test_tf_multiline_t;
+
+
+
+    if (__result) {
+        delete __state;
+        return nullptr;
+    }
+    return __state;
+}
+
+DACE_EXPORTED void __dace_exit_test_tasklet_fusion_test_tf_multiline(test_tasklet_fusion_test_tf_multiline_t *__state)
+{
+    delete __state;
+}
+
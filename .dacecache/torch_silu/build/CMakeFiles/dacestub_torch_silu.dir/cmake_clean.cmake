@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/dacestub_torch_silu.dir/tools/dacestub.cpp.o"
+  "CMakeFiles/dacestub_torch_silu.dir/tools/dacestub.cpp.o.d"
+  "libdacestub_torch_silu.pdb"
+  "libdacestub_torch_silu.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/dacestub_torch_silu.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/torch_silu.dir/root/package/.dacecache/torch_silu/src/cpu/torch_silu.cpp.o"
+  "CMakeFiles/torch_silu.dir/root/package/.dacecache/torch_silu/src/cpu/torch_silu.cpp.o.d"
+  "libtorch_silu.pdb"
+  "libtorch_silu.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/torch_silu.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
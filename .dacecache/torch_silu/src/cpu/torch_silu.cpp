@@ -0,0 +1,53 @@
+
+
+#include <torch/torch.h>
+#include <torch/script.h>
+#include "silu.h"
+
+using torch::Tensor;
+using torch::DeviceType;
+using torch::autograd::tensor_list;
+using torch::autograd::variable_list;
+using torch::autograd::AutogradContext;
+
+TORCH_LIBRARY(daceml_silu, m) {
+    m.def("silu(int handle_ptr, Tensor x) -> Tensor");
+}
+
+
+// function definition
+Tensor
+silu(int64_t handle_ptr, const Tensor& x_) {
+    
+    // initialize outputs
+    Tensor __return = torch::empty(
+    {3, 3},
+    torch::TensorOptions()
+    .dtype(torch::kFloat32)
+    .device(torch::kCPU)
+    .layout(torch::kStrided));
+    
+    
+    
+    // setup input and output pointers
+    
+    Tensor x = x_.contiguous();
+    float *x_ptr = reinterpret_cast<float*>(x.data_ptr<float>());
+    float *__return_ptr = reinterpret_cast<float*>(__return.data_ptr<float>());
+    // setup constant arguments
+    
+    
+    // get SDFG state handle
+    siluHandle_t handle = reinterpret_cast<siluHandle_t>(handle_ptr);
+    
+    // call SDFG
+    __program_silu(handle, __return_ptr, x_ptr);
+    
+    // return to torch
+    return __return;
+}
+
+TORCH_LIBRARY_IMPL(daceml_silu, CPU, m) {
+    m.impl("silu", silu);
+}
+
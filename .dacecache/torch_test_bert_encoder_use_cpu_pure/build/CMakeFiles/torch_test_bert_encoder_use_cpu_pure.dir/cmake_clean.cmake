@@ -0,0 +1,11 @@
+file(REMOVE_RECURSE
+  "CMakeFiles/torch_test_bert_encoder_use_cpu_pure.dir/root/package/.dacecache/torch_test_bert_encoder_use_cpu_pure/src/cpu/torch_test_bert_encoder_use_cpu_pure.cpp.o"
+  "CMakeFiles/torch_test_bert_encoder_use_cpu_pure.dir/root/package/.dacecache/torch_test_bert_encoder_use_cpu_pure/src/cpu/torch_test_bert_encoder_use_cpu_pure.cpp.o.d"
+  "libtorch_test_bert_encoder_use_cpu_pure.pdb"
+  "libtorch_test_bert_encoder_use_cpu_pure.so"
+)
+
+# Per-language clean rules from dependency scanning.
+foreach(lang CXX)
+  include(CMakeFiles/torch_test_bert_encoder_use_cpu_pure.dir/cmake_clean_${lang}.cmake OPTIONAL)
+endforeach()
@@ -0,0 +1 @@
+cmake  "/root/py38/lib/python3.8/site-packages/dace/codegen" -DDACE_SRC_DIR="/root/package/.dacecache/torch_test_bert_encoder_use_cpu_pure/src" -DDACE_FILES="cpu/torch_test_bert_encoder_use_cpu_pure.cpp" -DDACE_PROGRAM_NAME=torch_test_bert_encoder_use_cpu_pure -DDACE_ENV_CMAKE_FILES="" -DDACE_ENV_COMPILE_FLAGS="-D_GLIBCXX_USE_CXX11_ABI=0" -DDACE_ENV_INCLUDES="/root/package/.dacecache/test_bert_encoder_use_cpu_pure/include /root/py38/lib/python3.8/site-packages/torch/include /root/py38/lib/python3.8/site-packages/torch/include/TH /root/py38/lib/python3.8/site-packages/torch/include/THC /root/py38/lib/python3.8/site-packages/torch/include/torch/csrc/api/include" -DDACE_ENV_LIBRARIES="/root/package/.dacecache/test_bert_encoder_use_cpu_pure/build/libtest_bert_encoder_use_cpu_pure.so /root/py38/lib/python3.8/site-packages/torch/lib/libc10.so /root/py38/lib/python3.8/site-packages/torch/lib/libtorch.so /root/py38/lib/python3.8/site-packages/torch/lib/libtorch_cpu.so /root/py38/lib/python3.8/site-packages/torch/lib/libtorch_python.so" -DDACE_ENV_MINIMUM_VERSION=0 -DDACE_ENV_PACKAGES="" -DDACE_ENV_VAR_KEYS="" -DDACE_ENV_VAR_VALUES="" -DCMAKE_CXX_FLAGS="-std=c++14 -fPIC -Wall -Wextra -O3 -march=native -ffast-math -Wno-unused-parameter -Wno-unused-label" -DDACE_LIBS="" -DCMAKE_SHARED_LINKER_FLAGS="-Wl,--disable-new-dtags"
\ No newline at end of file
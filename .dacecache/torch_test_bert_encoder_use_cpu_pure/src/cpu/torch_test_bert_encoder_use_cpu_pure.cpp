@@ -0,0 +1,93 @@
+
+
+#include <torch/torch.h>
+#include <torch/script.h>
+#include "test_bert_encoder_use_cpu_pure.h"
+
+using torch::Tensor;
+using torch::DeviceType;
+using torch::autograd::tensor_list;
+using torch::autograd::variable_list;
+using torch::autograd::AutogradContext;
+
+TORCH_LIBRARY(daceml_test_bert_encoder_use_cpu_pure, m) {
+    m.def("test_bert_encoder_use_cpu_pure(int handle_ptr, Tensor inputDOT1, Tensor attentionDOTselfDOTqueryDOTweight, Tensor attentionDOTselfDOTqueryDOTbias, Tensor attentionDOTselfDOTkeyDOTweight, Tensor attentionDOTselfDOTkeyDOTbias, Tensor attentionDOTselfDOTvalueDOTweight, Tensor attentionDOTselfDOTvalueDOTbias, Tensor attentionDOToutputDOTdenseDOTweight, Tensor attentionDOToutputDOTdenseDOTbias, Tensor attentionDOToutputDOTLayerNormDOTweight, Tensor attentionDOToutputDOTLayerNormDOTbias, Tensor intermediateDOTdenseDOTweight, Tensor intermediateDOTdenseDOTbias, Tensor outputDOTdenseDOTweight, Tensor outputDOTdenseDOTbias, Tensor outputDOTLayerNormDOTweight, Tensor outputDOTLayerNormDOTbias) -> Tensor");
+}
+
+
+// function definition
+Tensor
+test_bert_encoder_use_cpu_pure(int64_t handle_ptr, const Tensor& inputDOT1_,const Tensor& attentionDOTselfDOTqueryDOTweight_,const Tensor& attentionDOTselfDOTqueryDOTbias_,const Tensor& attentionDOTselfDOTkeyDOTweight_,const Tensor& attentionDOTselfDOTkeyDOTbias_,const Tensor& attentionDOTselfDOTvalueDOTweight_,const Tensor& attentionDOTselfDOTvalueDOTbias_,const Tensor& attentionDOToutputDOTdenseDOTweight_,const Tensor& attentionDOToutputDOTdenseDOTbias_,const Tensor& attentionDOToutputDOTLayerNormDOTweight_,const Tensor& attentionDOToutputDOTLayerNormDOTbias_,const Tensor& intermediateDOTdenseDOTweight_,const Tensor& intermediateDOTdenseDOTbias_,const Tensor& outputDOTdenseDOTweight_,const Tensor& outputDOTdenseDOTbias_,const Tensor& outputDOTLayerNormDOTweight_,const Tensor& outputDOTLayerNormDOTbias_) {
+    
+    // initialize outputs
+    Tensor __return = torch::empty(
+    {8, 512, 768},
+    torch::TensorOptions()
+    .dtype(torch::kFloat32)
+    .device(torch::kCPU)
+    .layout(torch::kStrided));
+    
+    
+    
+    // setup input and output pointers
+    
+    Tensor attentionDOToutputDOTLayerNormDOTbias = attentionDOToutputDOTLayerNormDOTbias_.contiguous();
+    float *attentionDOToutputDOTLayerNormDOTbias_ptr = reinterpret_cast<float*>(attentionDOToutputDOTLayerNormDOTbias.data_ptr<float>());
+    Tensor attentionDOToutputDOTLayerNormDOTweight = attentionDOToutputDOTLayerNormDOTweight_.contiguous();
+    float *attentionDOToutputDOTLayerNormDOTweight_ptr = reinterpret_cast<float*>(attentionDOToutputDOTLayerNormDOTweight.data_ptr<float>());
+    Tensor attentionDOToutputDOTdenseDOTbias = attentionDOToutputDOTdenseDOTbias_.contiguous();
+    float *attentionDOToutputDOTdenseDOTbias_ptr = reinterpret_cast<float*>(attentionDOToutputDOTdenseDOTbias.data_ptr<float>());
+    Tensor attentionDOToutputDOTdenseDOTweight = attentionDOToutputDOTdenseDOTweight_.contiguous();
+    float *attentionDOToutputDOTdenseDOTweight_ptr = reinterpret_cast<float*>(attentionDOToutputDOTdenseDOTweight.data_ptr<float>());
+    Tensor attentionDOTselfDOTkeyDOTbias = attentionDOTselfDOTkeyDOTbias_.contiguous();
+    float *attentionDOTselfDOTkeyDOTbias_ptr = reinterpret_cast<float*>(attentionDOTselfDOTkeyDOTbias.data_ptr<float>());
+    Tensor attentionDOTselfDOTkeyDOTweight = attentionDOTselfDOTkeyDOTweight_.contiguous();
+    float *attentionDOTselfDOTkeyDOTweight_ptr = reinterpret_cast<float*>(attentionDOTselfDOTkeyDOTweight.data_ptr<float>());
+    Tensor attentionDOTselfDOTqueryDOTbias = attentionDOTselfDOTqueryDOTbias_.contiguous();
+    float *attentionDOTselfDOTqueryDOTbias_ptr = reinterpret_cast<float*>(attentionDOTselfDOTqueryDOTbias.data_ptr<float>());
+    Tensor attentionDOTselfDOTqueryDOTweight = attentionDOTselfDOTqueryDOTweight_.contiguous();
+    float *attentionDOTselfDOTqueryDOTweight_ptr = reinterpret_cast<float*>(attentionDOTselfDOTqueryDOTweight.data_ptr<float>());
+    Tensor attentionDOTselfDOTvalueDOTbias = attentionDOTselfDOTvalueDOTbias_.contiguous();
+    float *attentionDOTselfDOTvalueDOTbias_ptr = reinterpret_cast<float*>(attentionDOTselfDOTvalueDOTbias.data_ptr<float>());
+    Tensor attentionDOTselfDOTvalueDOTweight = attentionDOTselfDOTvalueDOTweight_.contiguous();
+    float *attentionDOTselfDOTvalueDOTweight_ptr = reinterpret_cast<float*>(attentionDOTselfDOTvalueDOTweight.data_ptr<float>());
+    Tensor inputDOT1 = inputDOT1_.contiguous();
+    float *inputDOT1_ptr = reinterpret_cast<float*>(inputDOT1.data_ptr<float>());
+    Tensor intermediateDOTdenseDOTbias = intermediateDOTdenseDOTbias_.contiguous();
+    float *intermediateDOTdenseDOTbias_ptr = reinterpret_cast<float*>(intermediateDOTdenseDOTbias.data_ptr<float>());
+    Tensor intermediateDOTdenseDOTweight = intermediateDOTdenseDOTweight_.contiguous();
+    float *intermediateDOTdenseDOTweight_ptr = reinterpret_cast<float*>(intermediateDOTdenseDOTweight.data_ptr<float>());
+    Tensor outputDOTLayerNormDOTbias = outputDOTLayerNormDOTbias_.contiguous();
+    float *outputDOTLayerNormDOTbias_ptr = reinterpret_cast<float*>(outputDOTLayerNormDOTbias.data_ptr<float>());
+    Tensor outputDOTLayerNormDOTweight = outputDOTLayerNormDOTweight_.contiguous();
+    float *outputDOTLayerNormDOTweight_ptr = reinterpret_cast<float*>(outputDOTLayerNormDOTweight.data_ptr<float>());
+    Tensor outputDOTdenseDOTbias = outputDOTdenseDOTbias_.contiguous();
+    float *outputDOTdenseDOTbias_ptr = reinterpret_cast<float*>(outputDOTdenseDOTbias.data_ptr<float>());
+    Tensor outputDOTdenseDOTweight = outputDOTdenseDOTweight_.contiguous();
+    float *outputDOTdenseDOTweight_ptr = reinterpret_cast<float*>(outputDOTdenseDOTweight.data_ptr<float>());
+    float *__return_ptr = reinterpret_cast<float*>(__return.data_ptr<float>());
+    // setup constant arguments
+    float ONNX_107_ptr = 1.4142135381698608;
+    float ONNX_110_ptr = 1.0;
+    float ONNX_113_ptr = 0.5;
+    long long *ONNX_35_ptr = nullptr;
+    float ONNX_72_ptr = 8.0;
+    long long *ONNX_87_ptr = nullptr;
+    float ONNX_95_ptr = 2.0;
+    float ONNX_98_ptr = 9.999999960041972e-13;
+    
+    
+    // get SDFG state handle
+    test_bert_encoder_use_cpu_pureHandle_t handle = reinterpret_cast<test_bert_encoder_use_cpu_pureHandle_t>(handle_ptr);
+    
+    // call SDFG
+    __program_test_bert_encoder_use_cpu_pure(handle, ONNX_35_ptr, ONNX_87_ptr, __return_ptr, attentionDOToutputDOTLayerNormDOTbias_ptr, attentionDOToutputDOTLayerNormDOTweight_ptr, attentionDOToutputDOTdenseDOTbias_ptr, attentionDOToutputDOTdenseDOTweight_ptr, attentionDOTselfDOTkeyDOTbias_ptr, attentionDOTselfDOTkeyDOTweight_ptr, attentionDOTselfDOTqueryDOTbias_ptr, attentionDOTselfDOTqueryDOTweight_ptr, attentionDOTselfDOTvalueDOTbias_ptr, attentionDOTselfDOTvalueDOTweight_ptr, inputDOT1_ptr, intermediateDOTdenseDOTbias_ptr, intermediateDOTdenseDOTweight_ptr, outputDOTLayerNormDOTbias_ptr, outputDOTLayerNormDOTweight_ptr, outputDOTdenseDOTbias_ptr, outputDOTdenseDOTweight_ptr, ONNX_107_ptr, ONNX_110_ptr, ONNX_113_ptr, ONNX_72_ptr, ONNX_95_ptr, ONNX_98_ptr);
+    
+    // return to torch
+    return __return;
+}
+
+TORCH_LIBRARY_IMPL(daceml_test_bert_encoder_use_cpu_pure, CPU, m) {
+    m.impl("test_bert_encoder_use_cpu_pure", test_bert_encoder_use_cpu_pure);
+}
+
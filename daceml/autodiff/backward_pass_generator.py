@@ -22,7 +22,8 @@ from dace.sdfg import graph as dgraph, state as dstate, utils as dutils, infer_t
 
 from daceml.autodiff.base_abc import (BackwardContext, BackwardResult,
                                       AutoDiffException,
-                                      find_backward_implementation)
+                                      find_backward_implementation,
+                                      BackwardImplementation)
 from daceml.autodiff.utils import cast_consts_to_type
 from daceml.onnx.forward_implementation_abc import ONNXForward
 from daceml.onnx.nodes.onnx_op import ONNXOp, ONNXSum
@@ -377,6 +378,10 @@ class BackwardPassGenerator:
         #: mapping from forward_node -> BackwardResult for that node
         self.result_map: Dict[nd.Node, BackwardResult] = {}
 
+        #: memoized results of find_backward_implementation for (forward state, forward node) pairs
+        self._backward_impl_cache: Dict[Tuple[SDFGState, nd.Node],
+                                        Optional[BackwardImplementation]] = {}
+
         #: mapping from forward name to gradient name for arrays
         self.array_grad_map: Dict[str, str] = array_grad_map or {}
 
@@ -432,8 +437,9 @@ class BackwardPassGenerator:
                 state = state.graph
 
             # check if the node exists in the backward implementation repository
-            if find_backward_implementation(state.parent, state,
-                                            node) is not None:
+            if find_backward_implementation(
+                    state.parent, state, node,
+                    cache=self._backward_impl_cache) is not None:
                 continue
 
             # only check others if we didn't break out of the above loop
@@ -1063,7 +1069,8 @@ class BackwardPassGenerator:
         # (2)
         impl = find_backward_implementation(self.sdfg,
                                             forward_state=self.forward_state,
-                                            node=node)
+                                            node=node,
+                                            cache=self._backward_impl_cache)
         if impl is not None:
             backward_node, backward_result = impl.backward(
                 forward_node=node,
@@ -108,32 +108,102 @@ class BackwardImplementation(abc.ABC):
 
 
 # register the implementations
-import daceml.autodiff.implementations
+# whether the builtin implementations in daceml.autodiff.implementations have been registered
+_impls_loaded = False
+
+
+def _ensure_impls():
+    """ Import the builtin backward implementations, registering them. This is deferred until the first lookup so
+        that forward-only users don't pay for the import.
+    """
+    global _impls_loaded
+    if not _impls_loaded:
+        import daceml.autodiff.implementations
+        _impls_loaded = True
+
+
+# dispatch tables from node types and ONNX op names to the registered implementations. Each entry is a tuple of the
+# rank of the implementation, its name and the implementation. The builtin implementations rank before all others,
+# since they are registered lazily but used to always be registered first; otherwise the implementations are ranked
+# by registration order. The tables are rebuilt whenever the number of registered implementations changes.
+_impls_by_type: typing.Dict[type, typing.List[typing.Tuple[
+    int, str, typing.Type[BackwardImplementation]]]] = {}
+_impls_by_op: typing.Dict[str, typing.List[typing.Tuple[
+    int, str, typing.Type[BackwardImplementation]]]] = {}
+_num_registered_impls = -1
+
+
+def _is_builtin(impl: typing.Type[BackwardImplementation]) -> bool:
+    return impl.__module__.startswith("daceml.autodiff.implementations")
+
+
+def _update_dispatch_tables():
+    global _num_registered_impls
+
+    extensions = BackwardImplementation.extensions()
+    if len(extensions) == _num_registered_impls:
+        return
+
+    _impls_by_type.clear()
+    _impls_by_op.clear()
+    ordered_extensions = sorted(extensions.items(),
+                                key=lambda item: not _is_builtin(item[0]))
+    for rank, (impl, args) in enumerate(ordered_extensions):
+        if "name" not in args:
+            raise ValueError(
+                f"Expected name in arguments of implementation {impl}.")
+
+        entry = (rank, args["name"], impl)
+        if "node_type" in args:
+            _impls_by_type.setdefault(args["node_type"], []).append(entry)
+        if "op" in args:
+            _impls_by_op.setdefault(args["op"], []).append(entry)
+
+    _num_registered_impls = len(extensions)
 
 
 def find_backward_implementation(
-        forward_sdfg: SDFG, forward_state: SDFGState,
-        node: nd.Node) -> typing.Optional[BackwardImplementation]:
+    forward_sdfg: SDFG,
+    forward_state: SDFGState,
+    node: nd.Node,
+    cache: typing.Optional[typing.Dict[typing.Tuple[
+        SDFGState, nd.Node], typing.Optional[BackwardImplementation]]] = None
+) -> typing.Optional[BackwardImplementation]:
     """ Try to find the backward implementation for ``node``.
 
         :forward_sdfg: the parent sdfg of the node.
         :forward_state: the parent sdfg state of the node.
         :node: the node to find the implementation for.
+        :cache: if passed, results are memoized per (forward_state, node) pair in this dictionary. Since the
+                applicability of an implementation can depend on the surrounding graph, a cache should not be
+                reused once the forward SDFG has been modified.
         :return: the BackwardImplementation for node if one is registered and can be applied, else node.
     """
+    if cache is not None:
+        # the node is used in the key (rather than its id) so that it is kept alive while cached. The state
+        # determines the sdfg, so it is enough to tell apart the contexts the node is queried in.
+        key = (forward_state, node)
+        if key not in cache:
+            cache[key] = find_backward_implementation(forward_sdfg,
+                                                      forward_state, node)
+        return cache[key]
+
+    _ensure_impls()
+    _update_dispatch_tables()
+
+    # collect the candidates, deduplicated and in registration order
+    candidates = {}
+    for node_type in type(node).__mro__:
+        for entry in _impls_by_type.get(node_type, ()):
+            candidates[entry[0]] = entry
+    if isinstance(node, ONNXOp):
+        for entry in _impls_by_op.get(node.schema.name, ()):
+            candidates[entry[0]] = entry
 
     valid_impls = []
-    for impl, args in BackwardImplementation.extensions().items():
-        if "name" not in args:
-            raise ValueError(
-                f"Expected name in arguments of implementation {impl}.")
-
-        if "node_type" in args and isinstance(node, args["node_type"]) or (
-                isinstance(node, ONNXOp) and "op" in args
-                and node.schema.name == args["op"]):
-
-            if impl.backward_can_be_applied(node, forward_state, forward_sdfg):
-                valid_impls.append((args["name"], impl))
+    for _, name, impl in sorted(candidates.values(), key=lambda e: e[0]):
+        if impl.backward_can_be_applied(node, forward_state, forward_sdfg):
+            valid_impls.append((name, impl))
 
     if isinstance(node, ONNXOp) and node.backward_implementation:
 
@@ -1,9 +1,18 @@
-from dace.library import register_library, _DACE_REGISTERED_LIBRARIES
+from dace.library import register_library, register_node, _DACE_REGISTERED_LIBRARIES
 from .environments import ONNXRuntime, ONNXRuntimeCUDA
 from .nodes import *
+# the op classes are generated lazily, forward attribute accesses to onnx_op. __all__ is computed on access so that
+# star imports still export the op classes
+__getattr__ = nodes.onnx_op._make_module_getattr(__name__,
+                                                 globals(),
+                                                 lazy_all=True)
+__dir__ = nodes.onnx_op._make_module_dir(globals())
 from .schema import onnx_representation, ONNXAttributeType, ONNXAttribute, ONNXTypeConstraint, ONNXParameterType, ONNXSchema, ONNXParameter
 from .onnx_importer import ONNXModel
 from .backend import DaCeMLBackend, DaCeMLBackendRep
 
 register_library(__name__, "onnx")
+# register the op classes that were generated before the library was registered
+for _cls in filter(None, nodes.onnx_op._ONNX_OPS_BY_NAME.values()):
+    register_node(_cls, _DACE_REGISTERED_LIBRARIES["onnx"])
 _DACE_REGISTERED_LIBRARIES["onnx"].default_implementation = "pure"
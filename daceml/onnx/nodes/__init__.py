@@ -1,3 +1,7 @@
 from .onnx_op import *
+from . import onnx_op as _onnx_op
+# the op classes are generated lazily, forward attribute accesses to onnx_op
+__getattr__ = _onnx_op._make_module_getattr(__name__, globals())
+__dir__ = _onnx_op._make_module_dir(globals())
 # we don't want to export ONNXOp
 del globals()["ONNXOp"]
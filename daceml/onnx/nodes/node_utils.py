@@ -1,6 +1,9 @@
+import functools
+
 from daceml.onnx.schema import ONNXSchema, ONNXParameterType
 
 
+@functools.lru_cache(maxsize=4096)
 def parse_variadic_param(param):
     split = param.split('__')
     if len(split) != 2:
@@ -1,8 +1,8 @@
-import itertools
 import logging
 import collections
+import sys
 import types
-from typing import Iterator, Tuple, List, Dict, Type
+from typing import Any, Iterator, Tuple, List, Dict, Type, Optional, FrozenSet, Callable, Set
 
 import dace
 import dace.library
@@ -81,6 +81,58 @@ def get_missing_arguments_message(function_name, missing_arguments,
         arglist=arglist)
 
 
+def _get_idx(parameter_index: Dict[str, int],
+             name: str,
+             ignore_unknown=False) -> Optional[int]:
+    """ Get the position of the connector ``name`` in the schema, given a mapping from parameter names to indices. """
+    if '__' in name:
+        name, number = parse_variadic_param(name)
+    else:
+        number = 0
+
+    if name not in parameter_index:
+        if ignore_unknown:
+            return None
+        raise ValueError(
+            "Found 0 connectors with name '{}', expected to find exactly one".
+            format(name))
+
+    # add on the variadic parameter index
+    return parameter_index[name] + number
+
+
+def _make_sort_key(parameter_index: Dict[str, int], variadic: bool,
+                   inputs: bool) -> Callable[[MultiConnectorEdge], int]:
+    """ Create the key used to sort the in (or out) edges of an op in the order required by the schema.
+
+        :param parameter_index: the mapping from parameter names to indices.
+        :param variadic: whether the last parameter is variadic. If not, connector names are only parsed when
+                         they are not parameter names.
+        :param inputs: whether the key is for the in edges.
+    """
+    if variadic:
+        if inputs:
+
+            def key(edge):
+                return _get_idx(parameter_index, edge.dst_conn)
+        else:
+
+            def key(edge):
+                return _get_idx(parameter_index, edge.src_conn)
+    else:
+
+        def key(edge):
+            name = edge.dst_conn if inputs else edge.src_conn
+            try:
+                return parameter_index[name]
+            except KeyError:
+                # fall back to the same parsing as the ignore_unknown filter in iter_edges, so that every edge
+                # kept by the filter can be sorted
+                return _get_idx(parameter_index, name)
+
+    return key
+
+
 @make_properties
 class ONNXOp(nd.LibraryNode):
     """ Abstract superclass for all ONNX ops. Do not use this class, use the concrete subclasses
@@ -93,6 +145,21 @@ class ONNXOp(nd.LibraryNode):
     default_implementation = None
     default_backward_implementation = None
 
+    # schema-derived lookup tables, filled out when the op classes are generated
+    _input_index: Dict[str, int] = {}
+    _output_index: Dict[str, int] = {}
+    _input_names: Tuple[str, ...] = ()
+    _output_names: Tuple[str, ...] = ()
+    _last_input_variadic = False
+    _last_output_variadic = False
+    _required_inputs: FrozenSet[str] = frozenset()
+    _required_outputs: FrozenSet[str] = frozenset()
+    _known_inputs: FrozenSet[str] = frozenset()
+    _known_outputs: FrozenSet[str] = frozenset()
+    _variadic_inputs: FrozenSet[str] = frozenset()
+    _variadic_outputs: FrozenSet[str] = frozenset()
+    _required_attrs: FrozenSet[str] = frozenset()
+
     # Object fields
     schema = Property(dtype=ONNXSchema,
                       desc="The operator's ONNX OpSchema",
@@ -129,31 +196,37 @@ class ONNXOp(nd.LibraryNode):
             self,
             state: SDFGState,
             inputs: bool = False) -> List[MultiConnectorEdge]:
-        parameters = list(
-            self.schema.inputs if inputs else self.schema.outputs)
-        if len(parameters) == 0:
+        names = self._input_names if inputs else self._output_names
+        last_variadic = (self._last_input_variadic
+                         if inputs else self._last_output_variadic)
+        if len(names) == 0:
             return []
-        if parameters[-1].param_type == ONNXParameterType.Variadic:
-            name = parameters[-1].name
-            parameters = itertools.chain(
-                [param.name for param in parameters[:-1]],
-                (name + "__" + str(i) for i in itertools.count()))
-        else:
-            parameters = [param.name for param in parameters]
 
         edges = state.in_edges(self) if inputs else state.out_edges(self)
-        parameters = list(itertools.islice(parameters, len(edges)))
         conn_to_edge = {
             edge.dst_conn if inputs else edge.src_conn: edge
             for edge in edges
         }
 
-        return [conn_to_edge[name] for name in parameters]
+        if not last_variadic:
+            return [conn_to_edge[name] for name in names[:len(edges)]]
+
+        # the variadic parameter is last: it supplies the remaining edges
+        num_fixed = len(names) - 1
+        result = [
+            conn_to_edge[name] for name in names[:min(num_fixed, len(edges))]
+        ]
+        name = names[-1]
+        result.extend(conn_to_edge[name + "__" + str(i)]
+                      for i in range(len(edges) - num_fixed))
+        return result
 
     def iter_edges(
         self,
         state: SDFGState,
         ignore_unknown=False,
+        in_edges: Optional[List[MultiConnectorEdge]] = None,
+        out_edges: Optional[List[MultiConnectorEdge]] = None,
     ) -> Iterator[Tuple[MultiConnectorEdge, bool]]:
         """ Returns an iterator over tuples of an edge and a boolean that indicates whether that edge is an input,
             ordered by the order required by the schema.
@@ -162,53 +235,34 @@ class ONNXOp(nd.LibraryNode):
             :param state: the state containing this node.
             :param ignore_unknown: whether to ignore any edges that don't exist in the ONNX schema. Otherwise, an 
                                    error will be thrown.
+            :param in_edges: the in edges of this node, if already computed by the caller.
+            :param out_edges: the out edges of this node, if already computed by the caller.
         """
-        in_edges: List[MultiConnectorEdge] = state.in_edges(self)
-        out_edges: List[MultiConnectorEdge] = state.out_edges(self)
-
-        def get_idx(parameters, name):
-            if '__' in name:
-                name, number = parse_variadic_param(name)
-            else:
-                number = 0
-
-            matched = [
-                i for i, param in enumerate(parameters) if param.name == name
-            ]
-
-            if len(matched) != 1:
-                if ignore_unknown:
-                    return None
-                raise ValueError(
-                    "Found {} connectors with name '{}', expected to find exactly one"
-                    .format(len(matched), name))
-
-            parameter_idx = matched[0]
-
-            # add on the variadic parameter index
-            parameter_idx += number
-
-            return parameter_idx
+        if in_edges is None:
+            in_edges = state.in_edges(self)
+        if out_edges is None:
+            out_edges = state.out_edges(self)
 
         if ignore_unknown:
             in_edges = [
                 e for e in in_edges
-                if get_idx(self.schema.inputs, e.dst_conn) is not None
+                if _get_idx(self._input_index, e.dst_conn, ignore_unknown=True)
+                is not None
             ]
             out_edges = [
                 e for e in out_edges
-                if get_idx(self.schema.outputs, e.src_conn) is not None
+                if _get_idx(self._output_index,
+                            e.src_conn,
+                            ignore_unknown=True) is not None
             ]
 
-        sorted_in = sorted(
-            in_edges,
-            key=lambda edge: get_idx(self.schema.inputs, edge.dst_conn))
-        sorted_out = sorted(
-            out_edges,
-            key=lambda edge: get_idx(self.schema.outputs, edge.src_conn))
+        sorted_in = sorted(in_edges, key=self._in_key)
+        sorted_out = sorted(out_edges, key=self._out_key)
 
-        return itertools.chain(zip(sorted_in, itertools.repeat(True)),
-                               zip(sorted_out, itertools.repeat(False)))
+        for edge in sorted_in:
+            yield edge, True
+        for edge in sorted_out:
+            yield edge, False
 
     def validate(self, sdfg: SDFG, state: SDFGState):
         """ Validate this node.
@@ -216,148 +270,150 @@ class ONNXOp(nd.LibraryNode):
             :param sdfg: the parent sdfg.
             :param state: the parent state.
         """
+        # the generated op classes override this with a validator specialized to their schema
+        _make_validate(type(self))(self, sdfg, state)
+
+
+def _check_variadic_params(passed_params: Set[str],
+                           variadic_params: FrozenSet[str], kind: str):
+    """ Check that the passed variadic connectors belong to a variadic parameter, and that they are numbered
+        ``0, ..., n - 1``.
+
+        :param passed_params: the passed variadic connector names.
+        :param variadic_params: the names of the variadic parameters in the schema.
+        :param kind: either ``"inputs"`` or ``"outputs"``, used in error messages.
+    """
+    # bit i of seen_mask is set iff we have seen a connector with number i
+    seen_mask = 0
+    max_number = -1
+    for param in passed_params:
+        name, number = parse_variadic_param(param)
+        if name not in variadic_params:
+            raise ValueError(
+                "Got an unexpected variadic argument '{}'".format(param))
+        if seen_mask & (1 << number):
+            raise ValueError(
+                "Got two variadic {} with index {}, expected at most one".
+                format(kind, number))
+        seen_mask |= 1 << number
+        max_number = max(max_number, number)
+
+    # check that we have seen every number
+    if seen_mask != (1 << (max_number + 1)) - 1:
+        num_seen = bin(seen_mask).count("1")
+        # the lowest number we haven't seen
+        missing = (~seen_mask & (seen_mask + 1)).bit_length() - 1
+        raise ValueError(
+            "Since {} variadic {} were passed, expected variadic parameter with number {}"
+            .format(num_seen, kind, missing))
+
+
+def _make_validate(cls: Type[ONNXOp]):
+    """ Create a ``validate`` method specialized to the schema of ``cls``.
+
+        The schema-derived lookup tables of the class are bound as locals of the returned function.
+    """
+    schema = cls.schema
+    inputs = schema.inputs
+    outputs = schema.outputs
+    type_constraints = schema.type_constraints
+    input_index = cls._input_index
+    output_index = cls._output_index
+    required_inputs = cls._required_inputs
+    required_outputs = cls._required_outputs
+    known_inputs = cls._known_inputs
+    known_outputs = cls._known_outputs
+    variadic_inputs = cls._variadic_inputs
+    variadic_outputs = cls._variadic_outputs
+    required_attrs = cls._required_attrs
+
+    def validate(self, sdfg: SDFG, state: SDFGState):
         in_edges = state.in_edges(self)
         out_edges = state.out_edges(self)
 
+        in_conns = [edge.dst_conn for edge in in_edges]
+        out_conns = [edge.src_conn for edge in out_edges]
+
         # check that we don't have connectors to None
-        all_connectors = {edge.dst_conn
-                          for edge in in_edges}.union(edge.src_conn
-                                                      for edge in out_edges)
-        if None in all_connectors:
+        if None in in_conns or None in out_conns:
             raise ValueError("Edges to ONNX Ops must not have connector None")
 
+        # sort the connector names into single/optional and variadic ones
+        # (we will test variadic connectors separately)
+        passed_inputs = set()
+        passed_variadic_inputs = set()
+        for conn in in_conns:
+            if '__' in conn:
+                passed_variadic_inputs.add(conn)
+            else:
+                passed_inputs.add(conn)
+
+        passed_outputs = set()
+        passed_variadic_outputs = set()
+        for conn in out_conns:
+            if '__' in conn:
+                passed_variadic_outputs.add(conn)
+            else:
+                passed_outputs.add(conn)
+
         # check that all edges have connectors
         ##########################################
-        for edge, is_input in self.iter_edges(state):
-            if is_input:
-                conn_name = edge.dst_conn
-                if conn_name not in self.in_connectors:
-                    raise ValueError(
-                        "Memlet {} leading to nonexistent input connector '{}'"
-                        .format(edge.data, conn_name))
-            else:
-                conn_name = edge.src_conn
-                if conn_name not in self.out_connectors:
-                    raise ValueError(
-                        "Memlet {} leading to nonexistent output connector '{}'"
-                        .format(edge.data, conn_name))
+        # (this doesn't depend on the order of the edges, so there is no need to sort them)
+        for edge in in_edges:
+            if edge.dst_conn not in self.in_connectors:
+                raise ValueError(
+                    "Memlet {} leading to nonexistent input connector '{}'".
+                    format(edge.data, edge.dst_conn))
+        for edge in out_edges:
+            if edge.src_conn not in self.out_connectors:
+                raise ValueError(
+                    "Memlet {} leading to nonexistent output connector '{}'".
+                    format(edge.data, edge.src_conn))
 
         # check that we have all required in_edges
         ##########################################
-        required_inputs = {
-            inp.name
-            for inp in self.schema.inputs
-            if inp.param_type == ONNXParameterType.Single
-        }
-        passed_inputs = {
-            inp.dst_conn
-            for inp in in_edges if '__' not in inp.dst_conn
-        }  # we will test variadic inputs separately
-        known_inputs = {inp.name for inp in self.schema.inputs}
-
         missing_inputs = required_inputs.difference(passed_inputs)
         if len(missing_inputs) > 0:
             raise ValueError(
-                get_missing_arguments_message(self.schema.name, missing_inputs,
+                get_missing_arguments_message(schema.name, missing_inputs,
                                               "input"))
 
         # check that we have all required out_edges
         ##########################################
-        required_outputs = {
-            outp.name
-            for outp in self.schema.outputs
-            if outp.param_type == ONNXParameterType.Single
-        }
-        passed_outputs = {
-            outp.src_conn
-            for outp in out_edges if '__' not in outp.src_conn
-        }  # we will test variadic inputs separately
-        known_outputs = {outp.name for outp in self.schema.outputs}
-
         missing_outputs = required_outputs.difference(passed_outputs)
         if len(missing_outputs) > 0:
             raise ValueError(
-                get_missing_arguments_message(self.schema.name,
-                                              missing_outputs, "output"))
+                get_missing_arguments_message(schema.name, missing_outputs,
+                                              "output"))
 
         # check that we have no unknown in edges
         ##########################################
         unknown_inputs = passed_inputs.difference(known_inputs)
         if len(unknown_inputs) > 0:
             raise TypeError("Got an unexpected argument '{}'".format(
-                list(unknown_inputs)[0]))
+                next(iter(unknown_inputs))))
 
         # check that we have no unknown out edges
         ##########################################
         unknown_outputs = passed_outputs.difference(known_outputs)
         if len(unknown_outputs) > 0:
             raise TypeError("Got an unexpected argument '{}'".format(
-                list(unknown_outputs)[0]))
+                next(iter(unknown_outputs))))
 
         # check variadic params
         ##########################################
-        variadic_inputs = {
-            inp.name
-            for inp in self.schema.inputs
-            if inp.param_type == ONNXParameterType.Variadic
-        }
-        passed_variadic_inputs = {
-            edge.dst_conn
-            for edge in in_edges if '__' in edge.dst_conn
-        }
-
-        seen_variadic_numbers = set()
-        for param in passed_variadic_inputs:
-            name, number = parse_variadic_param(param)
-            if name not in variadic_inputs:
-                raise ValueError(
-                    "Got an unexpected variadic argument '{}'".format(param))
-            if number in seen_variadic_numbers:
-                raise ValueError(
-                    "Got two variadic inputs with index {}, expected at most one"
-                    .format(number))
-            seen_variadic_numbers.add(number)
-
-        # check that we have seen every number
-        for i in range(len(seen_variadic_numbers)):
-            if i not in seen_variadic_numbers:
-                raise ValueError(
-                    "Since {} variadic inputs were passed, expected variadic parameter with number {}"
-                    .format(len(seen_variadic_numbers), i))
-
-        variadic_outputs = {
-            outp.name
-            for outp in self.schema.outputs
-            if outp.param_type == ONNXParameterType.Variadic
-        }
-        passed_variadic_outputs = {
-            edge.src_conn
-            for edge in out_edges if '__' in edge.src_conn
-        }
-        seen_variadic_numbers = set()
-        for param in passed_variadic_outputs:
-            name, number = parse_variadic_param(param)
-            if name not in variadic_outputs:
-                raise ValueError(
-                    "Got an unexpected variadic argument '{}'".format(param))
-            if number in seen_variadic_numbers:
-                raise ValueError(
-                    "Got two variadic outputs with index {}, expected at most one"
-                    .format(number))
-            seen_variadic_numbers.add(number)
-
-        # check that we have seen every number
-        for i in range(len(seen_variadic_numbers)):
-            if i not in seen_variadic_numbers:
-                raise ValueError(
-                    "Since {} variadic outputs were passed, expected variadic parameter with number {}"
-                    .format(len(seen_variadic_numbers), i))
+        _check_variadic_params(passed_variadic_inputs, variadic_inputs,
+                               "inputs")
+        _check_variadic_params(passed_variadic_outputs, variadic_outputs,
+                               "outputs")
 
         # check that type params solve
         ##########################################
 
         assigned_params = {}
-        for edge, is_input in self.iter_edges(state):
+        for edge, is_input in self.iter_edges(state,
+                                              in_edges=in_edges,
+                                              out_edges=out_edges):
             conn_name = edge.dst_conn if is_input else edge.src_conn
 
             if '__' in conn_name:
@@ -365,18 +421,19 @@ class ONNXOp(nd.LibraryNode):
             else:
                 parsed_name = conn_name
 
-            matching = [
-                inp for inp in (
-                    self.schema.inputs if is_input else self.schema.outputs)
-                if inp.name == parsed_name
-            ]
+            if is_input:
+                parameters = inputs
+                parameter_index = input_index
+            else:
+                parameters = outputs
+                parameter_index = output_index
 
-            if len(matching) != 1:
+            try:
+                matched = parameters[parameter_index[parsed_name]]
+            except KeyError:
                 raise ValueError(
-                    "Expected to find one {} parameter in schema with name '{}', but found {}"
-                    .format("input" if is_input else "output", parsed_name,
-                            len(matching)))
-            matched = matching[0]
+                    "Expected to find one {} parameter in schema with name '{}', but found 0"
+                    .format("input" if is_input else "output", parsed_name))
 
             if '__' in conn_name and matched.param_type != ONNXParameterType.Variadic:
                 raise ValueError(
@@ -408,7 +465,7 @@ class ONNXOp(nd.LibraryNode):
                             actual=edge_dtype))
 
             # otherwise, matched.type_str was not assigned a type yet: try to assign it
-            cons = self.schema.type_constraints[matched.type_str]
+            cons = type_constraints[matched.type_str]
             if edge_dtype not in cons.types and edge_dtype.base_type not in cons.types:
                 raise ValueError(
                     "Expected type in '{possible}' for {param_type} '{conn_name}', got type '{actual}'"
@@ -420,16 +477,15 @@ class ONNXOp(nd.LibraryNode):
 
         # check that we have all required attributes
         ##########################################
-        required_attrs = {
-            name
-            for name, attr in dace_schema.attributes.items() if attr.required
-        }
         for attr in required_attrs:
             if getattr(self, attr) is None:
                 raise ValueError(
                     "Expected value for required attribute '{}', got None".
                     format(attr))
 
+    validate.__doc__ = ONNXOp.validate.__doc__
+    return validate
+
 
 def register_op_repo_replacement(cls: Type[ONNXOp], cls_name: str,
                                  dace_schema: ONNXSchema):
@@ -507,9 +563,58 @@ def _get_schemas_from_version(version: int):
     return all_schemas
 
 
-_ONNX_OPS_BY_NAME = {}
-# Generate all of the Op Nodes
-for schema in _get_schemas_from_version(12):
+class _ORTExpansion(ExpandTransformation):
+    """ Expands an ONNX op node using onnxruntime. """
+    environments = []
+
+    @classmethod
+    def expansion(cls, node, state: SDFGState, sdfg: SDFG):
+        result = expand_node(node, state, sdfg)
+
+        if not isinstance(result, SDFG):
+            # when we return an SDFG the the environments will be determined recursively by codegen.
+            cls.environments = map(dace.library.get_environment,
+                                   result.environments)
+        return result
+
+
+class _PureExpansion(ExpandTransformation):
+    """ Expands an ONNX op node using the ``ONNXForward`` implementation ``forward_impl``, falling back to
+        onnxruntime if it cannot be applied.
+    """
+    environments = []
+    forward_impl = None
+
+    @classmethod
+    def expansion(cls, node, state, sdfg, **kwargs):
+        # validate
+        node.validate(sdfg, state)
+
+        if cls.forward_impl.forward_can_be_applied(node, state, sdfg):
+            result = cls.forward_impl.forward(node, state, sdfg, **kwargs)
+            if hasattr(cls.forward_impl, "environments"):
+                cls.environments.extend(cls.forward_impl.environments)
+            return result
+        else:
+            # fall back to ORT
+            log.info(
+                'Falling back to onnxruntime expansion for library node "{}". '
+                'Reason: forward_can_be_applied returned False'.format(
+                    node.label))
+            result = expand_node(node, state, sdfg)
+            if not isinstance(result, SDFG):
+                # when we return an SDFG the the environments will be determined recursively by codegen.
+                cls.environments = map(dace.library.get_environment,
+                                       result.environments)
+            return result
+
+
+def _build_onnx_op_class(schema: onnx.defs.OpSchema) -> Optional[Type[ONNXOp]]:
+    """ Generate the op node class for an ONNX schema.
+
+        :param schema: the ONNX schema.
+        :return: the generated class, or ``None`` if the schema is not supported.
+    """
     try:
         dace_schema = ONNXSchema.from_onnx_proto(schema)
         # if the schema has a parameter name that exists as both an input and an output, prepend "in_" and "out_"
@@ -520,12 +625,12 @@ for schema in _get_schemas_from_version(12):
             in_cands = [i for i in dace_schema.inputs if i.name == name]
             out_cands = [i for i in dace_schema.outputs if i.name == name]
             assert len(in_cands) == len(out_cands) == 1
-            in_cands[0].name = "in_" + name
-            out_cands[0].name = "out_" + name
+            in_cands[0].name = sys.intern("in_" + name)
+            out_cands[0].name = sys.intern("out_" + name)
 
     except Exception as e:
         log.debug("Import of {} failed: {}".format(schema.name, e))
-        continue
+        return None
 
     attrs = {}
     # add properties for each op attribute
@@ -565,16 +670,8 @@ for schema in _get_schemas_from_version(12):
             name,
             location=location,
             # add required parameters as in/out connectors, without types for now
-            inputs={
-                inp.name
-                for inp in self.schema.inputs
-                if inp.param_type == ONNXParameterType.Single
-            },
-            outputs={
-                out.name
-                for out in self.schema.outputs
-                if out.param_type == ONNXParameterType.Single
-            })
+            inputs=set(self._required_inputs),
+            outputs=set(self._required_outputs))
         self.backward_implementation = None
 
         if len(args) > 0:
@@ -582,7 +679,7 @@ for schema in _get_schemas_from_version(12):
                 "__init__() takes 1 positional arguments but {} were given".
                 format(1 + len(args)))
 
-        missing_arguments = required_attrs.difference(op_attributes)
+        missing_arguments = self._required_attrs.difference(op_attributes)
         if len(missing_arguments) > 0:
 
             raise TypeError(
@@ -593,8 +690,7 @@ for schema in _get_schemas_from_version(12):
         if len(unknown_attrs) > 0:
             raise TypeError(
                 "{}.__init__() got an unexpected keyword argument '{}'".format(
-                    self.schema.name,
-                    list(unknown_attrs)[0]))
+                    self.schema.name, next(iter(unknown_attrs))))
 
         for name, attr in op_attributes.items():
             setattr(self, name, attr)
@@ -630,30 +726,63 @@ for schema in _get_schemas_from_version(12):
     attrs['__doc__'] = docstring + "\n"
     attrs['schema'] = dace_schema
 
+    # the schema is fixed for each class: precompute the lookup tables used when iterating over edges
+    attrs['_input_index'] = {
+        param.name: i
+        for i, param in enumerate(dace_schema.inputs)
+    }
+    attrs['_output_index'] = {
+        param.name: i
+        for i, param in enumerate(dace_schema.outputs)
+    }
+    attrs['_input_names'] = tuple(param.name for param in dace_schema.inputs)
+    attrs['_output_names'] = tuple(param.name for param in dace_schema.outputs)
+    attrs['_last_input_variadic'] = (len(dace_schema.inputs) > 0
+                                     and dace_schema.inputs[-1].param_type
+                                     == ONNXParameterType.Variadic)
+    attrs['_last_output_variadic'] = (len(dace_schema.outputs) > 0
+                                      and dace_schema.outputs[-1].param_type
+                                      == ONNXParameterType.Variadic)
+    attrs['_in_key'] = staticmethod(
+        _make_sort_key(attrs['_input_index'],
+                       attrs['_last_input_variadic'],
+                       inputs=True))
+    attrs['_out_key'] = staticmethod(
+        _make_sort_key(attrs['_output_index'],
+                       attrs['_last_output_variadic'],
+                       inputs=False))
+    attrs['_required_inputs'] = frozenset(
+        inp.name for inp in dace_schema.inputs
+        if inp.param_type == ONNXParameterType.Single)
+    attrs['_required_outputs'] = frozenset(
+        outp.name for outp in dace_schema.outputs
+        if outp.param_type == ONNXParameterType.Single)
+    attrs['_known_inputs'] = frozenset(inp.name for inp in dace_schema.inputs)
+    attrs['_known_outputs'] = frozenset(outp.name
+                                        for outp in dace_schema.outputs)
+    attrs['_variadic_inputs'] = frozenset(
+        inp.name for inp in dace_schema.inputs
+        if inp.param_type == ONNXParameterType.Variadic)
+    attrs['_variadic_outputs'] = frozenset(
+        outp.name for outp in dace_schema.outputs
+        if outp.param_type == ONNXParameterType.Variadic)
+    attrs['_required_attrs'] = frozenset(required_attrs)
+
     attrs['__init__'] = __init__
 
     cls = type(cls_name, (ONNXOp, ), attrs)
+    cls.validate = _make_validate(cls)
     cls = dace.library.node(cls)
     cls.__init__.__doc__ = "\n" + init_docstring
 
     # Register ORT implementation
     ##########################################
 
-    @dace.library.expansion
-    class Expansion(ExpandTransformation):
-        environments = []
-
-        @classmethod
-        def expansion(cls, node, state: SDFGState, sdfg: SDFG):
-            result = expand_node(node, state, sdfg)
-
-            if not isinstance(result, SDFG):
-                # when we return an SDFG the the environments will be determined recursively by codegen.
-                cls.environments = map(dace.library.get_environment,
-                                       result.environments)
-            return result
-
-    cls.register_implementation('onnxruntime', Expansion)
+    # dace ties each expansion class to a single library node, so every op
+    # gets its own (empty) subclass of the shared expansion
+    ort_expansion = dace.library.expansion(
+        type("Expansion", (_ORTExpansion, ), {"environments": []}))
+    cls.register_implementation('onnxruntime', ort_expansion)
 
     # Register pure implementations
     ##########################################
@@ -664,40 +793,12 @@ for schema in _get_schemas_from_version(12):
     registered = False
     for impl, args in ONNXForward.extensions().items():
         if "op" in args and args["op"] == schema.name:
-
-            class Expansion(ExpandTransformation):
-                environments = []
-                forward_impl: ONNXForward = impl
-
-                @classmethod
-                def expansion(cls, node, state, sdfg, **kwargs):
-                    # validate
-                    node.validate(sdfg, state)
-
-                    if cls.forward_impl.forward_can_be_applied(
-                            node, state, sdfg):
-                        result = cls.forward_impl.forward(
-                            node, state, sdfg, **kwargs)
-                        if hasattr(cls.forward_impl, "environments"):
-                            cls.environments.extend(
-                                cls.forward_impl.environments)
-                        return result
-                    else:
-                        # fall back to ORT
-                        log.info(
-                            'Falling back to onnxruntime expansion for library node "{}". '
-                            'Reason: forward_can_be_applied returned False'.
-                            format(node.label))
-                        result = expand_node(node, state, sdfg)
-                        if not isinstance(result, SDFG):
-                            # when we return an SDFG the the environments will be determined recursively by codegen.
-                            cls.environments = map(
-                                dace.library.get_environment,
-                                result.environments)
-                        return result
-
+            pure_expansion = type("Expansion", (_PureExpansion, ), {
+                "environments": [],
+                "forward_impl": impl
+            })
             implementation_name = args["name"]
-            cls.register_implementation(implementation_name, Expansion)
+            cls.register_implementation(implementation_name, pure_expansion)
             registered = True
 
     if not registered:
@@ -707,10 +808,94 @@ for schema in _get_schemas_from_version(12):
     #######################################
     register_op_repo_replacement(cls, cls_name, dace_schema)
 
-    globals()[cls_name] = cls
-    _ONNX_OPS_BY_NAME[cls_name] = cls
+    # register the node with the onnx library. If the library hasn't been registered yet, this happens when it is
+    # (see daceml/onnx/__init__.py)
+    if "onnx" in dace.library._DACE_REGISTERED_LIBRARIES:
+        dace.library.register_node(
+            cls, dace.library._DACE_REGISTERED_LIBRARIES["onnx"])
+
+    return cls
+
+
+_ONNX_SCHEMAS_BY_NAME = {
+    schema.name: schema
+    for schema in _get_schemas_from_version(12)
+}
+
+# the generated op nodes, by class name. Since most programs only use a handful of ops, the classes are generated
+# lazily when first accessed. Unsupported ops map to None.
+_ONNX_OPS_BY_NAME: Dict[str, Optional[Type[ONNXOp]]] = {}
+
+
+def _get_onnx_op_class(cls_name: str) -> Optional[Type[ONNXOp]]:
+    """ Get the op node class with name ``cls_name``, generating it if necessary.
+
+        :param cls_name: the class name, e.g. ``"ONNXConv"``.
+        :return: the class, or ``None`` if there is no supported ONNX op with that name.
+    """
+    if cls_name not in _ONNX_OPS_BY_NAME:
+        if not cls_name.startswith(
+                "ONNX") or cls_name[4:] not in _ONNX_SCHEMAS_BY_NAME:
+            return None
+
+        cls = _build_onnx_op_class(_ONNX_SCHEMAS_BY_NAME[cls_name[4:]])
+        _ONNX_OPS_BY_NAME[cls_name] = cls
+        if cls is not None:
+            globals()[cls_name] = cls
+
+    return _ONNX_OPS_BY_NAME[cls_name]
+
+
+def _supported_onnx_op_class_names() -> List[str]:
+    """ Generate all op classes, and return the names of the supported ones. """
+    return [
+        "ONNX" + name for name in _ONNX_SCHEMAS_BY_NAME
+        if _get_onnx_op_class("ONNX" + name) is not None
+    ]
+
+
+def _make_module_getattr(module_name: str,
+                         module_globals: Dict[str, Any],
+                         lazy_all: bool = False) -> Callable[[str], Any]:
+    """ Create a module-level ``__getattr__`` (see PEP 562) that generates the op classes on first access. This
+        is used by this module and by the packages that re-export the op classes.
+
+        :param module_name: the name of the module the function is for, used in error messages.
+        :param module_globals: the globals of that module.
+        :param lazy_all: whether to also provide ``__all__``, so that ``from module import *`` exports the op
+                         classes. Computing it generates all of them.
+    """
+    def module_getattr(name: str):
+        if lazy_all and name == "__all__":
+            return sorted(
+                set(n for n in module_globals if not n.startswith("_")).union(
+                    _supported_onnx_op_class_names()))
+
+        cls = _get_onnx_op_class(name)
+        if cls is None:
+            raise AttributeError("module '{}' has no attribute '{}'".format(
+                module_name, name))
+        return cls
+
+    return module_getattr
+
+
+def _make_module_dir(
+        module_globals: Dict[str, Any]) -> Callable[[], List[str]]:
+    """ Create a module-level ``__dir__`` that lists the supported op classes in addition to the globals of the
+        module. Calling it generates all op classes.
+
+        :param module_globals: the globals of the module.
+    """
+    def module_dir() -> List[str]:
+        return sorted(
+            set(module_globals).union(_supported_onnx_op_class_names()))
+
+    return module_dir
+
 
-del cls
+__getattr__ = _make_module_getattr(__name__, globals())
+__dir__ = _make_module_dir(globals())
 
 
 def has_onnx_node(name: str) -> bool:
@@ -718,7 +903,7 @@ def has_onnx_node(name: str) -> bool:
 
         :param name: the operator name.
     """
-    return ("ONNX" + name) in _ONNX_OPS_BY_NAME
+    return _get_onnx_op_class("ONNX" + name) is not None
 
 
 def get_onnx_node(name: str) -> ONNXOp:
@@ -726,4 +911,7 @@ def get_onnx_node(name: str) -> ONNXOp:
 
         :param name: the operator name
     """
-    return _ONNX_OPS_BY_NAME["ONNX" + name]
+    cls = _get_onnx_op_class("ONNX" + name)
+    if cls is None:
+        raise KeyError("ONNX" + name)
+    return cls
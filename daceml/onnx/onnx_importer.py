@@ -1,5 +1,6 @@
 import collections
 import logging
+import sys
 from itertools import chain, repeat
 from typing import Dict, Union, Tuple, Any, List, Optional, OrderedDict, Callable
 import copy
@@ -272,13 +273,13 @@ class ONNXModel:
                             .format(i_or_o="input" if is_input else "output",
                                     param_idx=param_idx,
                                     params_len=params_len))
-                    conn_name = params[-1].name + "__" + str(param_idx -
-                                                             params_len + 1)
+                    conn_name = sys.intern(params[-1].name + "__" +
+                                           str(param_idx - params_len + 1))
                 elif params[
                         param_idx].param_type == ONNXParameterType.Variadic:
                     # this is a variadic parameter, and it is within the range of params, so it must be the first
                     # instance of a variadic parameter
-                    conn_name = params[param_idx].name + "__0"
+                    conn_name = sys.intern(params[param_idx].name + "__0")
                 else:
                     conn_name = params[param_idx].name
 
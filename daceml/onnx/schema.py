@@ -1,4 +1,5 @@
 import logging
+import sys
 from itertools import chain
 from typing import List
 
@@ -140,10 +141,12 @@ class ONNXParameterType(aenum.AutoNumberEnum):
     Variadic = ()  #: variadic parameters
 
 
-@onnx_representation(onnx.defs.OpSchema.FormalParameter,
-                     type_str='typeStr',
-                     param_type='option',
-                     homogeneous="isHomogeneous")
+@onnx_representation(
+    onnx.defs.OpSchema.FormalParameter,
+    name=lambda proto: sys.intern(get_proto_attr(proto, "name")),
+    type_str='typeStr',
+    param_type='option',
+    homogeneous="isHomogeneous")
 class ONNXParameter:
     """ Python representation of an ONNX parameter. """
 
@@ -235,7 +238,7 @@ class ONNXTypeConstraint:
     outputs=lambda proto: list(
         map(convert_onnx_proto, get_proto_attr(proto, "outputs"))),
     attributes=lambda proto: {
-        str(k): convert_onnx_proto(v)
+        sys.intern(str(k)): convert_onnx_proto(v)
         for k, v in get_proto_attr(proto, "attributes").items()
     },
     type_constraints=lambda proto: {
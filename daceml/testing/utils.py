@@ -58,6 +58,13 @@ def torch_tensors_close(name, torch_v, dace_v, rtol=1e-5, atol=1e-4):
     # check that the device is correct
     assert torch_v.device == dace_v.device, "Tensors are on different devices"
 
+    # compare on the tensors directly, only converting to numpy to build the error message. torch.allclose
+    # broadcasts, so the shapes are checked first
+    if (torch_v.shape == dace_v.shape and torch_v.dtype == dace_v.dtype
+            and torch.allclose(
+                torch_v.detach(), dace_v.detach(), rtol=rtol, atol=atol)):
+        return
+
     torch_v = torch_v.detach().cpu().numpy()
     dace_v = dace_v.detach().cpu().numpy()
     np.testing.assert_allclose(torch_v,
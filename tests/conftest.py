@@ -21,6 +21,9 @@ def pytest_addoption(parser):
     parser.addoption("--skip-ort",
                      action="store_true",
                      help="Disable all tests that use ONNX Runtime.")
+    parser.addoption("--runslow",
+                     action="store_true",
+                     help="Run tests marked as slow.")
 
 
 def pytest_runtest_setup(item):
@@ -52,6 +55,11 @@ def pytest_runtest_setup(item):
         if item.config.getoption("--skip-ort"):
             pytest.skip('Skipping test since --skip-ort was passed')
 
+    # if @pytest.mark.slow is applied skip the test unless --runslow is passed
+    if "slow" in map(getname, item.iter_markers()):
+        if not item.config.getoption("--runslow"):
+            pytest.skip('Skipping test since --runslow was not passed')
+
 
 def pytest_generate_tests(metafunc):
     """
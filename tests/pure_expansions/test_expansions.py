@@ -92,8 +92,9 @@ def test_cast_int_to_float(sdfg_name):
     access_X = state.add_access("X")
     access_result = state.add_access("__return")
 
-    op_node = donnx.ONNXCast("Cast")
-    op_node.to = converters.typeclass_to_onnx_tensor_type_int(dace.float32)
+    op_node = donnx.ONNXCast("Cast",
+                             to=converters.typeclass_to_onnx_tensor_type_int(
+                                 dace.float32))
 
     state.add_node(op_node)
     state.add_edge(access_X, None, op_node, "input",
@@ -126,8 +127,9 @@ def test_cast_float_to_int(sdfg_name):
     access_X = state.add_access("X")
     access_result = state.add_access("__return")
 
-    op_node = donnx.ONNXCast("Cast")
-    op_node.to = converters.typeclass_to_onnx_tensor_type_int(dace.int32)
+    op_node = donnx.ONNXCast("Cast",
+                             to=converters.typeclass_to_onnx_tensor_type_int(
+                                 dace.int32))
 
     state.add_node(op_node)
     state.add_edge(access_X, None, op_node, "input",
@@ -160,8 +162,9 @@ def test_cast_float_to_long(sdfg_name):
     access_X = state.add_access("X")
     access_result = state.add_access("__return")
 
-    op_node = donnx.ONNXCast("Cast")
-    op_node.to = converters.typeclass_to_onnx_tensor_type_int(dace.int64)
+    op_node = donnx.ONNXCast("Cast",
+                             to=converters.typeclass_to_onnx_tensor_type_int(
+                                 dace.int64))
 
     state.add_node(op_node)
     state.add_edge(access_X, None, op_node, "input",
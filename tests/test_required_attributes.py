@@ -0,0 +1,22 @@
+import pytest
+
+import dace
+import daceml.onnx as donnx
+from daceml.onnx import converters
+
+
+def test_missing_required_attribute():
+    with pytest.raises(TypeError) as info:
+        donnx.ONNXCast("c")
+    assert "'to'" in str(info.value)
+
+
+def test_required_attributes_per_op():
+    assert donnx.ONNXCast._required_attrs == {"to"}
+    assert donnx.ONNXRelu._required_attrs == frozenset()
+
+    # each op only checks its own required attributes
+    donnx.ONNXRelu("r")
+    donnx.ONNXCast("c",
+                   to=converters.typeclass_to_onnx_tensor_type_int(
+                       dace.float32))
@@ -1,3 +1,5 @@
+import copy
+
 import pytest
 import numpy as np
 import torch
@@ -8,16 +10,48 @@ from daceml.testing import copy_to_gpu, torch_tensors_close
 from daceml.transformation import parameter_to_transient
 
 
-@pytest.mark.cpublas
-def test_bert_encoder(gpu, default_implementation, sdfg_name):
-    batch_size = 8
-    seq_len = 512
-    hidden_size = 768
+def make_bert_ref(config, batch_size, seq_len):
+    """ Build a BertLayer, its input and the PyTorch reference output on the CPU. """
+    torch.manual_seed(0)
+    input = torch.randn([batch_size, seq_len, config.hidden_size])
+
+    ptmodel = BertLayer(config).eval()
+    with torch.no_grad():
+        pt_outputs = ptmodel(input)
+    return ptmodel, input, pt_outputs[0]
+
+
+@pytest.fixture(scope="module")
+def bert_ref():
+    """ The reference for the BERT-base layer, shared across the parametrizations. """
+    return make_bert_ref(BertConfig(), batch_size=2, seq_len=512)
 
-    input = copy_to_gpu(gpu, torch.randn([batch_size, seq_len, hidden_size]))
 
-    ptmodel = copy_to_gpu(gpu, BertLayer(BertConfig()).eval())
-    pt_outputs = ptmodel(input.clone())
+@pytest.fixture(scope="module")
+def full_batch_bert_ref():
+    """ The reference for the BERT-base layer at the full batch size, shared across the parametrizations. """
+    return make_bert_ref(BertConfig(), batch_size=8, seq_len=512)
+
+
+@pytest.fixture(scope="module")
+def small_bert_ref():
+    """ The reference for a tiny layer that still goes through the whole pipeline, shared across the
+        parametrizations.
+    """
+    config = BertConfig(hidden_size=16,
+                        num_attention_heads=2,
+                        intermediate_size=32)
+    return make_bert_ref(config, batch_size=2, seq_len=64)
+
+
+def check_bert_encoder(ref, gpu, default_implementation, sdfg_name):
+    ptmodel, input, pt_output = ref
+
+    input = copy_to_gpu(gpu, input)
+    pt_output = copy_to_gpu(gpu, pt_output)
+    if gpu:
+        # moving a module to the gpu is in-place, so leave the shared one untouched
+        ptmodel = copy.deepcopy(ptmodel).cuda()
 
     dace_model = DaceModule(ptmodel,
                             training=False,
@@ -32,8 +66,8 @@ def test_bert_encoder(gpu, default_implementation, sdfg_name):
 
         dace_model.append_post_onnx_hook("param_to_transient", param_to_trans)
 
-    dace_outputs0 = dace_model(input.clone())
-    torch_tensors_close("output", pt_outputs[0], dace_outputs0)
+    dace_outputs0 = dace_model(input)
+    torch_tensors_close("output", pt_output, dace_outputs0)
 
     if default_implementation == "pure":
         ort_nodes = [
@@ -50,3 +84,22 @@ def test_bert_encoder(gpu, default_implementation, sdfg_name):
                 (hasattr(n, "environments") and "cuBLAS" in n.environments or
                  hasattr(n, "implementation") and n.implementation == "cuBLAS")
                 for n, _ in dace_model.sdfg.all_nodes_recursive())
+
+
+def test_bert_encoder_smoke(small_bert_ref, gpu, default_implementation,
+                            sdfg_name):
+    check_bert_encoder(small_bert_ref, gpu, default_implementation, sdfg_name)
+
+
+@pytest.mark.slow
+@pytest.mark.cpublas
+def test_bert_encoder(bert_ref, gpu, default_implementation, sdfg_name):
+    check_bert_encoder(bert_ref, gpu, default_implementation, sdfg_name)
+
+
+@pytest.mark.slow
+@pytest.mark.cpublas
+def test_bert_encoder_full_batch(full_batch_bert_ref, gpu,
+                                 default_implementation, sdfg_name):
+    check_bert_encoder(full_batch_bert_ref, gpu, default_implementation,
+                       sdfg_name)